@@ -0,0 +1,46 @@
+from fastapi import APIRouter, HTTPException, Depends, Response, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.lead import LeadInput
+from app.models.job import AnalysisJob, AnalysisJobRead, JobStatus
+from app.services.jobs import job_queue
+from app.db.database import get_async_session
+from app.config import settings
+import asyncio
+import time
+
+router = APIRouter()
+
+FINISHED_STATUSES = {JobStatus.SUCCEEDED.value, JobStatus.FAILED.value}
+
+@router.post("/analyze/jobs", response_model=AnalysisJobRead, status_code=202)
+async def create_analysis_job(lead_input: LeadInput, response: Response, session: AsyncSession = Depends(get_async_session)):
+    """
+    Queues a lead for analysis and returns immediately with a job id.
+    A `python -m app.worker` process picks it up.
+    """
+    job = await session.run_sync(lambda sync_session: job_queue.enqueue(sync_session, lead_input))
+    response.headers["Location"] = f"/api/v1/analyze/jobs/{job.id}"
+    return job_queue.to_read(job)
+
+@router.get("/analyze/jobs/{job_id}", response_model=AnalysisJobRead)
+async def get_analysis_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to long-poll for the job to finish."),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Returns the job status, and the AnalyzedLead once it has succeeded.
+    With `wait`, the request is held open until the job finishes or the wait elapses.
+    """
+    deadline = time.monotonic() + min(wait, settings.job_max_wait_seconds)
+    while True:
+        # populate_existing: re-read the row so each poll sees the worker's update
+        job = await session.get(AnalysisJob, job_id, populate_existing=True)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job.status in FINISHED_STATUSES or time.monotonic() >= deadline:
+            return job_queue.to_read(job)
+
+        # End the read transaction so the connection goes back to the pool while we wait
+        await session.rollback()
+        await asyncio.sleep(settings.job_poll_interval)
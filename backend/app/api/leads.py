@@ -1,152 +1,154 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional, Literal
 from datetime import datetime
-from app.models.lead import LeadInput, AnalyzedLead, Lead, BANTAnalysis, EnrichmentData, LeadScore, RoutingDecision
-from app.services.enrichment import enrichment_service
-from app.services.ai_scoring import ai_scoring_service
-from app.services.routing import routing_service
-from app.services.verification import verification_service
-from app.utils.webhook_client import send_webhook
-from app.db.database import get_session
-
-from sqlmodel import Session, select
-from typing import List
-from app.db.database import get_session
+import asyncio
+import json
+from app.models.lead import LeadInput, AnalyzedLead, Lead, LeadSummary, LeadSearchResults
+from app.services.pipeline import lead_pipeline, InvalidLeadError
+from app.services.bulk_import import bulk_importer, iter_rows, ImportFormat
+from app.services.lead_stats import lead_stats_service
+from app.services.settings_cache import settings_cache
+from app.services.lead_query import lead_query_service, LeadFilters, InvalidCursorError
+from app.services.lead_search import lead_search_service
+from app.services.lead_export import lead_exporter, ExportFormat, ExportUnavailableError
+from app.services.webhook_outbox import webhook_outbox
+from app.config import settings
+from app.utils.metrics import pipeline_stage_seconds
+from app.db.database import get_async_session
 
 router = APIRouter()
 
 @router.get("/stats")
-async def get_stats(session: Session = Depends(get_session)):
+async def get_stats(
+    live: bool = Query(False, description="Aggregate the lead table directly instead of the daily rollup."),
+    session: AsyncSession = Depends(get_async_session),
+):
     """
     Returns dashboard statistics: total leads, qualified leads, avg score.
+    Served from the incrementally maintained daily rollup, so the cost does not grow with the lead table.
     """
-    leads = session.exec(select(Lead)).all()
-    total = len(leads)
-    qualified = len([l for l in leads if l.category == "Hot"])
-    avg_score = sum([l.score for l in leads]) / total if total > 0 else 0
-    
-    # Real "New Leads Today" calculation
-    today = datetime.utcnow().date()
-    new_today = len([l for l in leads if l.created_at and l.created_at.date() == today]) 
-
-    # Chart data: Leads by Category
-    categories = {"Hot": 0, "Warm": 0, "Cold": 0}
-    for l in leads:
-        if l.category in categories:
-            categories[l.category] += 1
-        else:
-            # Handle standard "Warm" or others if logic changes
-            categories["Warm"] += 1
-
-    chart_data = [
-        {"name": "Hot", "leads": categories["Hot"]},
-        {"name": "Warm", "leads": categories["Warm"]},
-        {"name": "Cold", "leads": categories["Cold"]},
-    ]
-
-    return {
-        "total_leads": total,
-        "qualified_leads": qualified,
-        "avg_score": round(avg_score, 1),
-        "new_leads_today": new_today,
-        "leads_by_category": chart_data
-    }
-
-@router.get("/", response_model=List[Lead])
-async def get_leads(session: Session = Depends(get_session)):
+    return await session.run_sync(lambda sync_session: lead_stats_service.get_stats(sync_session, live=live))
+
+@router.get("/", response_model=None, responses={200: {"model": List[Lead]}})
+async def get_leads(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, description="Page size (defaults to LEADS_PAGE_SIZE, capped at LEADS_MAX_PAGE_SIZE)."),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page."),
+    view: Literal["full", "summary"] = Query("full", description="'summary' omits notes, analyses and JSON blobs."),
+    category: Optional[str] = None,
+    queue: Optional[str] = None,
+    verification_status: Optional[str] = None,
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    max_score: Optional[int] = Query(None, ge=0, le=100),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    risk_flag: List[str] = Query([], description="Only leads carrying every given risk flag (repeatable), e.g. 'Industry Mismatch'."),
+    industry: Optional[str] = Query(None, description="Exact match on company_info.industry."),
+    min_company_size: Optional[int] = Query(None, ge=0, description="Lower bound of the enriched employee count, e.g. 1000 for '1000+'."),
+    session: AsyncSession = Depends(get_async_session),
+):
     """
-    Fetch all leads from the database.
+    Fetch leads, newest first, one keyset-paginated page at a time.
+    The cursor for the next page is returned in the X-Next-Cursor and Link headers; both are absent on the last page.
     """
-    return session.exec(select(Lead)).all()
-
-from app.models.settings import Settings
+    page_size = min(limit or settings.leads_page_size, settings.leads_max_page_size)
+    filters = LeadFilters(
+        category=category,
+        queue=queue,
+        verification_status=verification_status,
+        min_score=min_score,
+        max_score=max_score,
+        created_after=created_after,
+        created_before=created_before,
+        risk_flags=risk_flag,
+        industry=industry,
+        min_company_size=min_company_size,
+    )
+    try:
+        page, next_cursor = await session.run_sync(
+            lambda sync_session: lead_query_service.list_leads(
+                sync_session, filters, page_size, cursor=cursor, summary=(view == "summary")
+            )
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    return page
+
+
+@router.get("/leads/search", response_model=LeadSearchResults)
+async def search_leads(
+    q: str = Query(..., min_length=1, description="Words to find in notes, need analysis and explanation (web search syntax: quotes, OR, -word)."),
+    limit: int = Query(20, ge=1),
+    offset: int = Query(0, ge=0),
+    category: Optional[str] = None,
+    queue: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Full-text search over leads, best match first, with highlighted snippets per matching field.
+    Page through results with `offset`; `next_offset` is null on the last page.
+    """
+    page_size = min(limit, settings.leads_max_page_size)
+    filters = LeadFilters(category=category, queue=queue)
+    return await session.run_sync(
+        lambda sync_session: lead_search_service.search(sync_session, q, filters, page_size, offset)
+    )
+
+@router.get("/leads/export")
+async def export_leads(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    since: Optional[datetime] = Query(None, description="Only leads created after this watermark (the X-Export-Watermark of the previous export)."),
+    batch_size: int = Query(settings.export_batch_size, ge=1, le=50000, description="Rows per cursor fetch (and per Parquet row group)."),
+):
+    """
+    Streams leads oldest first as CSV, NDJSON or Parquet straight from a server-side cursor.
+    X-Export-Watermark is the newest created_at included; pass it as `since` next time.
+    """
+    try:
+        lead_exporter.check_available(format)
+    except ExportUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    until = await asyncio.to_thread(lead_exporter.watermark)
+    headers = {"Content-Disposition": f'attachment; filename="leads.{format.value}"'}
+    watermark = until if until and (since is None or until > since) else since
+    if watermark:
+        headers["X-Export-Watermark"] = watermark.isoformat()
+    # A sync iterator: Starlette pulls it from a worker thread, so the cursor never blocks the event loop
+    return StreamingResponse(lead_exporter.stream(format, since, until, batch_size), media_type=format.media_type, headers=headers)
 
 @router.post("/analyze", response_model=AnalyzedLead)
-async def analyze_lead(lead_input: LeadInput, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
+async def analyze_lead(lead_input: LeadInput, session: AsyncSession = Depends(get_async_session)):
     """
     Receives lead data, enriches it, scores it using AI, determines routing, and SAVES to DB.
     """
     try:
-        # 0. Check Settings
-        settings_db = session.exec(select(Settings)).first()
-        enrichment_enabled = settings_db.enrichment_enabled if settings_db else True
-
-        # 1. Enrich lead data
-        if enrichment_enabled:
-            enrichment_data = enrichment_service.enrich_lead(lead_input.company_name, lead_input.email)
-        else:
-            # Create empty enrichment data if disabled
-            enrichment_data = EnrichmentData(
-                company_info=None,
-                email_valid=True # Assume valid if we skip verification to not block the flow
-            )
-        
-        if not enrichment_data.email_valid:
-            raise HTTPException(status_code=400, detail="Invalid email address provided.")
-
-        # 2. Verify Lead (Agentic Verification)
-        verification_result = verification_service.verify_lead(lead_input, enrichment_data)
-
-        # 3. Score the lead using AI (now aware of verification)
-        bant_analysis, lead_score = ai_scoring_service.score_lead(lead_input, enrichment_data, verification_result)
-
-        # 4. Determine routing
-        routing_decision = routing_service.route_lead(lead_score)
-        
-        # 5. Save to Database
-        db_lead = Lead(
-            first_name=lead_input.first_name,
-            last_name=lead_input.last_name,
-            email=lead_input.email,
-            company_name=lead_input.company_name,
-            notes=lead_input.notes,
-            email_valid=enrichment_data.email_valid,
-            company_info=enrichment_data.company_info,
-            company_logo_url=enrichment_data.company_logo_url,
-            profile_image_url=enrichment_data.profile_image_url,
-            budget_analysis=bant_analysis.budget,
-            authority_analysis=bant_analysis.authority,
-            need_analysis=bant_analysis.need,
-            timeline_analysis=bant_analysis.timeline,
-            score=lead_score.score,
-            category=lead_score.category,
-            explanation=lead_score.explanation,
-            # New Verification Fields
-            verification_status=verification_result.status.value,
-            verification_score=verification_result.score,
-            authority_tier=verification_result.authority_tier.value,
-            identity_verified=verification_result.identity_verified,
-            employment_verified=verification_result.employment_verified,
-            verification_reason=verification_result.reason,
-            intent_signal=verification_result.intent_signal,
-            intent_evidence=verification_result.intent_evidence,
-            score_breakdown=lead_score.score_breakdown,
-            risk_flags=lead_score.risk_flags,
-            follow_up_questions=lead_score.follow_up_questions,
-            queue=routing_decision.queue,
-            routing_reason=routing_decision.reason
-        )
-        session.add(db_lead)
-        session.commit()
-        session.refresh(db_lead)
-
-        # 5. Combine and return the full analysis
-        analyzed_lead = AnalyzedLead(
-            lead_input=lead_input,
-            bant_analysis=bant_analysis,
-            enrichment_data=enrichment_data,
-            lead_score=lead_score,
-            routing_decision=routing_decision,
-            verification_result=verification_result
-        )
+        # 0. Check Settings (cached snapshot, no DB round-trip per lead)
+        settings_db = await settings_cache.get_async()
+
+        # 1-4. Enrich, verify, score and route
+        analyzed_lead = await lead_pipeline.analyze(lead_input, settings_db)
+
+        # 5. Save to Database, with its outgoing webhook (if configured) in the same transaction;
+        #    the worker's dispatcher delivers it
+        with pipeline_stage_seconds.time(stage="db_commit"):
+            db_lead = lead_pipeline.build_lead(analyzed_lead)
+            session.add(db_lead)
+            if settings_db and settings_db.webhook_url:
+                await session.flush()
+                session.add(webhook_outbox.entry(settings_db.webhook_url, db_lead.id, analyzed_lead))
+            await session.commit()
 
-        # 6. Trigger Outgoing Webhook (if configured)
-        if settings_db and settings_db.webhook_url:
-            # We send the full analyzed payload
-            background_tasks.add_task(send_webhook, settings_db.webhook_url, analyzed_lead)
-        
         return analyzed_lead
+    except InvalidLeadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -158,17 +160,38 @@ async def analyze_lead(lead_input: LeadInput, background_tasks: BackgroundTasks,
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=error_msg)
 
+@router.post("/leads/import")
+async def import_leads(
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON (one LeadInput object per line)."),
+    format: Optional[ImportFormat] = Query(None, description="Defaults from the file extension."),
+    concurrency: int = Query(settings.bulk_import_concurrency, ge=1, le=settings.bulk_import_max_concurrency),
+    batch_size: int = Query(settings.bulk_import_batch_size, ge=1, le=1000),
+):
+    """
+    Bulk-imports leads. Rows are parsed as a stream, analyzed with bounded concurrency
+    and saved in batches. The response is NDJSON: one event per row (ok / error),
+    one per saved batch, periodic progress events and a final summary.
+    """
+    fmt = format or ImportFormat.from_filename(file.filename)
+    rows = iter_rows(file.file, fmt)
+
+    async def stream():
+        async for event in bulk_importer.run(rows, concurrency, batch_size, settings.bulk_import_progress_every):
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 @router.delete("/{lead_id}", status_code=204)
-async def delete_lead(lead_id: int, session: Session = Depends(get_session)):
+async def delete_lead(lead_id: int, session: AsyncSession = Depends(get_async_session)):
     """
     Delete a lead by ID.
     """
-    lead = session.get(Lead, lead_id)
+    lead = await session.get(Lead, lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    session.delete(lead)
-    session.commit()
+    await session.delete(lead)
+    await session.commit()
     return None
 
 
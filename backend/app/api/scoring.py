@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
+from app.db.database import get_async_session
+from app.models.scoring import ScoringProfile, ScoringProfileCreate
+from app.services.rescoring import lead_rescorer, RescoreUnavailableError
+from app.services.scoring_profiles import scoring_profile_service
+import asyncio
+
+router = APIRouter()
+
+@router.get("/scoring-profiles", response_model=List[ScoringProfile])
+async def list_scoring_profiles(name: Optional[str] = None, session: AsyncSession = Depends(get_async_session)):
+    """
+    Every version of every weight profile, newest version first per name.
+    Settings.scoring_profile_id is the one new leads are scored with.
+    """
+    return await session.run_sync(lambda sync_session: scoring_profile_service.list(sync_session, name=name))
+
+@router.post("/scoring-profiles", response_model=ScoringProfile, status_code=201)
+async def create_scoring_profile(profile: ScoringProfileCreate, session: AsyncSession = Depends(get_async_session)):
+    """
+    Saves a profile as the next version of its name. Profiles are never edited in place;
+    activate one with PUT /settings (`scoring_profile_id`).
+    """
+    try:
+        return await session.run_sync(lambda sync_session: scoring_profile_service.create(sync_session, profile))
+    except IntegrityError:
+        # Another request saved the same version of this name at the same time
+        raise HTTPException(status_code=409, detail=f"Profile '{profile.name}' was changed concurrently, please retry.")
+
+@router.get("/scoring-profiles/{profile_id}", response_model=ScoringProfile)
+async def get_scoring_profile(profile_id: int, session: AsyncSession = Depends(get_async_session)):
+    profile = await session.get(ScoringProfile, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Scoring profile not found")
+    return profile
+
+@router.get("/scoring-profiles/{profile_id}/rescore-preview")
+async def preview_rescore(profile_id: int, session: AsyncSession = Depends(get_async_session)):
+    """
+    Dry run of re-scoring every stored lead with this profile: how many scores change
+    and how leads would move between categories and queues. Nothing is written;
+    apply with `python -m app.rescore --profile <id> --apply`.
+    """
+    try:
+        lead_rescorer.check_available()
+    except RescoreUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    profile = await session.get(ScoringProfile, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Scoring profile not found")
+    return await asyncio.to_thread(lead_rescorer.rescore, profile.weights())
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
-from app.db.database import get_session
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import select
+from sqlalchemy import update, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.database import get_async_session
 from app.models.settings import Settings
 
 router = APIRouter()
 
 from typing import List
+import asyncio
 from pydantic import BaseModel
-from app.models.settings import Settings, SettingsBase
+from app.models.settings import Settings, SettingsBase, SettingsUpdate, PipelineMode
+from app.models.scoring import ScoringProfile
+from app.services.settings_cache import settings_cache
+from app.services.dedup import dedup_service
 
 # Extend the database model for the API response
 class SettingsResponse(SettingsBase):
@@ -15,14 +21,14 @@ class SettingsResponse(SettingsBase):
     available_models: List[dict]
 
 @router.get("/settings", response_model=SettingsResponse)
-async def get_settings(session: Session = Depends(get_session)):
-    settings_db = session.exec(select(Settings)).first()
+async def get_settings(session: AsyncSession = Depends(get_async_session)):
+    settings_db = (await session.exec(select(Settings))).first()
     if not settings_db:
         # Create default settings if not exists
         settings_db = Settings()
         session.add(settings_db)
-        session.commit()
-        session.refresh(settings_db)
+        await session.commit()
+        await session.refresh(settings_db)
     
     # Define available models here (or fetch from a config/service)
     models = [
@@ -37,8 +43,8 @@ async def get_settings(session: Session = Depends(get_session)):
     return response_data
 
 @router.put("/settings", response_model=Settings)
-async def update_settings(settings: Settings, session: Session = Depends(get_session)):
-    settings_db = session.exec(select(Settings)).first()
+async def update_settings(settings: SettingsUpdate, session: AsyncSession = Depends(get_async_session)):
+    settings_db = (await session.exec(select(Settings))).first()
     if not settings_db:
         settings_db = Settings()
         session.add(settings_db)
@@ -46,8 +52,35 @@ async def update_settings(settings: Settings, session: Session = Depends(get_ses
     settings_db.selected_model = settings.selected_model
     settings_db.auto_routing_enabled = settings.auto_routing_enabled
     settings_db.enrichment_enabled = settings.enrichment_enabled
-    
+
+    # Newer fields are only updated when sent, so older clients don't reset them to defaults
+    if "pipeline_mode" in settings.model_fields_set:
+        if settings.pipeline_mode not in {mode.value for mode in PipelineMode}:
+            raise HTTPException(status_code=422, detail=f"Unknown pipeline_mode '{settings.pipeline_mode}'.")
+        settings_db.pipeline_mode = settings.pipeline_mode
+    dedup_was_enabled = settings_db.dedup_enabled
+    for field in ("webhook_url", "fast_path_enabled", "dedup_enabled", "cascade_enabled", "escalation_model", "cascade_band_low", "cascade_band_high"):
+        if field in settings.model_fields_set:
+            setattr(settings_db, field, getattr(settings, field))
+    if settings_db.cascade_band_low > settings_db.cascade_band_high:
+        raise HTTPException(status_code=422, detail="cascade_band_low must not exceed cascade_band_high.")
+    if "scoring_profile_id" in settings.model_fields_set:
+        # null switches back to the built-in weights
+        if settings.scoring_profile_id is not None and not await session.get(ScoringProfile, settings.scoring_profile_id):
+            raise HTTPException(status_code=422, detail=f"Unknown scoring_profile_id {settings.scoring_profile_id}.")
+        settings_db.scoring_profile_id = settings.scoring_profile_id
+
     session.add(settings_db)
-    session.commit()
-    session.refresh(settings_db)
+    await session.flush()
+    # Other processes compare this counter against their cached snapshot; incremented in SQL
+    # so concurrent updates from different processes never end up on the same version
+    await session.execute(
+        update(Settings).where(Settings.id == settings_db.id).values(version=func.coalesce(Settings.version, 0) + 1)
+    )
+    await session.commit()
+    await session.refresh(settings_db)
+    settings_cache.store(settings_db)
+    if settings_db.dedup_enabled and not dedup_was_enabled:
+        # Leads saved while dedup was off have no LSH buckets yet
+        await asyncio.to_thread(dedup_service.index_recent_leads)
     return settings_db
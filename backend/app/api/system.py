@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.database import get_async_session
+from app.services.lead_stats import lead_stats_service
+from typing import Optional
+from app.services.enrichment_cache import enrichment_cache
+from app.services.cascade import scoring_cascade
+from app.services.fast_path import fast_path_service
+from app.services.dedup import dedup_service
+from app.services.settings_cache import settings_cache
+from app.services.webhook_outbox import webhook_outbox
+from app.utils.gemini_client import gemini_client
+import asyncio
+
+router = APIRouter()
+
+@router.get("/enrichment-cache")
+async def get_enrichment_cache_stats():
+    """
+    Hit/miss counters and size of the company enrichment cache.
+    """
+    return enrichment_cache.get_stats()
+
+@router.delete("/enrichment-cache")
+async def invalidate_enrichment_cache(domain: Optional[str] = None, company_name: Optional[str] = None):
+    """
+    Invalidates cached enrichment. No parameters clears everything,
+    `domain` drops every entry for that domain, `domain` + `company_name` drops one entry.
+    """
+    removed = await asyncio.to_thread(enrichment_cache.invalidate, domain=domain, company_name=company_name)
+    return {"invalidated": removed}
+
+@router.get("/gemini")
+async def get_gemini_stats():
+    """
+    Counters for the async Gemini client (e.g. how many calls were coalesced).
+    """
+    return gemini_client.get_stats()
+
+@router.get("/cascade")
+async def get_cascade_stats():
+    """
+    Per-tier call counts and latency of the scoring model cascade.
+    """
+    return scoring_cascade.get_stats()
+
+@router.get("/fast-path")
+async def get_fast_path_stats():
+    """
+    How many leads the deterministic fast path settled, per rule.
+    """
+    return fast_path_service.get_stats()
+
+@router.get("/dedup")
+async def get_dedup_stats():
+    """
+    How many submissions reused the analysis of a recent duplicate, by match type.
+    """
+    return dedup_service.get_stats()
+
+@router.get("/settings-cache")
+async def get_settings_cache_stats():
+    """
+    Cached settings version and how often the DB was consulted.
+    """
+    return settings_cache.get_stats()
+
+@router.get("/webhooks")
+async def get_webhook_outbox_stats():
+    """
+    Webhook outbox entries per status, and the oldest one still waiting.
+    """
+    return await asyncio.to_thread(webhook_outbox.get_stats)
+
+@router.post("/webhooks/{entry_id}/retry")
+async def retry_webhook(entry_id: int):
+    """
+    Re-queues a dead-lettered webhook with a fresh attempt budget.
+    """
+    if not await asyncio.to_thread(webhook_outbox.retry, entry_id):
+        raise HTTPException(status_code=404, detail="No dead-lettered webhook with this id")
+    return {"status": "requeued"}
+
+@router.post("/stats-rollup/rebuild")
+async def rebuild_stats_rollup(session: AsyncSession = Depends(get_async_session)):
+    """
+    Recomputes the daily stats rollup from the lead table (e.g. after manual SQL edits).
+    """
+    return {"rows": await session.run_sync(lead_stats_service.rebuild_rollups)}
@@ -1,8 +1,104 @@
 from pydantic_settings import BaseSettings
+from typing import Dict, Optional
 
 class Settings(BaseSettings):
     google_api_key: str
     database_url: str
+    async_database_url: Optional[str] = None # Defaults to database_url with the async driver (asyncpg / aiosqlite)
+
+    # Connection pool (sync and async engines each get one)
+    db_pool_size: int = 10 # Connections kept open
+    db_max_overflow: int = 20 # Extra connections allowed under burst
+    db_pool_timeout: float = 30 # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800 # Reconnect connections older than this (seconds); -1 disables
+    db_pool_pre_ping: bool = True # Test connections on checkout so dropped ones are replaced transparently
+
+    # Gemini HTTP client (async, connection-pooled)
+    gemini_base_url: str = "https://generativelanguage.googleapis.com/v1beta/models" # e.g. http://127.0.0.1:8100/v1beta/models for fake_gemini.py
+    gemini_timeout: float = 30.0
+    gemini_max_retries: int = 3
+    gemini_max_connections: int = 100
+    gemini_max_keepalive_connections: int = 20
+    gemini_keepalive_expiry: float = 30.0
+    gemini_http2: bool = False # Requires the `h2` package (pip install httpx[http2])
+    gemini_coalescing_enabled: bool = True # Share one in-flight call between identical concurrent requests
+
+    # Gemini record/replay cassette (deterministic perf regression runs)
+    gemini_cassette_mode: str = "off" # "off", "record" (store every response) or "replay" (never call Gemini)
+    gemini_cassette_path: str = "gemini_cassette.sqlite3"
+    gemini_cassette_replay_latency: str = "recorded" # "recorded" (sleep as long as the original call) or "zero"
+
+    # Gemini quota governor (token buckets per model + max in-flight calls)
+    gemini_rate_limit_enabled: bool = True
+    gemini_rpm: int = 60
+    gemini_tpm: int = 1_000_000
+    gemini_max_in_flight: int = 16
+    gemini_expected_output_tokens: int = 1024 # Output budget reserved per call before usage is known
+    gemini_model_limits: Dict[str, Dict[str, int]] = {} # e.g. {"gemini-1.5-pro": {"rpm": 5, "tpm": 250000}}
+
+    # Company enrichment cache (in-process LRU + Postgres table)
+    enrichment_cache_enabled: bool = True
+    enrichment_cache_ttl_hours: float = 168.0 # One week
+    enrichment_cache_max_entries: int = 5000
+
+    # Analysis job queue (POST /analyze/jobs + `python -m app.worker`)
+    job_max_attempts: int = 3 # Rate-limited jobs are re-queued until this many attempts
+    job_retry_base_seconds: float = 10 # Re-queued jobs wait this long, doubling per attempt...
+    job_retry_max_seconds: float = 300 # ...up to this
+    job_visibility_timeout_seconds: int = 600 # Running jobs older than this are assumed orphaned and re-queued
+    job_poll_interval: float = 1.0
+    job_max_wait_seconds: float = 60.0 # Upper bound for long-polling GET /analyze/jobs/{id}?wait=
+    worker_concurrency: int = 4 # Jobs processed concurrently per worker process
+
+    # Bulk CSV/NDJSON import
+    bulk_import_concurrency: int = 8 # Leads analyzed at once
+    bulk_import_max_concurrency: int = 32
+    bulk_import_batch_size: int = 50 # Leads saved per commit
+    bulk_import_progress_every: int = 25 # Emit a progress event every N rows
+
+    # Company table
+    company_stale_after_hours: float = 720 # Company data older than this is re-enriched in the background
+    company_refresh_batch_size: int = 20 # Companies re-enriched per refresher pass
+    company_refresh_interval_seconds: float = 300
+    company_refresh_lease_seconds: int = 600 # A claimed company is retried by another refresher after this
+
+    # Duplicate detection
+    dedup_window_hours: float = 72 # Only leads this recent are reused
+    dedup_similarity_threshold: float = 0.8 # Jaccard similarity of word shingles for a near-duplicate
+    dedup_num_perm: int = 64 # MinHash permutations
+    dedup_bands: int = 16 # LSH bands (num_perm / bands rows each)
+    dedup_max_candidates: int = 50 # LSH candidates compared exactly per lead
+
+    # Settings cache
+    settings_cache_ttl_seconds: float = 5.0 # How often other processes' updates are checked for (version counter)
+
+    # Webhook outbox (delivered by python -m app.worker)
+    webhook_timeout: float = 10
+    webhook_max_connections: int = 20 # Pooled connections across all targets
+    webhook_max_concurrency_per_target: int = 4 # In-flight POSTs per target URL
+    webhook_batch_size: int = 1 # Leads per POST; above 1 the body is a JSON array of payloads
+    webhook_max_attempts: int = 8 # Then the entry is dead-lettered
+    webhook_retry_base_seconds: float = 5 # Backoff doubles per attempt...
+    webhook_retry_max_seconds: float = 3600 # ...up to this
+    webhook_claim_batch: int = 100 # Entries claimed per dispatcher pass
+    webhook_lease_seconds: int = 120 # A claimed entry is re-claimable after this if the dispatcher died
+    webhook_poll_interval: float = 1.0
+
+    # Logging
+    log_level: str = "INFO" # DEBUG also dumps full Gemini results
+    log_format: str = "json" # "json" (one object per line) or "text"
+    log_sample_rate: float = 1.0 # Share of high-volume per-lead messages emitted (e.g. 0.1 under load)
+
+    # Bulk re-scoring (python -m app.rescore)
+    rescore_chunk_size: int = 5000 # Leads loaded into one NumPy pass / written per commit
+
+    # Lead export
+    export_batch_size: int = 1000 # Rows fetched per server-side cursor round-trip / Parquet row group
+    export_watermark_lag_seconds: int = 300 # Leads younger than this wait for the next export; must exceed the longest analyze-to-commit delay
+
+    # Lead listing
+    leads_page_size: int = 100 # Default page size for GET /api/v1/
+    leads_max_page_size: int = 1000
 
     class Config:
         env_file = ".env"
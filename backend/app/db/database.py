@@ -1,9 +1,48 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.config import settings
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-engine = create_engine(settings.database_url)
+# Sync driver -> async driver, used when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def _async_url(database_url: str) -> str:
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername)).render_as_string(hide_password=False)
+
+def _pool_options(database_url: str) -> dict:
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    # SQLite uses its own single-file pool classes that don't take sizing arguments
+    if not make_url(database_url).drivername.startswith("sqlite"):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+engine = create_engine(settings.database_url, **_pool_options(settings.database_url))
+
+async_database_url = settings.async_database_url or _async_url(settings.database_url)
+async_engine = create_async_engine(async_database_url, **_pool_options(async_database_url))
+async_session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
         yield session
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped session on the async engine, so queries don't block the event loop.
+    """
+    async with async_session_factory() as session:
+        yield session
@@ -1,7 +1,156 @@
 from sqlmodel import SQLModel
+from sqlalchemy import inspect, literal, text
 from app.db.database import engine
 from app.models import lead # Import models so they are registered
 from app.models import settings # Import Settings model
+from app.models import enrichment_cache # Import enrichment cache table
+from app.models import job # Import analysis job queue
+from app.models import rollup # Import stats rollup table
+from app.models import dedup # Import LSH bucket table
+from app.models import company # Import Company table
+from app.models import webhook # Import webhook outbox table
+from app.models import scoring # Import scoring weight profiles
+from app.services.lead_stats import lead_stats_service # Registers the rollup maintenance listeners
+from app.services.dedup import dedup_service # Registers the LSH bucket maintenance listeners
+from app.services.lead_search import SEARCH_VECTOR_SQL
+from app.services.settings_cache import settings_cache
+from sqlmodel import Session
+import logging
+
+logger = logging.getLogger(__name__)
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    add_missing_columns()
+    convert_json_to_jsonb()
+    add_missing_indexes()
+    update_foreign_key_actions()
+    add_search_vector()
+    backfill_rollups()
+    backfill_dedup()
+
+def add_missing_indexes():
+    """
+    Same as add_missing_columns, for indexes declared on models after their table was created.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                # Skip indexes limited to another dialect via .ddl_if(dialect=...)
+                ddl_if = getattr(index, "_ddl_if", None)
+                if ddl_if is not None and ddl_if.dialect not in (None, engine.dialect.name):
+                    continue
+                if index.name not in existing:
+                    logger.info("🛠️ [init_db] Creating index %s", index.name)
+                    index.create(conn)
+
+def update_foreign_key_actions():
+    """
+    Postgres only: foreign keys whose model gained an ON DELETE action after the
+    table was created (e.g. analysis_job.lead_id -> SET NULL) are re-created with it.
+    SQLite cannot alter constraints; its existing tables keep the old ones.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {tuple(fk["constrained_columns"]): fk for fk in inspector.get_foreign_keys(table.name)}
+            for constraint in table.foreign_key_constraints:
+                current = existing.get(tuple(constraint.column_keys))
+                if current is None or not constraint.ondelete:
+                    continue
+                if (current["options"].get("ondelete") or "").upper() == constraint.ondelete.upper():
+                    continue
+                name = current["name"]
+                columns = ", ".join(f'"{column}"' for column in constraint.column_keys)
+                referred = ", ".join(f'"{element.column.name}"' for element in constraint.elements)
+                logger.info("🛠️ [init_db] Setting ON DELETE %s on %s(%s)", constraint.ondelete, table.name, columns)
+                conn.execute(text(f'ALTER TABLE "{table.name}" DROP CONSTRAINT "{name}"'))
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" ADD CONSTRAINT "{name}" FOREIGN KEY ({columns}) '
+                    f'REFERENCES "{constraint.referred_table.name}" ({referred}) ON DELETE {constraint.ondelete}'
+                ))
+
+def add_search_vector():
+    """
+    Postgres only: generated tsvector column + GIN index backing /leads/search.
+    Kept out of the Lead model so SQLite and the ORM queries never load it.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        if "search_vector" not in {column["name"] for column in inspector.get_columns("lead")}:
+            logger.info("🛠️ [init_db] Adding full-text search column lead.search_vector")
+            conn.execute(text(f"ALTER TABLE lead ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_lead_search_vector ON lead USING gin (search_vector)"))
+
+def convert_json_to_jsonb():
+    """
+    Postgres only: columns declared as JSONVariant but created as plain JSON are
+    converted in place, so the GIN indexes on them can be built.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"]: column["type"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing or column.type.dialect_impl(engine.dialect).__visit_name__ != "JSONB":
+                    continue
+                if existing[column.name].__visit_name__ == "JSON":
+                    logger.info("🛠️ [init_db] Converting %s.%s to JSONB", table.name, column.name)
+                    conn.execute(text(f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" TYPE JSONB USING "{column.name}"::jsonb'))
+
+def backfill_rollups():
+    """
+    Builds the stats rollup from existing leads the first time it is needed.
+    """
+    with Session(engine) as session:
+        if lead_stats_service.rollups_missing(session):
+            rows = lead_stats_service.rebuild_rollups(session)
+            logger.info("🛠️ [init_db] Backfilled %s stats rollup rows", rows)
+
+def backfill_dedup():
+    """
+    Normalizes the email of leads saved before duplicate detection existed and,
+    when it is enabled, writes the LSH buckets of recent leads that have none.
+    """
+    updated = dedup_service.backfill_emails()
+    if updated:
+        logger.info("🛠️ [init_db] Backfilled email_normalized on %s leads", updated)
+    if settings_cache.get().dedup_enabled:
+        indexed = dedup_service.index_recent_leads()
+        if indexed:
+            logger.info("🛠️ [init_db] Indexed %s recent leads for duplicate detection", indexed)
+
+def add_missing_columns():
+    """
+    create_all() only creates missing tables. Columns added to a model after its
+    table already exists are added here (nullable, with the model's scalar default).
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or column.computed is not None:
+                    continue
+                ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.type.compile(dialect=engine.dialect)}'
+                if column.default is not None and column.default.is_scalar:
+                    default = literal(column.default.arg).compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+                    ddl += f" DEFAULT {default}"
+                logger.info("🛠️ [init_db] Adding column %s.%s", table.name, column.name)
+                conn.execute(text(ddl))
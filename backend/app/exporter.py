@@ -0,0 +1,66 @@
+"""
+Lead export from the command line, for nightly warehouse loads.
+
+Streams leads created after a watermark to a CSV, NDJSON or Parquet file
+(or stdout) through a server-side cursor. With --watermark-file the
+watermark is read before and saved after each successful run, so repeated
+runs only export new leads.
+
+    python -m app.exporter --format parquet --output leads.parquet --watermark-file .leads_watermark
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+from app.config import settings
+from app.services.lead_export import lead_exporter, ExportFormat, ExportUnavailableError
+
+def read_watermark(path: str):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path) as f:
+        value = f.read().strip()
+    return datetime.fromisoformat(value) if value else None
+
+def write_watermark(path: str, watermark: datetime):
+    # Write-then-rename so a crash never leaves a truncated watermark behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(watermark.isoformat())
+    os.replace(tmp_path, path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export leads to CSV, NDJSON or Parquet.")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default=ExportFormat.NDJSON.value)
+    parser.add_argument("--output", help="File to write (default: stdout).")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only leads created after this ISO timestamp.")
+    parser.add_argument("--watermark-file", help="Read --since from this file and store the new watermark after the export.")
+    parser.add_argument("--batch-size", type=int, default=settings.export_batch_size)
+    args = parser.parse_args()
+
+    fmt = ExportFormat(args.format)
+    try:
+        lead_exporter.check_available(fmt)
+    except ExportUnavailableError as e:
+        parser.error(str(e))
+
+    since = args.since or read_watermark(args.watermark_file)
+    until = lead_exporter.watermark()
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    written = 0
+    try:
+        for chunk in lead_exporter.stream(fmt, since, until, args.batch_size):
+            output.write(chunk)
+            written += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+    watermark = until if until and (since is None or until > since) else since
+    if args.watermark_file and watermark:
+        write_watermark(args.watermark_file, watermark)
+    print(f"Exported {written} bytes, watermark {watermark.isoformat() if watermark else '-'}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Bulk lead import from the command line.
+
+Streams a CSV (with a header row) or NDJSON file through the analysis
+pipeline and saves the results in batches. Row results and errors are
+written to stdout as NDJSON; progress goes to stderr.
+
+    python -m app.importer leads.csv --concurrency 8 --batch-size 50
+"""
+import argparse
+import asyncio
+import json
+import sys
+from app.config import settings
+from app.db.init_db import init_db
+from app.services.bulk_import import bulk_importer, iter_rows, ImportFormat
+from app.utils.gemini_client import gemini_client
+
+async def run_import(path: str, fmt: ImportFormat, concurrency: int, batch_size: int, progress_every: int) -> dict:
+    summary = {}
+    with open(path, "rb") as stream:
+        async for event in bulk_importer.run(iter_rows(stream, fmt), concurrency, batch_size, progress_every):
+            if event["type"] == "row":
+                print(json.dumps(event), flush=True)
+            elif event["type"] == "summary":
+                summary = event
+            else:
+                print(json.dumps(event), file=sys.stderr, flush=True)
+    await gemini_client.aclose()
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import leads from CSV or NDJSON.")
+    parser.add_argument("path", help="File to import.")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="Defaults from the file extension.")
+    parser.add_argument("--concurrency", type=int, default=settings.bulk_import_concurrency)
+    parser.add_argument("--batch-size", type=int, default=settings.bulk_import_batch_size)
+    parser.add_argument("--progress-every", type=int, default=settings.bulk_import_progress_every)
+    args = parser.parse_args()
+
+    fmt = ImportFormat(args.format) if args.format else ImportFormat.from_filename(args.path)
+    init_db()
+    summary = asyncio.run(run_import(args.path, fmt, args.concurrency, args.batch_size, args.progress_every))
+    print(json.dumps(summary), file=sys.stderr)
+    sys.exit(1 if summary.get("failed") else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import leads, auth
+from app.api import leads, auth, jobs
 from app.api import settings as settings_router
+from app.api import system
+from app.api import scoring
 from app.config import settings
+from app.utils.metrics import metrics
+from app.utils.structured_logging import bind_correlation_id, configure_logging
+import logging
 # Removed: from dotenv import load_dotenv
 
 # Removed: load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="AI Lead Management System",
     description="A hackathon project to analyze, score, and route sales leads using AI.",
@@ -25,12 +32,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link", "X-Export-Watermark", "X-Request-ID"],
 )
 
+@app.middleware("http")
+async def correlation_id_middleware(request: Request, call_next):
+    # Every log record of this request carries its id; callers may pass their own
+    with bind_correlation_id(request.headers.get("X-Request-ID")) as request_id:
+        response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 # Include the API router
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
+app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
 app.include_router(leads.router, prefix="/api/v1", tags=["leads"])
 app.include_router(settings_router.router, prefix="/api/v1", tags=["settings"])
+app.include_router(scoring.router, prefix="/api/v1", tags=["scoring"])
+app.include_router(system.router, prefix="/api/v1/system", tags=["system"])
 
 @app.get("/", tags=["Root"])
 async def read_root():
@@ -39,9 +58,19 @@ async def read_root():
     """
     return {"message": "Welcome to the AI Lead Management System API!"}
 
+@app.get("/metrics", tags=["Root"], include_in_schema=False)
+async def get_metrics():
+    """
+    Pipeline stage and Gemini metrics of this process, in the Prometheus text format.
+    """
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # A check to ensure the Google API key is loaded.
 @app.on_event("startup")
 async def startup_event():
+    # Queue-backed structured logging, before anything else logs
+    configure_logging()
+
     # Initialize the database
     from app.db.init_db import init_db
     init_db()
@@ -49,7 +78,13 @@ async def startup_event():
     # pydantic-settings will raise ValidationError if GOOGLE_API_KEY is missing,
     # so this check is primarily for visual feedback.
     if not settings.google_api_key or "YOUR_GEMINI_API_KEY" in settings.google_api_key:
-        print("="*80)
-        print("WARNING: Google API key is not configured.")
-        print("Please ensure GOOGLE_API_KEY is set in your .env file.")
-        print("="*80)
+        logger.warning("Google API key is not configured. Please ensure GOOGLE_API_KEY is set in your .env file.")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Release pooled Gemini connections
+    from app.utils.gemini_client import gemini_client
+    await gemini_client.aclose()
+    # Close pooled async DB connections
+    from app.db.database import async_engine
+    await async_engine.dispose()
@@ -0,0 +1,22 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column
+from typing import Dict, Optional
+from datetime import datetime
+from app.models.lead import JSONVariant, jsonb_gin_index
+
+class Company(SQLModel, table=True):
+    """
+    One row per company, keyed by the root domain of its leads' emails.
+    Leads reference it through Lead.company_id instead of carrying their own copy.
+    """
+    __table_args__ = (
+        jsonb_gin_index("ix_company_company_info_gin", "company_info"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    domain: str = Field(unique=True, index=True)
+    name: str
+    company_info: Dict = Field(sa_column=Column(JSONVariant))
+    company_logo_url: Optional[str] = Field(default=None)
+    enriched_at: datetime = Field(default_factory=datetime.utcnow)
+    refresh_after: datetime = Field(index=True) # Re-enriched by the background refresher once passed
@@ -0,0 +1,20 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+
+class LeadLshBucket(SQLModel, table=True):
+    """
+    MinHash LSH buckets of a lead's (name, company, notes) text, one row per band.
+    Leads sharing any (band, bucket) pair are near-duplicate candidates.
+    """
+    __tablename__ = "lead_lsh_bucket"
+    __table_args__ = (
+        Index("ix_lead_lsh_bucket_band_bucket_created_at", "band", "bucket", "created_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    lead_id: int = Field(foreign_key="lead.id", index=True)
+    band: int
+    bucket: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from typing import Dict
+from datetime import datetime
+from sqlalchemy import JSON, Column
+
+class CompanyEnrichmentCache(SQLModel, table=True):
+    """
+    Persistent tier of the company enrichment cache.
+    One row per normalized (domain, company name) key.
+    """
+    __tablename__ = "company_enrichment_cache"
+
+    cache_key: str = Field(primary_key=True)
+    domain: str = Field(index=True)
+    company_name: str
+    company_info: Dict = Field(sa_column=Column(JSON))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,55 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional, Dict
+from enum import Enum
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import JSON, Column, Index
+from app.models.lead import AnalyzedLead
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+# --- Database Model ---
+
+class AnalysisJob(SQLModel, table=True):
+    """
+    A queued /analyze request. Claimed by `python -m app.worker` processes
+    with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    __tablename__ = "analysis_job"
+    __table_args__ = (
+        # Serves the claim query: oldest queued job first
+        Index("ix_analysis_job_status_created_at", "status", "created_at"),
+    )
+
+    id: str = Field(default_factory=lambda: uuid4().hex, primary_key=True)
+    status: str = Field(default=JobStatus.QUEUED.value)
+    lead_input: Dict = Field(sa_column=Column(JSON))
+    result: Optional[Dict] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = Field(default=None)
+    error_code: Optional[int] = Field(default=None) # HTTP-style status of the failure (400, 429, 500)
+    lead_id: Optional[int] = Field(default=None, foreign_key="lead.id", ondelete="SET NULL") # Deleting the lead keeps the job
+    attempts: int = Field(default=0)
+    worker_id: Optional[str] = Field(default=None)
+    not_before: Optional[datetime] = Field(default=None) # Re-queued jobs are not claimed again before this
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+
+# --- API Models ---
+
+class AnalysisJobRead(SQLModel):
+    id: str
+    status: JobStatus
+    attempts: int
+    lead_id: Optional[int] = None
+    error: Optional[str] = None
+    error_code: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[AnalyzedLead] = None
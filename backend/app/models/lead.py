@@ -3,7 +3,15 @@ from pydantic import BaseModel, EmailStr
 from typing import Optional, Dict, List
 from enum import Enum
 from datetime import datetime
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSONB on Postgres (indexable, binary), plain JSON elsewhere; None is stored as SQL NULL
+JSONVariant = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+def jsonb_gin_index(name: str, column: str) -> Index:
+    # jsonb_path_ops: smaller and faster than the default opclass, supports @> containment
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "jsonb_path_ops"}).ddl_if(dialect="postgresql")
 
 
 # --- Verification Enums & Models ---
@@ -47,6 +55,7 @@ class BANTAnalysis(BaseModel):
     timeline: str = Field(..., description="Analysis of the lead's timeline for purchase.")
 
 class EnrichmentData(BaseModel):
+    company_id: Optional[int] = Field(None, description="Shared Company row the details come from, if any.")
     company_info: Optional[dict] = Field(None, description="Enriched information about the company.")
     email_valid: bool = Field(True, description="Whether the email address is valid.")
     company_logo_url: Optional[str] = Field(None, description="URL of the company logo.")
@@ -71,10 +80,28 @@ class AnalyzedLead(BaseModel):
     lead_score: LeadScore
     routing_decision: RoutingDecision
     verification_result: Optional[VerificationResult] = None
+    fast_path_rule: Optional[str] = Field(default=None, description="Deterministic rule that settled the lead without AI, if any.")
+    duplicate_of_id: Optional[int] = Field(default=None, description="Original lead whose analysis was reused, if this lead is a duplicate.")
+    duplicate_match: Optional[str] = Field(default=None, description="'email' or 'near_duplicate' when the analysis was reused.")
 
 # --- Database Model ---
 
 class Lead(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), optionally narrowed by a filter column
+        Index("ix_lead_created_at_id", "created_at", "id"),
+        Index("ix_lead_category_created_at_id", "category", "created_at", "id"),
+        Index("ix_lead_queue_created_at_id", "queue", "created_at", "id"),
+        Index("ix_lead_verification_status_created_at_id", "verification_status", "created_at", "id"),
+        Index("ix_lead_score", "score"),
+        Index("ix_lead_company_size_min", "company_size_min"),
+        Index("ix_lead_email_normalized_created_at", "email_normalized", "created_at"),
+        # Containment filters on the JSONB columns (Postgres only)
+        jsonb_gin_index("ix_lead_company_info_gin", "company_info"),
+        jsonb_gin_index("ix_lead_score_breakdown_gin", "score_breakdown"),
+        jsonb_gin_index("ix_lead_risk_flags_gin", "risk_flags"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # Input
@@ -86,7 +113,9 @@ class Lead(SQLModel, table=True):
 
     # Enrichment
     email_valid: bool
-    company_info: Optional[Dict] = Field(default=None, sa_column=Column(JSON))
+    company_id: Optional[int] = Field(default=None, foreign_key="company.id", index=True) # Shared company details; company_info/logo are then left empty
+    company_info: Optional[Dict] = Field(default=None, sa_column=Column(JSONVariant))
+    company_size_min: Optional[int] = Field(default=None) # Lower bound of company_info["size"], for range filters
     company_logo_url: Optional[str] = Field(default=None)
     profile_image_url: Optional[str] = Field(default=None)
 
@@ -100,9 +129,9 @@ class Lead(SQLModel, table=True):
     score: int
     category: str
     explanation: str
-    score_breakdown: Optional[Dict] = Field(default=None, sa_column=Column(JSON))
-    risk_flags: Optional[List[str]] = Field(default=None, sa_column=Column(JSON))
-    follow_up_questions: Optional[List[str]] = Field(default=None, sa_column=Column(JSON))
+    score_breakdown: Optional[Dict] = Field(default=None, sa_column=Column(JSONVariant))
+    risk_flags: Optional[List[str]] = Field(default=None, sa_column=Column(JSONVariant))
+    follow_up_questions: Optional[List[str]] = Field(default=None, sa_column=Column(JSONVariant))
 
     # Verification
     verification_status: Optional[str] = Field(default=LeadVerificationStatus.UNVERIFIED.value)
@@ -117,7 +146,42 @@ class Lead(SQLModel, table=True):
     # Routing
     queue: str
     routing_reason: str
+    fast_path_rule: Optional[str] = Field(default=None)
+
+    # Deduplication
+    email_normalized: Optional[str] = Field(default=None)
+    duplicate_of_id: Optional[int] = Field(default=None, foreign_key="lead.id", index=True)
+    duplicate_match: Optional[str] = Field(default=None) # "email" or "near_duplicate"
 
     # Meta
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+
+class LeadSummary(SQLModel):
+    """
+    Lightweight projection of Lead for list views: no notes, analyses or JSON blobs.
+    """
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    company_name: str
+    company_logo_url: Optional[str] = None
+    score: int
+    category: str
+    queue: str
+    verification_status: Optional[str] = None
+    authority_tier: Optional[str] = None
+    intent_signal: Optional[str] = None
+    fast_path_rule: Optional[str] = None
+    duplicate_of_id: Optional[int] = None
+    created_at: datetime
+
+class LeadSearchHit(LeadSummary):
+    rank: float
+    highlights: Dict[str, str] = {} # Field name -> snippet with <mark>...</mark> around matches
+
+class LeadSearchResults(BaseModel):
+    query: str
+    results: List[LeadSearchHit]
+    next_offset: Optional[int] = None
@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+
+class LeadDailyRollup(SQLModel, table=True):
+    """
+    Incrementally maintained per-day lead counters backing GET /stats.
+    One row per (day, dimension, key):
+    - dimension "total", key "" : every lead of the day
+    - dimension "category", key <category>
+    - dimension "queue", key <queue>
+    """
+    __tablename__ = "lead_daily_rollup"
+
+    day: date = Field(primary_key=True)
+    dimension: str = Field(primary_key=True)
+    key: str = Field(primary_key=True)
+    lead_count: int = Field(default=0)
+    score_sum: int = Field(default=0)
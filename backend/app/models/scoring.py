@@ -0,0 +1,64 @@
+from sqlmodel import SQLModel, Field
+from pydantic import ConfigDict, model_validator
+from sqlalchemy import UniqueConstraint
+from typing import Optional
+from datetime import datetime
+
+# Weight field -> key of the dimension in Lead.score_breakdown
+BREAKDOWN_KEYS = {
+    "authenticity": "Authenticity",
+    "authority": "Authority",
+    "budget": "Budget",
+    "clarity": "Clarity",
+    "footprint": "Footprint",
+    "intent": "Intent",
+}
+
+class ScoringWeights(SQLModel):
+    """
+    How AIScoringService turns the six dimension scores into the final score.
+    The defaults are the weights the service always used.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    authenticity: float = Field(default=0.30, ge=0, le=1)
+    authority: float = Field(default=0.20, ge=0, le=1)
+    budget: float = Field(default=0.10, ge=0, le=1)
+    clarity: float = Field(default=0.10, ge=0, le=1)
+    footprint: float = Field(default=0.10, ge=0, le=1)
+    intent: float = Field(default=0.20, ge=0, le=1)
+    risk_flag_penalty: int = Field(default=10, ge=0, le=100, description="Points subtracted per risk flag")
+    baseline_score: int = Field(default=20, ge=0, le=100, description="Minimum score of any lead not judged Likely Fake")
+
+DEFAULT_SCORING_WEIGHTS = ScoringWeights()
+
+class ScoringProfileCreate(ScoringWeights):
+    name: str = Field(min_length=1, max_length=100)
+    description: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_weights_sum(self):
+        # Keeps the weighted score on the same 0-100 scale as the dimensions
+        total = sum(getattr(self, field) for field in BREAKDOWN_KEYS)
+        if abs(total - 1) > 1e-6:
+            raise ValueError(f"Dimension weights must add up to 1 (got {total:.4f}).")
+        return self
+
+class ScoringProfile(ScoringWeights, table=True):
+    """
+    One immutable version of a named weight profile. Saving a profile under an
+    existing name adds the next version; Settings.scoring_profile_id picks the
+    one new leads are scored with.
+    """
+    __tablename__ = "scoring_profile"
+    __table_args__ = (UniqueConstraint("name", "version"),)
+    model_config = ConfigDict(frozen=False)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    version: int = Field(default=1)
+    description: Optional[str] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def weights(self) -> ScoringWeights:
+        return ScoringWeights.model_validate(self, from_attributes=True)
@@ -1,11 +1,44 @@
 from sqlmodel import SQLModel, Field
+from pydantic import ConfigDict
 from typing import Optional
+from enum import Enum
+
+class PipelineMode(str, Enum):
+    STANDARD = "standard" # Separate verification and scoring calls
+    FUSED = "fused" # One search-grounded call returns verification + scoring
 
 class SettingsBase(SQLModel):
     selected_model: str = Field(default="gemini-2.5-flash")
     auto_routing_enabled: bool = Field(default=True)
     enrichment_enabled: bool = Field(default=True)
     webhook_url: Optional[str] = Field(default=None, description="URL to send analyzed lead data to (e.g. n8n webhook)")
+    pipeline_mode: str = Field(default=PipelineMode.STANDARD.value, description="'standard' or 'fused' (single verification+scoring call)")
+
+    fast_path_enabled: bool = Field(default=False, description="Settle obvious junk leads with local rules before any Gemini call")
+    dedup_enabled: bool = Field(default=False, description="Reuse the analysis of a recent duplicate (same email or near-identical inquiry)")
+
+    # Model cascade: score with selected_model, re-score borderline leads with escalation_model
+    cascade_enabled: bool = Field(default=False)
+    escalation_model: str = Field(default="gemini-1.5-pro")
+    cascade_band_low: int = Field(default=45, ge=0, le=100, description="Scores in [low, high] are re-scored by the escalation model")
+    cascade_band_high: int = Field(default=75, ge=0, le=100)
+
+    scoring_profile_id: Optional[int] = Field(default=None, description="ScoringProfile new leads are scored with; None uses the built-in weights")
 
 class Settings(SettingsBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    version: int = Field(default=1, description="Bumped on every update so other processes can detect stale caches")
+
+class SettingsUpdate(SettingsBase):
+    """
+    Body of PUT /api/v1/settings. Unlike the table model it is validated, so the field bounds apply.
+    """
+
+class SettingsSnapshot(SettingsBase):
+    """
+    Immutable copy of the Settings row, shared by every lead analyzed until the settings change.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[int] = None
+    version: int = 0
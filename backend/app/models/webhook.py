@@ -0,0 +1,36 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional, Dict
+from enum import Enum
+from datetime import datetime
+from sqlalchemy import Column, Index
+from app.models.lead import JSONVariant
+
+class WebhookStatus(str, Enum):
+    PENDING = "pending" # Waiting for its next attempt
+    DELIVERING = "delivering" # Claimed by a dispatcher
+    DELIVERED = "delivered"
+    DEAD = "dead" # Gave up; kept for inspection and manual retry
+
+class WebhookOutboxEntry(SQLModel, table=True):
+    """
+    One outgoing webhook payload, written in the same transaction as its Lead
+    and delivered by the dispatcher in `python -m app.worker`.
+    """
+    __tablename__ = "webhook_outbox"
+    __table_args__ = (
+        # Serves the claim query: due entries, oldest first
+        Index("ix_webhook_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    target_url: str
+    lead_id: Optional[int] = Field(default=None, index=True)
+    payload: Dict = Field(sa_column=Column(JSONVariant))
+    status: str = Field(default=WebhookStatus.PENDING.value)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_until: Optional[datetime] = Field(default=None) # Lease of the dispatcher delivering it
+    delivered_at: Optional[datetime] = Field(default=None)
@@ -0,0 +1,108 @@
+"""
+Deterministic pipeline runs over a lead corpus, for perf regression checks.
+
+Analyzes every lead of a CSV or NDJSON file without saving it. Combined with
+GEMINI_CASSETTE_MODE=replay, every Gemini answer comes from the cassette, so
+two runs of the same corpus produce the same scores unless the Python side
+changed. Prints a digest of the results and the wall time to stderr; results
+go to --output as NDJSON.
+
+    # Once, against the real API (or fake_gemini.py):
+    GEMINI_CASSETTE_MODE=record python -m app.replay corpus.ndjson
+    # In CI:
+    GEMINI_CASSETTE_MODE=replay GEMINI_CASSETTE_REPLAY_LATENCY=zero \\
+        python -m app.replay corpus.ndjson --expect-digest <digest>
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from app.config import settings
+from app.db.init_db import init_db
+from app.models.lead import LeadInput
+from app.services.bulk_import import iter_rows, ImportFormat
+from app.services.pipeline import lead_pipeline, InvalidLeadError
+from app.services.settings_cache import settings_cache
+from app.utils.gemini_client import gemini_client
+from app.utils.structured_logging import bind_correlation_id, configure_logging
+
+def result_row(row_number: int, analyzed_lead) -> dict:
+    # Only what the answers and the scoring code decide; ids and timestamps differ per DB
+    lead_score = analyzed_lead.lead_score
+    verification_result = analyzed_lead.verification_result
+    return {
+        "row": row_number,
+        "email": analyzed_lead.lead_input.email,
+        "score": lead_score.score,
+        "category": lead_score.category,
+        "queue": analyzed_lead.routing_decision.queue,
+        "verification_status": verification_result.status.value if verification_result else None,
+        "score_breakdown": lead_score.score_breakdown,
+        "risk_flags": lead_score.risk_flags,
+    }
+
+async def run_corpus(path: str, fmt: ImportFormat, concurrency: int) -> list:
+    # Dedup depends on what is already in the database, so it would make runs order-dependent
+    settings_db = (await settings_cache.get_async()).model_copy(update={"dedup_enabled": False})
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze(row_number: int, row: dict, error: str) -> dict:
+        if error:
+            return {"row": row_number, "error": error}
+        async with semaphore:
+            with bind_correlation_id(f"replay.{row_number}"):
+                try:
+                    analyzed_lead = await lead_pipeline.analyze(LeadInput(**row), settings_db)
+                except (InvalidLeadError, ValueError) as e:
+                    return {"row": row_number, "error": str(e)}
+        return result_row(row_number, analyzed_lead)
+
+    with open(path, "rb") as stream:
+        results = await asyncio.gather(*(analyze(*item) for item in iter_rows(stream, fmt)))
+    await gemini_client.aclose()
+    return sorted(results, key=lambda result: result["row"])
+
+def digest(results: list) -> str:
+    hasher = hashlib.sha256()
+    for result in results:
+        hasher.update(json.dumps(result, sort_keys=True).encode("utf-8"))
+        hasher.update(b"\n")
+    return hasher.hexdigest()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the analysis pipeline over a corpus without saving leads.")
+    parser.add_argument("path", help="CSV or NDJSON corpus.")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="Defaults from the file extension.")
+    parser.add_argument("--concurrency", type=int, default=settings.bulk_import_concurrency)
+    parser.add_argument("--output", help="Write per-lead results here as NDJSON.")
+    parser.add_argument("--expect-digest", help="Exit with status 1 if the results digest differs.")
+    args = parser.parse_args()
+
+    fmt = ImportFormat(args.format) if args.format else ImportFormat.from_filename(args.path)
+    configure_logging()
+    init_db()
+    started = time.perf_counter()
+    results = asyncio.run(run_corpus(args.path, fmt, args.concurrency))
+    elapsed = time.perf_counter() - started
+
+    if args.output:
+        with open(args.output, "w") as output:
+            for result in results:
+                output.write(json.dumps(result) + "\n")
+
+    summary = {
+        "leads": len(results),
+        "errors": sum(1 for result in results if "error" in result),
+        "seconds": round(elapsed, 3),
+        "digest": digest(results),
+        "cassette": gemini_client.cassette.get_stats(),
+    }
+    print(json.dumps(summary), file=sys.stderr)
+    if args.expect_digest and summary["digest"] != args.expect_digest:
+        print(f"Digest mismatch: expected {args.expect_digest}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
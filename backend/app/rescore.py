@@ -0,0 +1,61 @@
+"""
+Re-scores every stored lead under a scoring weight profile, without calling Gemini.
+
+Dry run by default: prints how scores, categories and queues would shift.
+--apply writes the new scores (and their stats rollup moves); --activate also
+makes the profile the one new leads are scored with (done first, so leads
+analyzed during the run are not left on the old weights).
+
+    python -m app.rescore --profile 3
+    python -m app.rescore --profile 3 --activate --apply
+"""
+import argparse
+import json
+import sys
+from sqlmodel import Session
+from app.config import settings
+from app.db.database import engine
+from app.db.init_db import init_db
+from app.services.rescoring import lead_rescorer, RescoreUnavailableError
+from app.services.scoring_profiles import scoring_profile_service
+from app.services.settings_cache import settings_cache
+from app.utils.structured_logging import configure_logging
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score stored leads under a scoring weight profile.")
+    parser.add_argument("--profile", type=int, help="ScoringProfile id (default: the active profile).")
+    parser.add_argument("--builtin", action="store_true", help="Use the built-in weights instead of a profile.")
+    parser.add_argument("--apply", action="store_true", help="Write the new scores (default: dry run).")
+    parser.add_argument("--activate", action="store_true", help="Also score new leads with this profile from now on.")
+    parser.add_argument("--chunk-size", type=int, default=settings.rescore_chunk_size)
+    args = parser.parse_args()
+
+    try:
+        lead_rescorer.check_available()
+    except RescoreUnavailableError as e:
+        parser.error(str(e))
+    if args.profile is not None and args.builtin:
+        parser.error("--profile and --builtin are mutually exclusive.")
+
+    configure_logging()
+    init_db()
+    if args.builtin:
+        profile_id = None
+    elif args.profile is not None:
+        profile_id = args.profile
+        with Session(engine) as session:
+            if scoring_profile_service.get(session, profile_id) is None:
+                parser.error(f"Scoring profile {profile_id} does not exist.")
+    else:
+        profile_id = settings_cache.get().scoring_profile_id
+
+    if args.activate:
+        with Session(engine) as session:
+            scoring_profile_service.activate(session, profile_id)
+
+    report = lead_rescorer.rescore(scoring_profile_service.get_weights(profile_id), apply=args.apply, chunk_size=args.chunk_size)
+    print(json.dumps({"profile_id": profile_id, **report}, indent=2))
+    print(f"{'Re-scored' if args.apply else 'Would re-score'} {report['changed']} of {report['leads']} leads in {report['seconds']}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
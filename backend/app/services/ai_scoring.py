@@ -1,6 +1,16 @@
 from app.models.lead import LeadInput, BANTAnalysis, LeadScore, EnrichmentData, VerificationResult, LeadVerificationStatus
+from app.models.scoring import ScoringWeights, DEFAULT_SCORING_WEIGHTS
+from app.services.verification import verification_service
+from app.services.settings_cache import settings_cache
 from app.utils.gemini_client import gemini_client
+from app.utils.structured_logging import SAMPLED
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Lowest score of each category, best first
+CATEGORY_BANDS = [(90, "Exceptional"), (80, "High Confidence"), (60, "Strong"), (40, "Moderate"), (0, "Low Confidence")]
 
 class AIScoringService:
     """
@@ -8,53 +18,90 @@ class AIScoringService:
     Now implements the FULL Multi-Factor Scoring Framework.
     """
 
-    def score_lead(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult) -> (BANTAnalysis, LeadScore):
+    def score_lead(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (BANTAnalysis, LeadScore):
         """
         Analyzes and scores a lead using the Gemini AI model.
         """
-        # Fetch selected model from DB
-        from app.db.database import get_session
-        from app.models.settings import Settings
-        from sqlmodel import select
-        
-        with next(get_session()) as session:
-            settings_db = session.exec(select(Settings)).first()
-            selected_model = settings_db.selected_model if settings_db else "gemini-2.5-flash"
-
-        prompt = self._build_prompt(lead_input, enrichment_data, verification_result)
+        selected_model = settings_cache.get().selected_model
+        prompt = self._build_prompt(lead_input, enrichment_data, verification_result, weights)
         
         try:
             # Get the structured JSON response from Gemini
             ai_response = gemini_client.generate_json_response(prompt, model_name=selected_model)
-            
-            # Parse the AI response into our Pydantic models
-            bant_analysis = BANTAnalysis(**ai_response.get("bant_analysis", {}))
-            
-            # Extract the AI's dimensional analysis
-            score_dimensions = ai_response.get("score_dimensions", {})
-            risk_flags = ai_response.get("risk_flags", [])
-            follow_up_questions = ai_response.get("follow_up_questions", [])
-            explanation = ai_response.get("explanation", "No explanation provided.")
-
-            # Calculate the final weighted score Python-side for precision
-            final_score, score_breakdown = self._calculate_weighted_score(score_dimensions, risk_flags, verification_result)
-            
-            lead_score = LeadScore(
-                score=final_score,
-                category=self._score_to_category(final_score),
-                explanation=explanation,
-                score_breakdown=score_breakdown,
-                risk_flags=risk_flags,
-                follow_up_questions=follow_up_questions
-            )
-            
-            return bant_analysis, lead_score
+            return self._parse_scoring_response(ai_response, verification_result, weights)
 
         except (json.JSONDecodeError, TypeError, KeyError) as e:
-            print(f"Failed to parse AI response: {e}")
+            logger.warning("[AIScoringService] Failed to parse AI response: %s", e)
             return self._get_fallback_scoring()
 
-    def _build_prompt(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult) -> str:
+    async def score_lead_async(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult, model_name: str = None, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (BANTAnalysis, LeadScore):
+        """
+        Async variant of score_lead; the Gemini call runs off the event loop.
+        `model_name` overrides the model selected in Settings (used by the pipeline and the cascade),
+        `weights` is the active scoring profile.
+        """
+        selected_model = model_name or (await settings_cache.get_async()).selected_model
+        prompt = self._build_prompt(lead_input, enrichment_data, verification_result, weights)
+
+        try:
+            ai_response = await gemini_client.generate_json_response_async(prompt, model_name=selected_model, stage="scoring")
+            return self._parse_scoring_response(ai_response, verification_result, weights)
+
+        except (json.JSONDecodeError, TypeError, KeyError) as e:
+            logger.warning("[AIScoringService] Failed to parse AI response: %s", e)
+            return self._get_fallback_scoring()
+
+    async def score_lead_fused_async(self, lead_input: LeadInput, enrichment_data: EnrichmentData, model_name: str = None, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (VerificationResult, BANTAnalysis, LeadScore):
+        """
+        Fused pipeline mode: one search-grounded call returns both the verification
+        fields and the scoring JSON. The weighted score and fraud override are
+        still computed Python-side from the returned dimensions.
+        """
+        selected_model = model_name or (await settings_cache.get_async()).selected_model
+        prompt = self._build_fused_prompt(lead_input, enrichment_data, weights)
+
+        try:
+            logger.info("🕵️‍♂️ [AIScoringService] Fused verify+score: %s %s at %s", lead_input.first_name, lead_input.last_name, lead_input.company_name, extra=SAMPLED)
+            ai_response = await gemini_client.generate_json_response_async(prompt, model_name=selected_model, use_search=True, stage="fused")
+            verification_result = verification_service._parse_verification_response(ai_response)
+            bant_analysis, lead_score = self._parse_scoring_response(ai_response, verification_result, weights)
+            return verification_result, bant_analysis, lead_score
+
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            logger.warning("[AIScoringService] Failed to parse fused AI response: %s", e)
+            return (verification_service._get_fallback_verification(), *self._get_fallback_scoring())
+
+    def _parse_scoring_response(self, ai_response: dict, verification_result: VerificationResult, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (BANTAnalysis, LeadScore):
+        # Parse the AI response into our Pydantic models
+        bant_analysis = BANTAnalysis(**ai_response.get("bant_analysis", {}))
+        
+        # Extract the AI's dimensional analysis
+        score_dimensions = ai_response.get("score_dimensions", {})
+        risk_flags = ai_response.get("risk_flags", [])
+        follow_up_questions = ai_response.get("follow_up_questions", [])
+        explanation = ai_response.get("explanation", "No explanation provided.")
+
+        lead_score = self.build_lead_score(score_dimensions, risk_flags, verification_result, explanation, follow_up_questions, weights)
+        return bant_analysis, lead_score
+
+    def build_lead_score(self, score_dimensions: dict, risk_flags: list, verification_result: VerificationResult, explanation: str, follow_up_questions: list = None, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> LeadScore:
+        """
+        Turns dimension scores into a LeadScore (weighted score, fraud override, category).
+        Shared by the AI path and the deterministic fast path.
+        """
+        # Calculate the final weighted score Python-side for precision
+        final_score, score_breakdown = self._calculate_weighted_score(score_dimensions, risk_flags, verification_result, weights)
+        
+        return LeadScore(
+            score=final_score,
+            category=self._score_to_category(final_score),
+            explanation=explanation,
+            score_breakdown=score_breakdown,
+            risk_flags=risk_flags,
+            follow_up_questions=follow_up_questions or []
+        )
+
+    def _build_prompt(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> str:
         return f"""
         You are an Expert Lead Qualification Agent. Your goal is to score sales leads using a STRICT Multi-Factor Scoring Framework.
         
@@ -77,38 +124,89 @@ class AIScoringService:
         - Size: {enrichment_data.company_info.get('size', 'N/A') if enrichment_data.company_info else 'N/A'}
         - Website: {enrichment_data.company_info.get('website', 'N/A') if enrichment_data.company_info else 'N/A'}
 
+        {self._build_scoring_framework(weights)}
+        {self._build_scoring_output_format()}
+        """
+
+    def _build_fused_prompt(self, lead_input: LeadInput, enrichment_data: EnrichmentData, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> str:
+        return f"""
+        You are an Expert Lead Verification and Qualification Agent. Complete BOTH parts below in a single pass
+        and return ONE JSON object that contains the fields of both parts.
+
+        ===== PART 1: VERIFICATION =====
+        {verification_service._build_verification_instructions(lead_input, enrichment_data)}
+
+        ===== PART 2: SCORING =====
+        Score the lead using your PART 1 findings as the verification context
+        (wherever the instructions mention "Pre-computed" status or intent signals, use your own PART 1 results).
+
+        **Enriched Company Data:**
+        - Industry: {enrichment_data.company_info.get('industry', 'N/A') if enrichment_data.company_info else 'N/A'}
+        - Size: {enrichment_data.company_info.get('size', 'N/A') if enrichment_data.company_info else 'N/A'}
+        - Website: {enrichment_data.company_info.get('website', 'N/A') if enrichment_data.company_info else 'N/A'}
+
+        {self._build_scoring_framework(weights)}
+
+        **Output Format (JSON):**
+        {{
+            "verification_status": "Verified Decision Maker" | "Verified Employee" | "Unverified" | "Likely Fake",
+            "verification_score": <int>,
+            "authority_tier": "Tier 1" | "Tier 2" | "Tier 3" | "Tier 4" | "Unknown",
+            "identity_verified": <bool>,
+            "employment_verified": <bool>,
+            "verification_reason": "<Short explanation>",
+            "intent_signal": "Strong" | "Weak" | "None",
+            "intent_evidence": "<Short evidence or link>",
+            "bant_analysis": {{ "budget": "...", "authority": "...", "need": "...", "timeline": "..." }},
+            "score_dimensions": {{
+                "authenticity": <int 0-100>,
+                "authority": <int 0-100>,
+                "budget_realism": <int 0-100>,
+                "requirement_clarity": <int 0-100>,
+                "organizational_footprint": <int 0-100>,
+                "intent_signals": <int 0-100>
+            }},
+            "risk_flags": ["List", "of", "risks", "found"],
+            "follow_up_questions": ["Question 1", "Question 2", "Question 3", "Question 4", "Question 5"],
+            "explanation": "Brief summary of why this score was given."
+        }}
+        """
+
+    def _build_scoring_framework(self, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> str:
+        # The weights shown are the active profile's, the ones _calculate_weighted_score applies
+        return f"""
         **SCORING INSTRUCTIONS (Multi-Factor Model):**
         Evaluate the lead on these 6 dimensions (0-100 scale for each):
 
-        1. **Authenticity (Weight: 30%)**: 
+        1. **Authenticity (Weight: {weights.authenticity:.0%})**: 
            - Is the person real? Do they work there? 
            - Used Pre-computed Verification Status.
            - Score 100 if "Verified Decision Maker" or "Verified Employee".
            - Score 50 if "Unverified" but looks plausible (not obviously fake).
            - Score 0 ONLY if "Likely Fake".
 
-        2. **Authority (Weight: 20%)**:
+        2. **Authority (Weight: {weights.authority:.0%})**:
            - Do they have buying power? 
            - 100 for Tier 1 (CXO), 80 for Tier 2 (Director/VP), 50 for Tier 3 (Manager), 20 for Individual Contributor.
 
-        3. **Budget Realism (Weight: 10%)**:
+        3. **Budget Realism (Weight: {weights.budget:.0%})**:
            - Does the implied/stated budget match the company size? 
            - High score (80-100) if budget is clear and realistic.
            - Mid score (50) if budget is realistic but vague.
            - Low score (0-30) if unrealistic (e.g. $1M from a 1-person shop or $500 from a big corp).
 
-        4. **Requirement Clarity (Weight: 10%)**:
+        4. **Requirement Clarity (Weight: {weights.clarity:.0%})**:
            - How specific is the request? 
            - High score (80-100) for specific details (tech stack, timeline). 
            - Low score (20-40) for "Hi, info please".
 
-        5. **Organizational Footprint (Weight: 10%)**:
+        5. **Organizational Footprint (Weight: {weights.footprint:.0%})**:
            - Company maturity/size. 
            - High score (80-100) for established/large companies. 
            - Mid score (50-70) for legitimate SMEs. 
            - Low score (20-40) for unknowns/startups.
 
-        6. **Intent Signals (Weight: 20%)**:
+        6. **Intent Signals (Weight: {weights.intent:.0%})**:
            - Is there evidence of need? 
            - Used Pre-computed Intent Signal.
            - Score 100 for "Strong Signal" (News/Reports).
@@ -132,34 +230,39 @@ class AIScoringService:
         - DO NOT ask about "long-term spending increases" beyond the initial scope yet.
         - Focus on VALIDATING the current request, not expanding it immediately.
 
+        """
+
+    def _build_scoring_output_format(self) -> str:
+        return """
         **Output Format (JSON):**
-        {{
-            "bant_analysis": {{ "budget": "...", "authority": "...", "need": "...", "timeline": "..." }},
-            "score_dimensions": {{
+        {
+            "bant_analysis": { "budget": "...", "authority": "...", "need": "...", "timeline": "..." },
+            "score_dimensions": {
                 "authenticity": <int 0-100>,
                 "authority": <int 0-100>,
                 "budget_realism": <int 0-100>,
                 "requirement_clarity": <int 0-100>,
                 "organizational_footprint": <int 0-100>,
                 "intent_signals": <int 0-100>
-            }},
+            },
             "risk_flags": ["List", "of", "risks", "found"],
             "follow_up_questions": ["Question 1", "Question 2", "Question 3", "Question 4", "Question 5"],
             "explanation": "Brief summary of why this score was given."
-        }}
+        }
         """
 
-    def _calculate_weighted_score(self, dimensions: dict, risk_flags: list, verification_result: VerificationResult) -> (int, dict):
+    def _calculate_weighted_score(self, dimensions: dict, risk_flags: list, verification_result: VerificationResult, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (int, dict):
         """
         Calculates the weighted final score based on the 6 dimensions and applies modifiers.
+        LeadRescorer repeats this computation over arrays; keep the two in step.
         """
-        # Weights
-        W_AUTHENTICITY = 0.30
-        W_AUTHORITY = 0.20
-        W_BUDGET = 0.10
-        W_CLARITY = 0.10
-        W_FOOTPRINT = 0.10
-        W_INTENT = 0.20
+        # Weights (from the active scoring profile)
+        W_AUTHENTICITY = weights.authenticity
+        W_AUTHORITY = weights.authority
+        W_BUDGET = weights.budget
+        W_CLARITY = weights.clarity
+        W_FOOTPRINT = weights.footprint
+        W_INTENT = weights.intent
 
         # Extract scores (safely default to 0 if missing)
         s_auth = dimensions.get("authenticity", 0)
@@ -180,8 +283,8 @@ class AIScoringService:
         )
 
         # 2. Risk Penalties
-        # Apply -10 for each risk flag found
-        penalty = len(risk_flags) * 10
+        # Apply -10 (by default) for each risk flag found
+        penalty = len(risk_flags) * weights.risk_flag_penalty
         
         final_score = base_score - penalty
 
@@ -193,7 +296,7 @@ class AIScoringService:
             # 4. Baseline Score Rule
             # "No lead should score 0 unless it is explicitely fraudulent"
             # "Introduce a minimum baseline score (e.g., 20) for any non-fraudulent, coherent inquiry."
-            final_score = max(final_score, 20)
+            final_score = max(final_score, weights.baseline_score)
 
         final_score = int(round(final_score))
         final_score = min(max(final_score, 0), 100)
@@ -217,17 +320,10 @@ class AIScoringService:
         # 60-79: Strong lead, pursue actively
         # 40-59: Moderate lead, needs qualification
         # 20-39: Low confidence, early-stage
-        
-        if score >= 90:
-            return "Exceptional"
-        elif score >= 80:
-            return "High Confidence"
-        elif score >= 60:
-            return "Strong"
-        elif score >= 40:
-            return "Moderate"
-        else:
-            return "Low Confidence"
+        for lowest_score, category in CATEGORY_BANDS:
+            if score >= lowest_score:
+                return category
+        return CATEGORY_BANDS[-1][1]
 
     def _get_fallback_scoring(self) -> (BANTAnalysis, LeadScore):
         """
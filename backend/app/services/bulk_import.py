@@ -0,0 +1,200 @@
+from app.models.lead import LeadInput, Lead, AnalyzedLead
+from app.services.pipeline import lead_pipeline
+from app.services.settings_cache import settings_cache
+from app.services.webhook_outbox import webhook_outbox
+from app.db.database import engine
+from app.utils.structured_logging import bind_correlation_id, child_correlation_id
+from enum import Enum
+from typing import AsyncIterator, BinaryIO, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlmodel import Session
+import asyncio
+import csv
+import io
+import json
+import time
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @classmethod
+    def from_filename(cls, filename: Optional[str]) -> "ImportFormat":
+        name = (filename or "").lower()
+        if name.endswith((".ndjson", ".jsonl", ".json")):
+            return cls.NDJSON
+        return cls.CSV
+
+def iter_rows(stream: BinaryIO, fmt: ImportFormat) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Lazily parses an uploaded file, one row at a time.
+    Yields (row_number, row, error) where exactly one of row / error is set.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == ImportFormat.CSV:
+            for row_number, row in enumerate(csv.DictReader(text), start=1):
+                yield row_number, {k.strip(): (v or "").strip() for k, v in row.items() if k}, None
+        else:
+            row_number = 0
+            for line in text:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield row_number, None, f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(row, dict):
+                    yield row_number, None, "Each line must be a JSON object."
+                    continue
+                yield row_number, row, None
+    finally:
+        # Don't let the wrapper close the underlying upload
+        text.detach()
+
+class BulkImporter:
+    """
+    Pushes a stream of rows through the analysis pipeline with bounded concurrency
+    and persists results in batches. Yields progress events as it goes.
+    """
+
+    # Rows pulled from the (blocking) file iterator per thread hop
+    READ_CHUNK = 100
+
+    async def run(
+        self,
+        rows: Iterator[Tuple[int, Optional[dict], Optional[str]]],
+        concurrency: int,
+        batch_size: int,
+        progress_every: int = 25,
+    ) -> AsyncIterator[dict]:
+        settings_db = await settings_cache.get_async()
+        events: asyncio.Queue = asyncio.Queue()
+        # Bounded so the reader never gets far ahead of the analysis workers
+        pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        # (row, analysis) pairs; the analysis is the webhook payload
+        batch: List[Tuple[Lead, AnalyzedLead]] = []
+        batch_lock = asyncio.Lock()
+        counters = {"processed": 0, "succeeded": 0, "failed": 0, "saved": 0}
+        started = time.monotonic()
+
+        def progress() -> dict:
+            elapsed = time.monotonic() - started
+            return {
+                "type": "progress",
+                **counters,
+                "elapsed_seconds": round(elapsed, 2),
+                "rows_per_second": round(counters["processed"] / elapsed, 2) if elapsed else 0.0,
+            }
+
+        async def row_done(event: dict):
+            counters["processed"] += 1
+            counters["succeeded" if event["status"] == "ok" else "failed"] += 1
+            await events.put(event)
+            if counters["processed"] % progress_every == 0:
+                await events.put(progress())
+
+        async def flush(force: bool = False):
+            async with batch_lock:
+                if not batch or (len(batch) < batch_size and not force):
+                    return
+                to_save = batch[:]
+                batch.clear()
+            emails = [lead.email for lead, _ in to_save]
+            try:
+                lead_ids = await asyncio.to_thread(self._save_batch, to_save, settings_db.webhook_url)
+                counters["saved"] += len(lead_ids)
+                await events.put({"type": "batch", "saved": len(lead_ids), "lead_ids": lead_ids})
+            except Exception as e:
+                await events.put({"type": "batch", "saved": 0, "error": str(e), "emails": emails})
+
+        async def reader():
+            iterator = iter(rows)
+            while True:
+                chunk = await asyncio.to_thread(self._read_chunk, iterator)
+                for item in chunk:
+                    await pending.put(item)
+                if len(chunk) < self.READ_CHUNK:
+                    break
+            for _ in range(concurrency):
+                await pending.put(None)
+
+        async def worker():
+            while True:
+                item = await pending.get()
+                if item is None:
+                    return
+                row_number, row, error = item
+                if error:
+                    await row_done({"type": "row", "row": row_number, "status": "error", "error": error})
+                    continue
+                try:
+                    lead_input = LeadInput(**row)
+                except ValidationError as e:
+                    await row_done({"type": "row", "row": row_number, "status": "error", "error": self._format_validation_error(e)})
+                    continue
+                try:
+                    with bind_correlation_id(child_correlation_id(row_number)):
+                        analyzed_lead = await lead_pipeline.analyze(lead_input, settings_db)
+                except Exception as e:
+                    await row_done({"type": "row", "row": row_number, "status": "error", "email": lead_input.email, "error": str(e)})
+                    continue
+
+                async with batch_lock:
+                    batch.append((lead_pipeline.build_lead(analyzed_lead), analyzed_lead))
+                await row_done({
+                    "type": "row",
+                    "row": row_number,
+                    "status": "ok",
+                    "email": lead_input.email,
+                    "score": analyzed_lead.lead_score.score,
+                    "category": analyzed_lead.lead_score.category,
+                    "queue": analyzed_lead.routing_decision.queue,
+                })
+                await flush()
+
+        async def supervise():
+            try:
+                await asyncio.gather(reader(), *[worker() for _ in range(concurrency)])
+                await flush(force=True)
+            finally:
+                await events.put(None)
+
+        supervisor = asyncio.create_task(supervise())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await supervisor
+            yield {**progress(), "type": "summary"}
+        finally:
+            supervisor.cancel()
+
+    def _read_chunk(self, iterator: Iterator) -> list:
+        chunk = []
+        for item in iterator:
+            chunk.append(item)
+            if len(chunk) >= self.READ_CHUNK:
+                break
+        return chunk
+
+    def _save_batch(self, items: List[Tuple[Lead, AnalyzedLead]], webhook_url: Optional[str]) -> List[int]:
+        leads = [lead for lead, _ in items]
+        with Session(engine) as session:
+            session.add_all(leads)
+            session.flush()
+            if webhook_url:
+                # Outgoing webhooks commit (or roll back) together with their leads, as in POST /analyze
+                session.add_all(webhook_outbox.entry(webhook_url, lead.id, analyzed_lead) for lead, analyzed_lead in items)
+            lead_ids = [lead.id for lead in leads]
+            session.commit()
+            return lead_ids
+
+    def _format_validation_error(self, error: ValidationError) -> str:
+        return "; ".join(f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in error.errors())
+
+bulk_importer = BulkImporter()
@@ -0,0 +1,76 @@
+from app.models.lead import LeadInput, EnrichmentData, VerificationResult, LeadVerificationStatus, BANTAnalysis, LeadScore
+from app.models.settings import SettingsSnapshot
+from app.models.scoring import ScoringWeights, DEFAULT_SCORING_WEIGHTS
+from app.services.ai_scoring import ai_scoring_service
+from typing import Optional
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ScoringCascade:
+    """
+    Cheap-model triage: every lead is scored by the fast model (Settings.selected_model);
+    only borderline leads - final score inside the uncertainty band, or an
+    Unverified verification - are re-scored by Settings.escalation_model.
+    """
+
+    FAST_TIER = "fast"
+    ESCALATION_TIER = "escalation"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tiers = {}
+        self._escalations = {"uncertainty_band": 0, "unverified": 0}
+
+    def escalation_reason(self, lead_score: LeadScore, verification_result: VerificationResult, settings_db: Optional[SettingsSnapshot]) -> Optional[str]:
+        if not settings_db or not settings_db.cascade_enabled:
+            return None
+        if verification_result.status == LeadVerificationStatus.UNVERIFIED:
+            return "unverified"
+        if settings_db.cascade_band_low <= lead_score.score <= settings_db.cascade_band_high:
+            return "uncertainty_band"
+        return None
+
+    async def escalate(self, lead_input: LeadInput, enrichment_data: EnrichmentData, verification_result: VerificationResult, settings_db: SettingsSnapshot, reason: str, weights: ScoringWeights = DEFAULT_SCORING_WEIGHTS) -> (BANTAnalysis, LeadScore):
+        """
+        Re-scores a lead with the escalation model, reusing the verification result.
+        """
+        logger.info("⬆️ [ScoringCascade] Escalating %s to %s (%s)", lead_input.email, settings_db.escalation_model, reason)
+        with self._lock:
+            self._escalations[reason] += 1
+        started = time.perf_counter()
+        result = await ai_scoring_service.score_lead_async(lead_input, enrichment_data, verification_result, model_name=settings_db.escalation_model, weights=weights)
+        self.record_call(self.ESCALATION_TIER, settings_db.escalation_model, time.perf_counter() - started)
+        return result
+
+    def record_call(self, tier: str, model: str, seconds: float):
+        with self._lock:
+            stats = self._tiers.setdefault(tier, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "models": {}})
+            stats["calls"] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["models"][model] = stats["models"].get(model, 0) + 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            tiers = {
+                tier: {
+                    "calls": s["calls"],
+                    "avg_seconds": round(s["total_seconds"] / s["calls"], 3) if s["calls"] else 0.0,
+                    "max_seconds": round(s["max_seconds"], 3),
+                    "models": dict(s["models"]),
+                }
+                for tier, s in self._tiers.items()
+            }
+            escalations = dict(self._escalations)
+        fast_calls = tiers.get(self.FAST_TIER, {}).get("calls", 0)
+        escalated = sum(escalations.values())
+        return {
+            "tiers": tiers,
+            "escalations": escalations,
+            "escalation_rate": round(escalated / fast_calls, 4) if fast_calls else 0.0,
+        }
+
+scoring_cascade = ScoringCascade()
@@ -0,0 +1,164 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.company import Company
+from app.models.lead import Lead
+from app.services.fast_path import FREEMAIL_DOMAINS
+from datetime import datetime, timedelta
+from typing import Callable, Awaitable, Iterable, List, Optional
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, select
+import asyncio
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Second-level registries under country TLDs ("acme.co.uk" is a root domain, "co.uk" is not)
+MULTI_PART_SUFFIXES = {
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "com.au", "net.au", "org.au", "co.nz", "co.in", "net.in",
+    "org.in", "co.jp", "ne.jp", "com.br", "com.cn", "com.mx", "com.sg", "com.hk", "co.za", "co.kr",
+}
+
+def root_domain(domain: str) -> str:
+    """
+    Registrable domain of an email domain: "mail.eu.acme.com" -> "acme.com".
+    """
+    labels = [label for label in (domain or "").strip().lower().rstrip(".").split(".") if label]
+    if len(labels) >= 3 and ".".join(labels[-2:]) in MULTI_PART_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+class CompanyService:
+    """
+    Company rows keyed by root domain, shared by every lead from that domain.
+    Enrichment reads a known company with one indexed lookup; stale rows keep
+    being served until the background refresher re-enriches them.
+    """
+
+    def __init__(self, stale_after: timedelta, refresh_lease: timedelta):
+        self.stale_after = stale_after
+        self.refresh_lease = refresh_lease
+
+    def is_company_domain(self, domain: str) -> bool:
+        # Personal mailboxes say nothing about the employer
+        return bool(domain) and "." in domain and domain not in FREEMAIL_DOMAINS
+
+    def get(self, domain: str) -> Optional[Company]:
+        with Session(engine) as session:
+            return session.exec(select(Company).where(Company.domain == domain)).first()
+
+    async def get_async(self, domain: str) -> Optional[Company]:
+        return await asyncio.to_thread(self.get, domain)
+
+    def upsert(self, domain: str, company_name: str, company_info: dict, enriched_at: Optional[datetime] = None) -> Company:
+        """
+        Stores enrichment for a domain and pushes its refresh date out.
+        `enriched_at` is when the info was fetched (now by default); older data is due for refresh sooner.
+        """
+        enriched_at = enriched_at or datetime.utcnow()
+        values = dict(
+            name=company_info.get("company_name") or company_name,
+            company_info=copy.deepcopy(company_info),
+            company_logo_url=company_info.get("company_logo_url"),
+            enriched_at=enriched_at,
+            refresh_after=enriched_at + self.stale_after,
+        )
+        with Session(engine) as session:
+            company = session.exec(select(Company).where(Company.domain == domain)).first()
+            if company is None:
+                company = Company(domain=domain, **values)
+            else:
+                for field, value in values.items():
+                    setattr(company, field, value)
+            session.add(company)
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another worker created the same domain concurrently; theirs is just as fresh
+                session.rollback()
+                company = session.exec(select(Company).where(Company.domain == domain)).one()
+            session.refresh(company)
+            return company
+
+    async def upsert_async(self, domain: str, company_name: str, company_info: dict) -> Company:
+        return await asyncio.to_thread(self.upsert, domain, company_name, company_info)
+
+    def attach(self, session: Session, leads: Iterable[Lead]):
+        """
+        Fills company_info / company_logo_url of leads that point at a Company,
+        in one query and without marking the leads as modified.
+        """
+        leads = [lead for lead in leads if lead.company_id and lead.company_info is None]
+        if not leads:
+            return
+        company_ids = {lead.company_id for lead in leads}
+        companies = {company.id: company for company in session.exec(select(Company).where(Company.id.in_(company_ids))).all()}
+        for lead in leads:
+            company = companies.get(lead.company_id)
+            if company is None:
+                continue
+            set_committed_value(lead, "company_info", company.company_info)
+            if lead.company_logo_url is None:
+                set_committed_value(lead, "company_logo_url", company.company_logo_url)
+
+    def logo_column(self):
+        """
+        Lead logo with the company's as fallback; needs an outer join on Company.
+        """
+        return func.coalesce(Lead.company_logo_url, Company.company_logo_url).label("company_logo_url")
+
+    def claim_stale(self, batch_size: int) -> List[Company]:
+        """
+        Claims up to `batch_size` stale companies by moving their refresh date
+        one lease ahead, so concurrent refreshers never pick the same row.
+        If a refresh fails, the row becomes claimable again when the lease ends.
+        """
+        now = datetime.utcnow()
+        claimed = []
+        with Session(engine) as session:
+            candidates = session.exec(
+                select(Company.id, Company.refresh_after)
+                .where(Company.refresh_after <= now)
+                .order_by(Company.refresh_after)
+                .limit(batch_size)
+            ).all()
+            for company_id, refresh_after in candidates:
+                result = session.execute(
+                    update(Company)
+                    .where(Company.id == company_id, Company.refresh_after == refresh_after)
+                    .values(refresh_after=now + self.refresh_lease)
+                )
+                if result.rowcount == 1:
+                    claimed.append(company_id)
+            session.commit()
+            if not claimed:
+                return []
+            return list(session.exec(select(Company).where(Company.id.in_(claimed))).all())
+
+    async def refresh_stale(self, enrich: Callable[[str, str], Awaitable[Optional[dict]]], batch_size: int) -> int:
+        """
+        Re-enriches one batch of stale companies concurrently. `enrich(company_name, domain)`
+        returns fresh company info, or None to leave the row for a later attempt.
+        """
+        companies = await asyncio.to_thread(self.claim_stale, batch_size)
+
+        async def refresh(company: Company) -> bool:
+            try:
+                company_info = await enrich(company.name, company.domain)
+            except Exception as e:
+                logger.warning("[CompanyService] Refresh failed for %s: %s", company.domain, e)
+                return False
+            if company_info is None:
+                return False
+            await self.upsert_async(company.domain, company.name, company_info)
+            return True
+
+        results = await asyncio.gather(*(refresh(company) for company in companies))
+        return sum(results)
+
+company_service = CompanyService(
+    stale_after=timedelta(hours=settings.company_stale_after_hours),
+    refresh_lease=timedelta(seconds=settings.company_refresh_lease_seconds),
+)
@@ -0,0 +1,296 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.dedup import LeadLshBucket
+from app.models.lead import Lead, LeadInput
+from app.services.company import company_service
+from app.services.settings_cache import settings_cache
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import delete, event, exists, tuple_, update
+from sqlmodel import Session, select
+import asyncio
+import hashlib
+import random
+import re
+import threading
+import zlib
+
+# Providers that ignore dots in the local part
+DOTLESS_DOMAINS = {"gmail.com", "googlemail.com"}
+
+SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def normalize_email(email: str) -> str:
+    """
+    Canonical form of an address for exact duplicate matching:
+    lowercased, "+tag" suffix dropped, Gmail dots removed.
+    """
+    local, _, domain = email.strip().lower().partition("@")
+    local = local.split("+", 1)[0]
+    if domain == "googlemail.com":
+        domain = "gmail.com"
+    if domain in DOTLESS_DOMAINS:
+        local = local.replace(".", "")
+    return f"{local}@{domain}"
+
+def shingles(first_name: str, last_name: str, company_name: str, notes: str) -> Set[int]:
+    """
+    Word 3-gram shingles of the lead's identity and inquiry, hashed with crc32
+    (stable across processes, unlike hash()).
+    """
+    words = re.findall(r"\w+", f"{first_name} {last_name} {company_name} {notes}".lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class MinHasher:
+    """
+    MinHash signatures and LSH band buckets over shingle sets.
+    With `bands` bands of `num_perm / bands` rows, pairs above roughly
+    (1 / bands) ** (bands / num_perm) Jaccard similarity become candidates.
+    """
+
+    def __init__(self, num_perm: int, bands: int, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Iterable[int]) -> List[int]:
+        values = list(shingle_set)
+        if not values:
+            return []
+        return [
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in values)
+            for a, b in self._permutations
+        ]
+
+    def buckets(self, signature: List[int]) -> List[str]:
+        """
+        One bucket id per band: a short digest of that band's rows.
+        """
+        result = []
+        for band in range(self.bands if signature else 0):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(",".join(map(str, rows)).encode("ascii"), digest_size=8)
+            result.append(digest.hexdigest())
+        return result
+
+class DuplicateMatch:
+    """
+    A stored lead whose analysis can be reused for a new submission.
+    """
+
+    def __init__(self, lead: Lead, match_type: str, similarity: float):
+        self.lead = lead
+        self.match_type = match_type
+        self.similarity = similarity
+
+    @property
+    def original_id(self) -> int:
+        # Always link to the first lead of a duplicate chain
+        return self.lead.duplicate_of_id or self.lead.id
+
+class DedupService:
+    """
+    Finds a recent lead that a new submission duplicates, before any Gemini call:
+    1. exact match on the normalized email;
+    2. near-duplicate (name, company, notes) through MinHash LSH buckets,
+       confirmed by exact Jaccard similarity of the shingles.
+    Only leads inside the freshness window that were analyzed (not settled by
+    the fast path) are reused.
+    """
+
+    EMAIL = "email"
+    NEAR_DUPLICATE = "near_duplicate"
+
+    def __init__(
+        self,
+        window_hours: float = settings.dedup_window_hours,
+        threshold: float = settings.dedup_similarity_threshold,
+        num_perm: int = settings.dedup_num_perm,
+        bands: int = settings.dedup_bands,
+        max_candidates: int = settings.dedup_max_candidates,
+    ):
+        self.window = timedelta(hours=window_hours)
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.hasher = MinHasher(num_perm, bands)
+        self._lock = threading.Lock()
+        self._stats = {"checked": 0, "email_matches": 0, "near_duplicate_matches": 0}
+
+    def find_match(self, lead_input: LeadInput) -> Optional[DuplicateMatch]:
+        cutoff = datetime.utcnow() - self.window
+        with Session(engine) as session:
+            match = self._match_email(session, lead_input, cutoff) or self._match_near_duplicate(session, lead_input, cutoff)
+            if match:
+                company_service.attach(session, [match.lead])
+        self._record(match)
+        return match
+
+    async def find_match_async(self, lead_input: LeadInput) -> Optional[DuplicateMatch]:
+        return await asyncio.to_thread(self.find_match, lead_input)
+
+    def lead_buckets(self, lead: Lead) -> List[str]:
+        return self.hasher.buckets(self.hasher.signature(
+            shingles(lead.first_name, lead.last_name, lead.company_name, lead.notes)
+        ))
+
+    def backfill_emails(self, batch_size: int = 1000) -> int:
+        """
+        Fills Lead.email_normalized for leads saved before the column existed,
+        so exact email matching also finds them.
+        """
+        updated = 0
+        with Session(engine) as session:
+            while True:
+                rows = session.exec(
+                    select(Lead.id, Lead.email)
+                    .where(Lead.email_normalized.is_(None))
+                    .order_by(Lead.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                session.execute(update(Lead), [dict(id=lead_id, email_normalized=normalize_email(email)) for lead_id, email in rows])
+                session.commit()
+                updated += len(rows)
+        return updated
+
+    def index_recent_leads(self, batch_size: int = 500) -> int:
+        """
+        Writes LSH buckets for the leads inside the freshness window that have none:
+        leads saved while dedup was disabled, or before it existed. Only those can
+        ever be matched, so older leads are not indexed.
+        Returns the number of leads indexed.
+        """
+        cutoff = datetime.utcnow() - self.window
+        indexed = 0
+        last_id = 0
+        with Session(engine) as session:
+            while True:
+                leads = session.exec(
+                    select(Lead)
+                    .where(
+                        Lead.id > last_id,
+                        Lead.created_at >= cutoff,
+                        Lead.fast_path_rule.is_(None),
+                        ~exists().where(LeadLshBucket.lead_id == Lead.id),
+                    )
+                    .order_by(Lead.id)
+                    .limit(batch_size)
+                ).all()
+                if not leads:
+                    break
+                rows = [row for lead in leads for row in _bucket_rows(lead)]
+                if rows:
+                    session.execute(LeadLshBucket.__table__.insert(), rows)
+                session.commit()
+                indexed += len(leads)
+                last_id = leads[-1].id
+        return indexed
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            checked = self._stats["checked"]
+            matched = self._stats["email_matches"] + self._stats["near_duplicate_matches"]
+            return {
+                **self._stats,
+                "match_rate": round(matched / checked, 3) if checked else 0.0,
+                "window_hours": self.window.total_seconds() / 3600,
+                "threshold": self.threshold,
+            }
+
+    def _match_email(self, session: Session, lead_input: LeadInput, cutoff: datetime) -> Optional[DuplicateMatch]:
+        lead = session.exec(
+            select(Lead)
+            .where(
+                Lead.email_normalized == normalize_email(lead_input.email),
+                Lead.created_at >= cutoff,
+                Lead.fast_path_rule.is_(None),
+            )
+            .order_by(Lead.created_at.desc())
+            .limit(1)
+        ).first()
+        return DuplicateMatch(lead, self.EMAIL, 1.0) if lead else None
+
+    def _match_near_duplicate(self, session: Session, lead_input: LeadInput, cutoff: datetime) -> Optional[DuplicateMatch]:
+        shingle_set = shingles(lead_input.first_name, lead_input.last_name, lead_input.company_name, lead_input.notes)
+        buckets = self.hasher.buckets(self.hasher.signature(shingle_set))
+        if not buckets:
+            return None
+
+        candidate_ids = session.exec(
+            select(LeadLshBucket.lead_id)
+            .where(
+                tuple_(LeadLshBucket.band, LeadLshBucket.bucket).in_(list(enumerate(buckets))),
+                LeadLshBucket.created_at >= cutoff,
+            )
+            .distinct()
+            .limit(self.max_candidates)
+        ).all()
+        if not candidate_ids:
+            return None
+
+        candidates = session.exec(
+            select(Lead).where(Lead.id.in_(candidate_ids), Lead.fast_path_rule.is_(None))
+        ).all()
+        best, best_similarity = None, 0.0
+        for candidate in candidates:
+            similarity = jaccard(shingle_set, shingles(candidate.first_name, candidate.last_name, candidate.company_name, candidate.notes))
+            if similarity > best_similarity or (similarity == best_similarity and best and candidate.created_at > best.created_at):
+                best, best_similarity = candidate, similarity
+        if best is None or best_similarity < self.threshold:
+            return None
+        return DuplicateMatch(best, self.NEAR_DUPLICATE, round(best_similarity, 3))
+
+    def _record(self, match: Optional[DuplicateMatch]):
+        with self._lock:
+            self._stats["checked"] += 1
+            if match:
+                self._stats[f"{match.match_type}_matches"] += 1
+
+dedup_service = DedupService()
+
+# --- LSH index maintenance (runs inside the transaction that saves/deletes the lead) ---
+
+def _bucket_rows(lead: Lead) -> List[dict]:
+    created_at = lead.created_at or datetime.utcnow()
+    return [
+        dict(lead_id=lead.id, band=band, bucket=bucket, created_at=created_at)
+        for band, bucket in enumerate(dedup_service.lead_buckets(lead))
+    ]
+
+@event.listens_for(Lead, "after_insert")
+def _on_lead_insert(mapper, connection, lead: Lead):
+    # Shingling costs CPU and a row per band; skipped while dedup is off (the cached
+    # snapshot is used, a flush must not query the settings). index_recent_leads()
+    # catches up when it is turned on.
+    snapshot = settings_cache.peek()
+    if snapshot is None or not snapshot.dedup_enabled:
+        return
+    rows = _bucket_rows(lead)
+    if rows:
+        connection.execute(LeadLshBucket.__table__.insert(), rows)
+
+@event.listens_for(Lead, "before_delete")
+def _on_lead_delete(mapper, connection, lead: Lead):
+    connection.execute(delete(LeadLshBucket.__table__).where(LeadLshBucket.__table__.c.lead_id == lead.id))
+    # Duplicates of a deleted lead stay, unlinked
+    lead_table = Lead.__table__
+    connection.execute(update(lead_table).where(lead_table.c.duplicate_of_id == lead.id).values(duplicate_of_id=None))
@@ -1,6 +1,14 @@
 from app.models.lead import EnrichmentData
+from app.services.enrichment_cache import enrichment_cache
+from app.services.company import company_service, root_domain
 from app.utils.gemini_client import gemini_client
+from app.config import settings
+from app.utils.structured_logging import SAMPLED
+from typing import Optional
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 class EnrichmentService:
     """
@@ -13,9 +21,36 @@ class EnrichmentService:
         Enriches lead data with company information and email validation.
         """
         is_valid_email = self._validate_email(email)
-        company_info = self._enrich_company_info(company_name, email) if is_valid_email else None
+        company_info, company_id = self._enrich_company_info(company_name, email) if is_valid_email else (None, None)
         
+        return self._build_enrichment_data(company_info, is_valid_email, company_id)
+
+    async def enrich_lead_async(self, company_name: str, email: str) -> EnrichmentData:
+        """
+        Async variant of enrich_lead; does not block the event loop while Gemini searches.
+        """
+        is_valid_email = self._validate_email(email)
+        company_info, company_id = await self._enrich_company_info_async(company_name, email) if is_valid_email else (None, None)
+
+        return self._build_enrichment_data(company_info, is_valid_email, company_id)
+
+    async def refresh_company_info_async(self, company_name: str, domain: str) -> Optional[dict]:
+        """
+        Fresh company details for the background refresher; None if Gemini fails,
+        so stale-but-real data is never replaced by the fallback.
+        """
+        _, fallback_logo_url = self._domain_and_fallback_logo(f"@{domain}")
+        try:
+            logger.info("🔄 [EnrichmentService] Refreshing company: %s (%s)", company_name, domain)
+            result = await gemini_client.generate_json_response_async(self._build_company_prompt(company_name, domain), use_search=True, stage="enrichment")
+            return self._apply_logo_fallback(result, fallback_logo_url)
+        except Exception as e:
+            logger.warning("❌ [EnrichmentService] Refresh failed for %s: %s", domain, e)
+            return None
+
+    def _build_enrichment_data(self, company_info: dict, is_valid_email: bool, company_id: Optional[int] = None) -> EnrichmentData:
         return EnrichmentData(
+            company_id=company_id,
             company_info=company_info,
             email_valid=is_valid_email,
             company_logo_url=company_info.get("company_logo_url") if company_info else None,
@@ -30,20 +65,91 @@ class EnrichmentService:
             return False
         return True
 
-    def _enrich_company_info(self, company_name: str, email: str) -> dict:
+    def _enrich_company_info(self, company_name: str, email: str) -> (dict, Optional[int]):
         """
-        Uses Gemini to get company details.
+        Uses Gemini to get company details. Returns (company_info, company_id);
+        company_id is set when the details live in the shared Company table.
         """
         # Fetch status of search enrichment from settings potentially, but forcing for now as per user request
+        domain, fallback_logo_url = self._domain_and_fallback_logo(email)
+
+        company_domain = root_domain(domain)
+        if company_service.is_company_domain(company_domain):
+            company = company_service.get(company_domain)
+            if company is not None:
+                logger.info("⚡ [EnrichmentService] Known company: %s (%s)", company.name, company_domain, extra=SAMPLED)
+                return company.company_info, company.id
+
+        if settings.enrichment_cache_enabled:
+            cached = enrichment_cache.get(domain, company_name)
+            if cached is not None:
+                logger.info("⚡ [EnrichmentService] Cache hit for: %s (%s)", company_name, domain, extra=SAMPLED)
+                return cached, None
+
+        prompt = self._build_company_prompt(company_name, domain)
         
+        try:
+            logger.info("🔍 [EnrichmentService] Searching Google for: %s", company_name, extra=SAMPLED)
+            # Use JSON response method with search enabled
+            result = gemini_client.generate_json_response(prompt, use_search=True)
+            logger.debug("✅ [EnrichmentService] Search Result: %s", result)
+            result = self._apply_logo_fallback(result, fallback_logo_url)
+            if company_service.is_company_domain(company_domain):
+                return result, company_service.upsert(company_domain, company_name, result).id
+            if settings.enrichment_cache_enabled:
+                enrichment_cache.set(domain, company_name, result)
+            return result, None
+        except Exception as e:
+            logger.warning("❌ [EnrichmentService] Enrichment failed: %s", e)
+            return self._get_fallback_company_info(company_name, fallback_logo_url), None
+
+    async def _enrich_company_info_async(self, company_name: str, email: str) -> (dict, Optional[int]):
+        """
+        Async variant of _enrich_company_info.
+        """
+        domain, fallback_logo_url = self._domain_and_fallback_logo(email)
+
+        company_domain = root_domain(domain)
+        if company_service.is_company_domain(company_domain):
+            company = await company_service.get_async(company_domain)
+            if company is not None:
+                logger.info("⚡ [EnrichmentService] Known company: %s (%s)", company.name, company_domain, extra=SAMPLED)
+                return company.company_info, company.id
+
+        if settings.enrichment_cache_enabled:
+            cached = await enrichment_cache.get_async(domain, company_name)
+            if cached is not None:
+                logger.info("⚡ [EnrichmentService] Cache hit for: %s (%s)", company_name, domain, extra=SAMPLED)
+                return cached, None
+
+        prompt = self._build_company_prompt(company_name, domain)
+
+        try:
+            logger.info("🔍 [EnrichmentService] Searching Google for: %s", company_name, extra=SAMPLED)
+            result = await gemini_client.generate_json_response_async(prompt, use_search=True, stage="enrichment")
+            logger.debug("✅ [EnrichmentService] Search Result: %s", result)
+            result = self._apply_logo_fallback(result, fallback_logo_url)
+            if company_service.is_company_domain(company_domain):
+                company = await company_service.upsert_async(company_domain, company_name, result)
+                return result, company.id
+            if settings.enrichment_cache_enabled:
+                await enrichment_cache.set_async(domain, company_name, result)
+            return result, None
+        except Exception as e:
+            logger.warning("❌ [EnrichmentService] Enrichment failed: %s", e)
+            return self._get_fallback_company_info(company_name, fallback_logo_url), None
+
+    def _domain_and_fallback_logo(self, email: str) -> (str, str):
         # Extract domain from email if possible for better search
         domain = email.split('@')[-1] if email and "@" in email else ""
         
         # Determine fallback logo URL
         # Switched to Google Favicons as Clearbit was reported unreachable
         fallback_logo_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=128" if domain else None
-        
-        prompt = f"""
+        return domain, fallback_logo_url
+
+    def _build_company_prompt(self, company_name: str, domain: str) -> str:
+        return f"""
         You are a data enrichment bot with access to Google Search.
         Use Google Search to find the latest information about the company "{company_name}" (Domain: {domain}).
         Also try to find a URL for their official logo and a generic profile image placeholder or the CEO's image if relevant.
@@ -58,32 +164,26 @@ class EnrichmentService:
         
         Return ONLY valid JSON.
         """
-        
-        try:
-            print(f"🔍 [EnrichmentService] Searching Google for: {company_name}")
-            # Use JSON response method with search enabled
-            # Use JSON response method with search enabled
-            result = gemini_client.generate_json_response(prompt, use_search=True)
-            print(f"✅ [EnrichmentService] Search Result: {result}")
-            
-            # Fallback/Override for logo if Gemini returns nothing or a broken link (basic check)
-            if fallback_logo_url:
-                 # If Gemini didn't find one, or we want to trust Clearbit
-                 current_logo = result.get("company_logo_url")
-                 if not current_logo or "http" not in current_logo:
-                     result["company_logo_url"] = fallback_logo_url
-                     print(f"⚠️ [EnrichmentService] Used Google Favicon fallback for logo: {fallback_logo_url}")
-
-            return result
-        except Exception as e:
-            print(f"❌ [EnrichmentService] Enrichment failed: {e}")
-            return {
-                "company_name": company_name,
-                "industry": "Unknown",
-                "size": "Unknown",
-                "website": "Unknown",
-                "company_logo_url": fallback_logo_url,
-                "profile_image_url": None
-            }
+
+    def _apply_logo_fallback(self, result: dict, fallback_logo_url: str) -> dict:
+        # Fallback/Override for logo if Gemini returns nothing or a broken link (basic check)
+        if fallback_logo_url:
+             # If Gemini didn't find one, or we want to trust Clearbit
+             current_logo = result.get("company_logo_url")
+             if not current_logo or "http" not in current_logo:
+                 result["company_logo_url"] = fallback_logo_url
+                 logger.debug("⚠️ [EnrichmentService] Used Google Favicon fallback for logo: %s", fallback_logo_url)
+
+        return result
+
+    def _get_fallback_company_info(self, company_name: str, fallback_logo_url: str) -> dict:
+        return {
+            "company_name": company_name,
+            "industry": "Unknown",
+            "size": "Unknown",
+            "website": "Unknown",
+            "company_logo_url": fallback_logo_url,
+            "profile_image_url": None
+        }
 
 enrichment_service = EnrichmentService()
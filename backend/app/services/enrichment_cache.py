@@ -0,0 +1,200 @@
+from app.models.enrichment_cache import CompanyEnrichmentCache
+from app.db.database import engine
+from app.config import settings
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlmodel import Session
+from sqlalchemy import delete
+import asyncio
+import copy
+import re
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Legal suffixes dropped when normalizing company names ("Acme, Inc." == "acme")
+COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation",
+    "co", "company", "gmbh", "plc", "pvt", "private", "sa", "ag", "bv",
+}
+
+class EnrichmentCache:
+    """
+    Two-tier cache for company enrichment results.
+    An in-process LRU sits in front of the `company_enrichment_cache` table,
+    both keyed by normalized email domain + company name and bounded by a TTL.
+    """
+
+    def __init__(self, max_entries: int, ttl: timedelta):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lru: "OrderedDict[str, tuple]" = OrderedDict() # key -> (expires_at, company_info)
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    # --- Keys ---
+
+    @staticmethod
+    def normalize_domain(domain: str) -> str:
+        domain = (domain or "").strip().lower().rstrip(".")
+        if domain.startswith("www."):
+            domain = domain[4:]
+        return domain
+
+    @staticmethod
+    def normalize_company_name(company_name: str) -> str:
+        words = re.sub(r"[^a-z0-9 ]+", " ", (company_name or "").lower()).split()
+        while words and words[-1] in COMPANY_SUFFIXES:
+            words.pop()
+        return " ".join(words)
+
+    def make_key(self, domain: str, company_name: str) -> str:
+        return f"{self.normalize_domain(domain)}|{self.normalize_company_name(company_name)}"
+
+    # --- Lookups ---
+
+    def get(self, domain: str, company_name: str) -> Optional[dict]:
+        """
+        Returns a copy of the cached company info, or None on a miss.
+        """
+        key = self.make_key(domain, company_name)
+        cached = self._get_from_memory(key)
+        if cached is not None:
+            return cached
+        return self._get_from_db(key)
+
+    async def get_async(self, domain: str, company_name: str) -> Optional[dict]:
+        """
+        Async lookup; the memory tier is answered inline, only the DB tier goes to a thread.
+        """
+        key = self.make_key(domain, company_name)
+        cached = self._get_from_memory(key)
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self._get_from_db, key)
+
+    def _get_from_memory(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            expires_at, company_info = entry
+            if expires_at <= datetime.utcnow():
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return copy.deepcopy(company_info)
+
+    def _get_from_db(self, key: str) -> Optional[dict]:
+        try:
+            with Session(engine) as session:
+                row = session.get(CompanyEnrichmentCache, key)
+                if row is None or row.expires_at <= datetime.utcnow():
+                    with self._lock:
+                        self._stats["misses"] += 1
+                    return None
+                expires_at, company_info = row.expires_at, row.company_info
+        except Exception as e:
+            logger.warning("⚠️ [EnrichmentCache] DB lookup failed: %s", e)
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self._stats["db_hits"] += 1
+            self._put_in_memory(key, expires_at, company_info)
+        return copy.deepcopy(company_info)
+
+    # --- Writes ---
+
+    def set(self, domain: str, company_name: str, company_info: dict):
+        """
+        Stores company info in both tiers.
+        """
+        key = self.make_key(domain, company_name)
+        expires_at = datetime.utcnow() + self.ttl
+        company_info = copy.deepcopy(company_info)
+
+        with self._lock:
+            self._stats["writes"] += 1
+            self._put_in_memory(key, expires_at, company_info)
+
+        try:
+            with Session(engine) as session:
+                session.merge(CompanyEnrichmentCache(
+                    cache_key=key,
+                    domain=self.normalize_domain(domain),
+                    company_name=company_name,
+                    company_info=company_info,
+                    expires_at=expires_at,
+                ))
+                session.commit()
+        except Exception as e:
+            logger.warning("⚠️ [EnrichmentCache] DB write failed: %s", e)
+
+    async def set_async(self, domain: str, company_name: str, company_info: dict):
+        await asyncio.to_thread(self.set, domain, company_name, company_info)
+
+    def _put_in_memory(self, key: str, expires_at: datetime, company_info: dict):
+        # Caller holds self._lock
+        self._lru[key] = (expires_at, company_info)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # --- Maintenance ---
+
+    def invalidate(self, domain: Optional[str] = None, company_name: Optional[str] = None) -> int:
+        """
+        Drops cached entries. With no arguments the whole cache is cleared;
+        with a domain, every entry for that domain; with both, a single key.
+        Returns the number of persistent rows removed.
+        """
+        if domain is not None and company_name is not None:
+            key = self.make_key(domain, company_name)
+            matches = lambda k: k == key
+            statement = delete(CompanyEnrichmentCache).where(CompanyEnrichmentCache.cache_key == key)
+        elif domain is not None:
+            prefix = f"{self.normalize_domain(domain)}|"
+            matches = lambda k: k.startswith(prefix)
+            statement = delete(CompanyEnrichmentCache).where(CompanyEnrichmentCache.domain == self.normalize_domain(domain))
+        else:
+            matches = lambda k: True
+            statement = delete(CompanyEnrichmentCache)
+
+        with self._lock:
+            for key in [k for k in self._lru if matches(k)]:
+                del self._lru[key]
+
+        with Session(engine) as session:
+            result = session.execute(statement)
+            session.commit()
+            return result.rowcount
+
+    def purge_expired(self) -> int:
+        """
+        Deletes expired rows from the persistent tier.
+        """
+        with Session(engine) as session:
+            result = session.execute(delete(CompanyEnrichmentCache).where(CompanyEnrichmentCache.expires_at <= datetime.utcnow()))
+            session.commit()
+            return result.rowcount
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._lru)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_hours"] = self.ttl.total_seconds() / 3600
+        return stats
+
+enrichment_cache = EnrichmentCache(
+    max_entries=settings.enrichment_cache_max_entries,
+    ttl=timedelta(hours=settings.enrichment_cache_ttl_hours),
+)
@@ -0,0 +1,185 @@
+from app.models.lead import LeadInput, VerificationResult, LeadVerificationStatus, AuthorityTier, BANTAnalysis
+from app.utils.structured_logging import SAMPLED
+from typing import Dict, List, Optional
+import re
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Throwaway inbox providers; leads from these never reach sales
+DISPOSABLE_DOMAINS = {
+    "mailinator.com", "guerrillamail.com", "guerrillamail.net", "sharklasers.com", "10minutemail.com",
+    "tempmail.com", "temp-mail.org", "tempmailo.com", "yopmail.com", "trashmail.com", "getnada.com",
+    "dispostable.com", "maildrop.cc", "throwawaymail.com", "fakeinbox.com", "mintemail.com",
+    "mohmal.com", "emailondeck.com", "burnermail.io", "spamgourmet.com",
+}
+
+# Reserved / placeholder domains (RFC 2606) and obvious test mailboxes
+RESERVED_DOMAINS = {"example.com", "example.org", "example.net", "test.com", "localhost"}
+RESERVED_TLDS = (".test", ".example", ".invalid", ".localhost")
+TEST_LOCAL_PARTS = {"test", "testing", "asdf", "qwerty", "fake", "noreply", "no-reply", "donotreply", "null", "none"}
+
+FREEMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "yahoo.co.in", "yahoo.co.uk", "hotmail.com", "outlook.com",
+    "live.com", "msn.com", "aol.com", "icloud.com", "me.com", "protonmail.com", "proton.me", "gmx.com",
+    "gmx.de", "yandex.com", "mail.com", "zoho.com", "rediffmail.com",
+}
+
+# Large enterprises whose executives do not write in from personal mailboxes
+FORTUNE_500 = {
+    "walmart", "amazon", "apple", "unitedhealth group", "berkshire hathaway", "cvs health", "exxonmobil",
+    "alphabet", "google", "mckesson", "cencora", "costco", "jpmorgan chase", "microsoft", "cardinal health",
+    "chevron", "cigna", "ford motor", "ford", "bank of america", "general motors", "elevance health", "citigroup",
+    "centene", "home depot", "marathon petroleum", "kroger", "phillips 66", "fannie mae", "walgreens", "valero energy",
+    "meta", "meta platforms", "facebook", "verizon", "at&t", "comcast", "wells fargo", "goldman sachs", "freddie mac",
+    "target", "humana", "state farm", "tesla", "morgan stanley", "johnson & johnson", "archer daniels midland",
+    "pepsico", "united parcel service", "ups", "fedex", "walt disney", "disney", "dell technologies", "lowe's",
+    "procter & gamble", "energy transfer", "boeing", "albertsons", "sysco", "rtx", "general electric", "lockheed martin",
+    "american express", "caterpillar", "metlife", "hca healthcare", "progressive", "ibm", "john deere", "deere",
+    "nvidia", "stonex group", "merck", "conocophillips", "pfizer", "delta air lines", "tsmc", "intel", "oracle",
+    "cisco", "cisco systems", "coca-cola", "nike", "salesforce", "netflix", "qualcomm", "adobe", "hp", "abbvie",
+}
+
+EXECUTIVE_TITLE_PATTERN = re.compile(
+    r"\b(ceo|cto|cfo|coo|cmo|cio|ciso|chief [a-z]+ officer|founder|co-founder|president|chairman|managing director)\b",
+    re.IGNORECASE,
+)
+
+# Only content-free notes; terse but real inquiries ("Need pricing") still go to the model
+PLACEHOLDER_NOTES = {"", "test", "testing", "hi", "hello", "hey", "n/a", "na", "none", "asdf", "info", "-", "."}
+
+class FastPathDecision:
+    """
+    Outcome of a fast-path rule: everything the scorer needs to finish the lead without an LLM call.
+    """
+
+    def __init__(self, rule: str, verification_result: VerificationResult, score_dimensions: Dict[str, int], risk_flags: List[str], explanation: str, email_valid: bool = True):
+        self.rule = rule
+        self.verification_result = verification_result
+        self.score_dimensions = score_dimensions
+        self.risk_flags = risk_flags
+        self.explanation = explanation
+        self.email_valid = email_valid
+
+    def bant_analysis(self) -> BANTAnalysis:
+        note = f"Not analyzed: settled by fast-path rule '{self.rule}'."
+        return BANTAnalysis(budget=note, authority=note, need=note, timeline=note)
+
+class FastPathService:
+    """
+    Deterministic pre-LLM rules that settle obviously junk leads in milliseconds.
+    Rules run in order; the first that fires decides the lead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"evaluated": 0, "settled": 0, "rules": {}}
+
+    def evaluate(self, lead_input: LeadInput) -> Optional[FastPathDecision]:
+        email = lead_input.email.lower()
+        local_part, _, domain = email.partition("@")
+
+        decision = (
+            self._check_disposable_email(domain)
+            or self._check_invalid_email(local_part, domain)
+            or self._check_executive_impersonation(lead_input, domain)
+            or self._check_empty_notes(lead_input)
+        )
+
+        with self._lock:
+            self._stats["evaluated"] += 1
+            if decision:
+                self._stats["settled"] += 1
+                self._stats["rules"][decision.rule] = self._stats["rules"].get(decision.rule, 0) + 1
+        if decision:
+            logger.info("⚡ [FastPathService] %s settled by rule '%s'", lead_input.email, decision.rule, extra=SAMPLED)
+        return decision
+
+    # --- Rules ---
+
+    def _check_disposable_email(self, domain: str) -> Optional[FastPathDecision]:
+        if domain not in DISPOSABLE_DOMAINS:
+            return None
+        return self._fake_decision(
+            "disposable_email",
+            reason=f"Email uses the disposable inbox provider '{domain}'.",
+            risk_flag="Disposable Email Domain",
+            email_valid=False,
+        )
+
+    def _check_invalid_email(self, local_part: str, domain: str) -> Optional[FastPathDecision]:
+        if domain not in RESERVED_DOMAINS and not domain.endswith(RESERVED_TLDS) and local_part not in TEST_LOCAL_PARTS:
+            return None
+        return self._fake_decision(
+            "invalid_email",
+            reason="Email uses a reserved/placeholder domain or a test mailbox.",
+            risk_flag="Invalid Email Address",
+            email_valid=False,
+        )
+
+    def _check_executive_impersonation(self, lead_input: LeadInput, domain: str) -> Optional[FastPathDecision]:
+        if domain not in FREEMAIL_DOMAINS:
+            return None
+        company = re.sub(r"[,.]|\b(inc|corp|corporation|company|co|llc|ltd|plc)\b", "", lead_input.company_name.lower()).strip()
+        if company not in FORTUNE_500:
+            return None
+        title = EXECUTIVE_TITLE_PATTERN.search(lead_input.notes)
+        if not title:
+            return None
+        return self._fake_decision(
+            "freemail_executive_impersonation",
+            reason=f"Claims '{title.group(0)}' at {lead_input.company_name} from a personal {domain} address.",
+            risk_flag="Freemail Executive Claim",
+            authority_tier=AuthorityTier.TIER_1,
+        )
+
+    def _check_empty_notes(self, lead_input: LeadInput) -> Optional[FastPathDecision]:
+        if lead_input.notes.strip().lower() not in PLACEHOLDER_NOTES:
+            return None
+        return FastPathDecision(
+            rule="empty_notes",
+            verification_result=VerificationResult(
+                status=LeadVerificationStatus.UNVERIFIED,
+                score=0,
+                authority_tier=AuthorityTier.UNKNOWN,
+                identity_verified=False,
+                employment_verified=False,
+                reason="Skipped verification: the inquiry has no usable content.",
+                intent_signal="None",
+            ),
+            score_dimensions={
+                "authenticity": 50,
+                "authority": 20,
+                "budget_realism": 0,
+                "requirement_clarity": 0,
+                "organizational_footprint": 20,
+                "intent_signals": 20,
+            },
+            risk_flags=["Vague Requirements"],
+            explanation="The inquiry is empty or a placeholder, so there is nothing to qualify yet.",
+        )
+
+    def _fake_decision(self, rule: str, reason: str, risk_flag: str, authority_tier: AuthorityTier = AuthorityTier.UNKNOWN, email_valid: bool = True) -> FastPathDecision:
+        return FastPathDecision(
+            rule=rule,
+            verification_result=VerificationResult(
+                status=LeadVerificationStatus.LIKELY_FAKE,
+                score=0,
+                authority_tier=authority_tier,
+                identity_verified=False,
+                employment_verified=False,
+                reason=reason,
+                intent_signal="None",
+            ),
+            score_dimensions={},
+            risk_flags=[risk_flag],
+            explanation=f"Rejected without AI analysis: {reason}",
+            email_valid=email_valid,
+        )
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "rules": dict(self._stats["rules"])}
+
+fast_path_service = FastPathService()
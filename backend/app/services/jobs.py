@@ -0,0 +1,173 @@
+from app.models.job import AnalysisJob, AnalysisJobRead, JobStatus
+from app.models.lead import LeadInput, AnalyzedLead
+from app.services.pipeline import lead_pipeline
+from app.services.webhook_outbox import webhook_outbox
+from app.db.database import engine
+from app.config import settings
+from app.utils.metrics import pipeline_stage_seconds
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from sqlmodel import Session, select
+from sqlalchemy import update, or_
+import random
+
+class JobQueue:
+    """
+    Postgres-backed queue of analysis jobs.
+    Any number of worker processes can claim from it concurrently.
+    """
+
+    def enqueue(self, session: Session, lead_input: LeadInput) -> AnalysisJob:
+        job = AnalysisJob(lead_input=lead_input.model_dump(mode="json"))
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+    def to_read(self, job: AnalysisJob) -> AnalysisJobRead:
+        data = job.model_dump(exclude={"lead_input", "result", "worker_id"})
+        return AnalysisJobRead(**data, result=AnalyzedLead(**job.result) if job.result else None)
+
+    def claim(self, worker_id: str) -> Optional[Tuple[str, LeadInput, int]]:
+        """
+        Atomically claims the oldest queued job that is due. Concurrent workers skip rows
+        locked by each other instead of blocking on them.
+        Returns (job_id, lead_input, attempts) or None when the queue is empty.
+        """
+        with Session(engine) as session:
+            job = session.exec(
+                select(AnalysisJob)
+                .where(
+                    AnalysisJob.status == JobStatus.QUEUED.value,
+                    or_(AnalysisJob.not_before.is_(None), AnalysisJob.not_before <= datetime.utcnow()),
+                )
+                .order_by(AnalysisJob.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if job is None:
+                return None
+
+            # Conditional update keeps the claim atomic on backends without row locks (e.g. SQLite)
+            claimed = session.execute(
+                update(AnalysisJob)
+                .where(AnalysisJob.id == job.id, AnalysisJob.status == JobStatus.QUEUED.value)
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    started_at=datetime.utcnow(),
+                    attempts=AnalysisJob.attempts + 1,
+                    worker_id=worker_id,
+                )
+            )
+            session.commit()
+            if claimed.rowcount != 1:
+                return None
+            return job.id, LeadInput(**job.lead_input), job.attempts
+
+    def _owned(self, job_id: str, worker_id: str, attempts: int):
+        """
+        Fence for writes by the worker running a job: it still owns the claim only
+        if nobody re-queued and re-claimed the job in the meantime.
+        """
+        return update(AnalysisJob).where(
+            AnalysisJob.id == job_id,
+            AnalysisJob.status == JobStatus.RUNNING.value,
+            AnalysisJob.worker_id == worker_id,
+            AnalysisJob.attempts == attempts,
+        )
+
+    def complete(self, job_id: str, worker_id: str, attempts: int, analyzed_lead: AnalyzedLead, webhook_url: Optional[str] = None) -> Optional[int]:
+        """
+        Saves the lead, queues its webhook (if configured) and marks the job
+        succeeded in the same transaction.
+        Returns the lead id, or None (nothing saved) when the claim was lost to another worker.
+        """
+        with pipeline_stage_seconds.time(stage="db_commit"), Session(engine) as session:
+            db_lead = lead_pipeline.build_lead(analyzed_lead)
+            session.add(db_lead)
+            session.flush()
+            if webhook_url:
+                session.add(webhook_outbox.entry(webhook_url, db_lead.id, analyzed_lead))
+
+            completed = session.execute(
+                self._owned(job_id, worker_id, attempts).values(
+                    status=JobStatus.SUCCEEDED.value,
+                    result=analyzed_lead.model_dump(mode="json"),
+                    lead_id=db_lead.id,
+                    error=None,
+                    error_code=None,
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            if completed.rowcount != 1:
+                session.rollback()
+                return None
+            session.commit()
+            return db_lead.id
+
+    def fail(self, job_id: str, worker_id: str, attempts: int, error: str, error_code: int = 500) -> bool:
+        with Session(engine) as session:
+            failed = session.execute(
+                self._owned(job_id, worker_id, attempts).values(
+                    status=JobStatus.FAILED.value,
+                    error=error,
+                    error_code=error_code,
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            session.commit()
+            return failed.rowcount == 1
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter before a re-queued job may be claimed again."""
+        delay = min(settings.job_retry_base_seconds * 2 ** (attempts - 1), settings.job_retry_max_seconds)
+        return delay * random.uniform(0.8, 1.2)
+
+    def requeue(self, job_id: str, worker_id: str, attempts: int, error: str) -> bool:
+        """
+        Puts a job back in the queue after a transient failure (e.g. rate limit),
+        not to be claimed again before its backoff delay has passed.
+        """
+        with Session(engine) as session:
+            requeued = session.execute(
+                self._owned(job_id, worker_id, attempts).values(
+                    status=JobStatus.QUEUED.value,
+                    error=error,
+                    worker_id=None,
+                    not_before=datetime.utcnow() + timedelta(seconds=self.retry_delay(attempts)),
+                )
+            )
+            session.commit()
+            return requeued.rowcount == 1
+
+    def requeue_stale(self, visibility_timeout: timedelta, max_attempts: int = settings.job_max_attempts) -> Tuple[int, int]:
+        """
+        Re-queues running jobs whose worker has disappeared. A job that has already
+        been claimed `max_attempts` times is failed instead, so a lead that keeps
+        killing its worker (OOM, crash on a bad payload) is not retried forever.
+        Returns (requeued, failed).
+        """
+        cutoff = datetime.utcnow() - visibility_timeout
+        requeued = failed = 0
+        with Session(engine) as session:
+            stale = session.exec(
+                select(AnalysisJob)
+                .where(AnalysisJob.status == JobStatus.RUNNING.value, AnalysisJob.started_at < cutoff)
+                .with_for_update(skip_locked=True)
+            ).all()
+            for job in stale:
+                if job.attempts >= max_attempts:
+                    job.status = JobStatus.FAILED.value
+                    job.error = f"Worker lost the job on each of {job.attempts} attempts."
+                    job.error_code = 500
+                    job.finished_at = datetime.utcnow()
+                    failed += 1
+                else:
+                    job.status = JobStatus.QUEUED.value
+                    requeued += 1
+                job.worker_id = None
+                session.add(job)
+            session.commit()
+            return requeued, failed
+
+job_queue = JobQueue()
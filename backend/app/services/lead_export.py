@@ -0,0 +1,217 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.company import Company
+from app.models.lead import Lead
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Iterator, List, Optional
+from sqlalchemy import JSON, Boolean, DateTime, Integer, func, select
+import csv
+import io
+import json
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.CSV: "text/csv",
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+class ExportUnavailableError(RuntimeError):
+    """Raised when an export format needs an optional dependency that is not installed."""
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that hands out what was written so far, so a
+    Parquet writer can be streamed one row group at a time.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+class LeadExporter:
+    """
+    Streams leads out of the database for warehouse loads.
+
+    Rows are read through a server-side cursor (`stream_results` + `yield_per`)
+    as plain column tuples, never ORM objects, so memory stays flat no matter how
+    big the table is. Exports are incremental: rows with `since < created_at <= until`
+    are returned, where `until` is fixed when the export starts and should be
+    passed as `since` next time.
+
+    created_at is stamped by the application before the row commits, so a lead
+    can become visible with a created_at older than the newest one already
+    exported. `until` therefore stays `watermark_lag` behind the clock: any lead
+    committed within that long of being stamped is picked up by the next export.
+    """
+
+    def __init__(self, watermark_lag: timedelta):
+        self.watermark_lag = watermark_lag
+
+    def columns(self) -> list:
+        # Every lead column, with company details filled in from the shared Company row
+        columns = []
+        for column in Lead.__table__.columns:
+            if column.name == "company_info":
+                columns.append(func.coalesce(Lead.company_info, Company.company_info).label("company_info"))
+            elif column.name == "company_logo_url":
+                columns.append(func.coalesce(Lead.company_logo_url, Company.company_logo_url).label("company_logo_url"))
+            else:
+                columns.append(column)
+        return columns
+
+    def watermark(self) -> Optional[datetime]:
+        """
+        Upper bound for an export starting now: the newest created_at that is at
+        least `watermark_lag` old.
+        """
+        cutoff = datetime.utcnow() - self.watermark_lag
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(Lead.created_at)).where(Lead.created_at <= cutoff)).scalar()
+
+    def iter_rows(self, since: Optional[datetime], until: Optional[datetime], batch_size: int) -> Iterator[dict]:
+        if until is None:
+            return
+        statement = (
+            select(*self.columns())
+            .select_from(Lead)
+            .outerjoin(Company, Company.id == Lead.company_id)
+            .where(Lead.created_at <= until)
+            .order_by(Lead.created_at, Lead.id)
+        )
+        if since is not None:
+            statement = statement.where(Lead.created_at > since)
+
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(statement)
+            for partition in result.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
+
+    def stream(self, fmt: ExportFormat, since: Optional[datetime], until: Optional[datetime], batch_size: int) -> Iterator[bytes]:
+        if fmt == ExportFormat.CSV:
+            return self._stream_csv(since, until, batch_size)
+        if fmt == ExportFormat.NDJSON:
+            return self._stream_ndjson(since, until, batch_size)
+        return self._stream_parquet(since, until, batch_size)
+
+    def check_available(self, fmt: ExportFormat):
+        if fmt == ExportFormat.PARQUET:
+            try:
+                import pyarrow # noqa: F401
+            except ImportError:
+                raise ExportUnavailableError("Parquet export needs pyarrow (pip install pyarrow).")
+
+    # --- Formats ---
+
+    def _stream_csv(self, since, until, batch_size) -> Iterator[bytes]:
+        names = [column.name for column in self.columns()]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        for count, row in enumerate(self.iter_rows(since, until, batch_size), start=1):
+            writer.writerow([self._to_text(row[name]) for name in names])
+            if count % batch_size == 0:
+                yield self._drain_text(buffer)
+        yield self._drain_text(buffer)
+
+    def _stream_ndjson(self, since, until, batch_size) -> Iterator[bytes]:
+        lines = []
+        for row in self.iter_rows(since, until, batch_size):
+            lines.append(json.dumps(row, default=self._json_default))
+            if len(lines) >= batch_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _stream_parquet(self, since, until, batch_size) -> Iterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = self._arrow_schema(pa)
+        json_columns = {column.name for column in Lead.__table__.columns if isinstance(column.type, JSON)}
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+
+        def write_row_group(rows):
+            data = {
+                field.name: [json.dumps(row[field.name]) if field.name in json_columns and row[field.name] is not None else row[field.name] for row in rows]
+                for field in schema
+            }
+            writer.write_table(pa.Table.from_pydict(data, schema=schema), row_group_size=len(rows))
+
+        rows = []
+        for row in self.iter_rows(since, until, batch_size):
+            rows.append(row)
+            if len(rows) >= batch_size:
+                write_row_group(rows)
+                rows = []
+                yield sink.drain()
+        if rows:
+            write_row_group(rows)
+        writer.close()
+        yield sink.drain()
+
+    def _arrow_schema(self, pa):
+        fields = []
+        for column in Lead.__table__.columns:
+            if isinstance(column.type, Boolean):
+                arrow_type = pa.bool_()
+            elif isinstance(column.type, Integer):
+                arrow_type = pa.int64()
+            elif isinstance(column.type, DateTime):
+                arrow_type = pa.timestamp("us")
+            else:
+                # Strings, and JSON columns as JSON text
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields)
+
+    # --- Helpers ---
+
+    def _to_text(self, value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value)
+
+    def _json_default(self, value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value)
+
+    def _drain_text(self, buffer: io.StringIO) -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+lead_exporter = LeadExporter(watermark_lag=timedelta(seconds=settings.export_watermark_lag_seconds))
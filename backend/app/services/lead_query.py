@@ -0,0 +1,136 @@
+from app.models.lead import Lead, LeadSummary
+from app.models.company import Company
+from app.services.company import company_service
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import exists, func, or_, select as sa_select, tuple_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Session, select
+import base64
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+def summary_columns() -> list:
+    """
+    LeadSummary columns; the logo falls back to the lead's Company (outer join required).
+    """
+    return [
+        company_service.logo_column() if name == "company_logo_url" else getattr(Lead, name)
+        for name in LeadSummary.model_fields
+    ]
+
+class LeadFilters:
+    """
+    Server-side filters for lead listings.
+    """
+
+    def __init__(
+        self,
+        category: Optional[str] = None,
+        queue: Optional[str] = None,
+        verification_status: Optional[str] = None,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        risk_flags: Optional[List[str]] = None,
+        industry: Optional[str] = None,
+        min_company_size: Optional[int] = None,
+    ):
+        self.category = category
+        self.queue = queue
+        self.verification_status = verification_status
+        self.min_score = min_score
+        self.max_score = max_score
+        self.created_after = created_after
+        self.created_before = created_before
+        self.risk_flags = risk_flags or []
+        self.industry = industry
+        self.min_company_size = min_company_size
+
+    def apply(self, statement, dialect_name: str):
+        if self.category is not None:
+            statement = statement.where(Lead.category == self.category)
+        if self.queue is not None:
+            statement = statement.where(Lead.queue == self.queue)
+        if self.verification_status is not None:
+            statement = statement.where(Lead.verification_status == self.verification_status)
+        if self.min_score is not None:
+            statement = statement.where(Lead.score >= self.min_score)
+        if self.max_score is not None:
+            statement = statement.where(Lead.score <= self.max_score)
+        if self.created_after is not None:
+            statement = statement.where(Lead.created_at >= self.created_after)
+        if self.created_before is not None:
+            statement = statement.where(Lead.created_at < self.created_before)
+        if self.min_company_size is not None:
+            statement = statement.where(Lead.company_size_min >= self.min_company_size)
+        if self.risk_flags or self.industry:
+            statement = self._apply_json(statement, dialect_name)
+        return statement
+
+    def _apply_json(self, statement, dialect_name: str):
+        if dialect_name == "postgresql":
+            # @> containment, served by the jsonb_path_ops GIN indexes
+            if self.risk_flags:
+                statement = statement.where(type_coerce(Lead.risk_flags, JSONB).contains(self.risk_flags))
+            if self.industry:
+                industry = {"industry": self.industry}
+                statement = statement.where(or_(
+                    type_coerce(Lead.company_info, JSONB).contains(industry),
+                    Lead.company_id.in_(sa_select(Company.id).where(type_coerce(Company.company_info, JSONB).contains(industry))),
+                ))
+            return statement
+
+        # SQLite (local development): same semantics through the JSON1 functions, without an index
+        for flag in self.risk_flags:
+            flags = func.json_each(Lead.risk_flags).table_valued("value")
+            statement = statement.where(exists(sa_select(flags.c.value).where(flags.c.value == flag)))
+        if self.industry:
+            statement = statement.where(or_(
+                func.json_extract(Lead.company_info, "$.industry") == self.industry,
+                Lead.company_id.in_(sa_select(Company.id).where(func.json_extract(Company.company_info, "$.industry") == self.industry)),
+            ))
+        return statement
+
+class LeadQueryService:
+    """
+    Keyset (cursor) pagination over leads, newest first, ordered by (created_at, id).
+    Page cost stays constant no matter how deep the client pages.
+    """
+
+    def encode_cursor(self, created_at: datetime, lead_id: int) -> str:
+        raw = f"{created_at.isoformat()}|{lead_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> Tuple[datetime, int]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, lead_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+            return datetime.fromisoformat(created_at), int(lead_id)
+        except Exception:
+            raise InvalidCursorError("Invalid cursor.")
+
+    def list_leads(self, session: Session, filters: LeadFilters, limit: int, cursor: Optional[str] = None, summary: bool = False) -> Tuple[List, Optional[str]]:
+        """
+        Returns (page, next_cursor). next_cursor is None on the last page.
+        """
+        statement = select(*summary_columns()).outerjoin(Company, Company.id == Lead.company_id) if summary else select(Lead)
+        statement = filters.apply(statement, session.get_bind().dialect.name)
+        if cursor:
+            created_at, lead_id = self.decode_cursor(cursor)
+            statement = statement.where(tuple_(Lead.created_at, Lead.id) < tuple_(created_at, lead_id))
+        statement = statement.order_by(Lead.created_at.desc(), Lead.id.desc()).limit(limit + 1)
+
+        rows = session.exec(statement).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        page = [LeadSummary(**row._mapping) for row in rows] if summary else list(rows)
+        if not summary:
+            company_service.attach(session, page)
+
+        next_cursor = self.encode_cursor(page[-1].created_at, page[-1].id) if has_more and page else None
+        return page, next_cursor
+
+lead_query_service = LeadQueryService()
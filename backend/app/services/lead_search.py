@@ -0,0 +1,128 @@
+from app.models.lead import Lead, LeadSummary, LeadSearchHit, LeadSearchResults
+from app.models.company import Company
+from app.services.lead_query import LeadFilters, summary_columns
+from typing import Dict, List
+from sqlalchemy import and_, case, func, literal_column, or_
+from sqlmodel import Session, select
+import re
+
+# Text search configuration and the weighted document: notes > need analysis > explanation
+SEARCH_CONFIG = "english"
+SEARCH_FIELDS = {"notes": "A", "need_analysis": "B", "explanation": "C"}
+SEARCH_VECTOR_SQL = " || ".join(
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({field}, '')), '{weight}')"
+    for field, weight in SEARCH_FIELDS.items()
+)
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+class LeadSearchService:
+    """
+    Ranked full-text search over lead notes, need analysis and explanation.
+
+    On Postgres this runs against the generated `lead.search_vector` tsvector
+    column and its GIN index (created by init_db). Other databases fall back to
+    case-insensitive substring matching, good enough for local development.
+    """
+
+    SNIPPET_RADIUS = 60
+
+    def search(self, session: Session, query: str, filters: LeadFilters, limit: int, offset: int = 0) -> LeadSearchResults:
+        dialect_name = session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            hits = self._search_postgres(session, query, filters, limit + 1, offset)
+        else:
+            hits = self._search_fallback(session, query, filters, limit + 1, offset, dialect_name)
+        has_more = len(hits) > limit
+        return LeadSearchResults(
+            query=query,
+            results=hits[:limit],
+            next_offset=offset + limit if has_more else None,
+        )
+
+    def _search_postgres(self, session: Session, query: str, filters: LeadFilters, limit: int, offset: int) -> List[LeadSearchHit]:
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        search_vector = literal_column("lead.search_vector")
+
+        # Rank and page on the index first; headlines are only built for the page
+        ranked = filters.apply(
+            select(Lead.id, func.ts_rank_cd(search_vector, tsquery).label("rank")).where(search_vector.op("@@")(tsquery)),
+            "postgresql",
+        )
+        ranked = ranked.order_by(literal_column("rank").desc(), Lead.id.desc()).limit(limit).offset(offset).subquery()
+
+        headlines = [
+            func.ts_headline(SEARCH_CONFIG, func.coalesce(getattr(Lead, field), ""), tsquery, HEADLINE_OPTIONS).label(f"headline_{field}")
+            for field in SEARCH_FIELDS
+        ]
+        statement = (
+            select(*summary_columns(), ranked.c.rank, *headlines)
+            .join(ranked, ranked.c.id == Lead.id)
+            .outerjoin(Company, Company.id == Lead.company_id)
+            .order_by(ranked.c.rank.desc(), Lead.id.desc())
+        )
+
+        hits = []
+        for row in session.exec(statement).all():
+            mapping = dict(row._mapping)
+            highlights = {
+                field: mapping.pop(f"headline_{field}")
+                for field in SEARCH_FIELDS
+            }
+            hits.append(LeadSearchHit(
+                **mapping,
+                highlights={field: text for field, text in highlights.items() if "<mark>" in text},
+            ))
+        return hits
+
+    def _search_fallback(self, session: Session, query: str, filters: LeadFilters, limit: int, offset: int, dialect_name: str) -> List[LeadSearchHit]:
+        terms = self._terms(query)
+        if not terms:
+            return []
+
+        # Every term must appear in at least one field; rank by where it appeared (same weights as Postgres)
+        weights = {"A": 3, "B": 2, "C": 1}
+        conditions = []
+        rank = 0
+        for term in terms:
+            pattern = f"%{term}%"
+            matches = {field: func.lower(func.coalesce(getattr(Lead, field), "")).like(pattern) for field in SEARCH_FIELDS}
+            conditions.append(or_(*matches.values()))
+            for field, weight in SEARCH_FIELDS.items():
+                rank = rank + case((matches[field], weights[weight]), else_=0)
+
+        statement = filters.apply(
+            select(*summary_columns(), rank.label("rank"), *[getattr(Lead, field) for field in SEARCH_FIELDS])
+            .outerjoin(Company, Company.id == Lead.company_id)
+            .where(and_(*conditions)),
+            dialect_name,
+        )
+        statement = statement.order_by(literal_column("rank").desc(), Lead.id.desc()).limit(limit).offset(offset)
+
+        hits = []
+        for row in session.exec(statement).all():
+            mapping = dict(row._mapping)
+            texts = {field: mapping.pop(field) for field in SEARCH_FIELDS if field not in LeadSummary.model_fields}
+            highlights = {}
+            for field, text in texts.items():
+                snippet = self._snippet(text or "", terms)
+                if snippet:
+                    highlights[field] = snippet
+            hits.append(LeadSearchHit(**mapping, highlights=highlights))
+        return hits
+
+    def _terms(self, query: str) -> List[str]:
+        return [term.lower() for term in re.findall(r"\w+", query)]
+
+    def _snippet(self, text: str, terms: List[str]) -> str:
+        lowered = text.lower()
+        positions = [lowered.find(term) for term in terms if term in lowered]
+        if not positions:
+            return ""
+        start = max(min(positions) - self.SNIPPET_RADIUS, 0)
+        end = min(max(positions) + self.SNIPPET_RADIUS, len(text))
+        snippet = text[start:end]
+        pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        snippet = pattern.sub(lambda match: f"<mark>{match.group(0)}</mark>", snippet)
+        return ("..." if start > 0 else "") + snippet + ("..." if end < len(text) else "")
+
+lead_search_service = LeadSearchService()
@@ -0,0 +1,204 @@
+from app.models.lead import Lead
+from app.models.rollup import LeadDailyRollup
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import event, func, inspect as sa_inspect, delete, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+# Categories produced by AIScoringService._score_to_category, best first
+CATEGORY_ORDER = ["Exceptional", "High Confidence", "Strong", "Moderate", "Low Confidence"]
+QUALIFIED_CATEGORIES = {"Exceptional", "High Confidence", "Strong"}
+
+TOTAL = "total"
+CATEGORY = "category"
+QUEUE = "queue"
+
+# --- Incremental maintenance (runs inside the transaction that saves/deletes the lead) ---
+
+def _rollup_rows(day: date, category: str, queue: str):
+    yield day, TOTAL, ""
+    yield day, CATEGORY, category or "Unknown"
+    yield day, QUEUE, queue or "Unknown"
+
+def _add(connection, row_day: date, dimension: str, key: str, lead_count: int, score_sum: int):
+    """
+    Adds to one rollup row (creating it if needed). Relative, so concurrent writers never overwrite each other.
+    """
+    table = LeadDailyRollup.__table__
+    values = dict(day=row_day, dimension=dimension, key=key, lead_count=lead_count, score_sum=score_sum)
+    if connection.dialect.name in ("postgresql", "sqlite"):
+        insert = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+        statement = insert(table).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["day", "dimension", "key"],
+            set_={
+                "lead_count": table.c.lead_count + statement.excluded.lead_count,
+                "score_sum": table.c.score_sum + statement.excluded.score_sum,
+            },
+        )
+        connection.execute(statement)
+    else:
+        result = connection.execute(
+            update(table)
+            .where(table.c.day == row_day, table.c.dimension == dimension, table.c.key == key)
+            .values(lead_count=table.c.lead_count + lead_count, score_sum=table.c.score_sum + score_sum)
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(**values))
+
+def _apply(connection, day: date, category: str, queue: str, score: int, sign: int):
+    for row_day, dimension, key in _rollup_rows(day, category, queue):
+        _add(connection, row_day, dimension, key, sign, sign * (score or 0))
+
+# Columns the rollup is keyed on. active_history loads the old value on assignment even when a
+# commit has expired the attribute, so after_update can take the lead out of the right rows.
+TRACKED = ("created_at", "category", "queue", "score")
+
+def _load_old_value(target, value, oldvalue, initiator):
+    pass
+
+for _name in TRACKED:
+    event.listen(getattr(Lead, _name), "set", _load_old_value, active_history=True)
+
+def _lead_day(created_at: Optional[datetime]) -> date:
+    return (created_at or datetime.utcnow()).date()
+
+@event.listens_for(Lead, "after_insert")
+def _on_lead_insert(mapper, connection, lead: Lead):
+    _apply(connection, _lead_day(lead.created_at), lead.category, lead.queue, lead.score, +1)
+
+@event.listens_for(Lead, "after_delete")
+def _on_lead_delete(mapper, connection, lead: Lead):
+    _apply(connection, _lead_day(lead.created_at), lead.category, lead.queue, lead.score, -1)
+
+@event.listens_for(Lead, "after_update")
+def _on_lead_update(mapper, connection, lead: Lead):
+    state = sa_inspect(lead)
+    history = {name: state.attrs[name].history for name in TRACKED}
+    if not any(h.has_changes() for h in history.values()):
+        return
+
+    def old(name):
+        h = history[name]
+        return h.deleted[0] if h.deleted else getattr(lead, name)
+
+    _apply(connection, _lead_day(old("created_at")), old("category"), old("queue"), old("score"), -1)
+    _apply(connection, _lead_day(lead.created_at), lead.category, lead.queue, lead.score, +1)
+
+# --- Reads ---
+
+class LeadStatsService:
+    """
+    Dashboard statistics. Reads the daily rollup by default (cost independent of the
+    number of leads); `live=True` aggregates the lead table in SQL instead.
+    """
+
+    def get_stats(self, session: Session, live: bool = False) -> dict:
+        today = datetime.utcnow().date()
+        if live:
+            totals, categories, queues, new_today = self._live_aggregates(session, today)
+        else:
+            totals, categories, queues, new_today = self._rollup_aggregates(session, today)
+
+        total, score_sum = totals
+        return {
+            "total_leads": total,
+            "qualified_leads": sum(count for name, count in categories.items() if name in QUALIFIED_CATEGORIES),
+            "avg_score": round(score_sum / total, 1) if total > 0 else 0,
+            "new_leads_today": new_today,
+            "leads_by_category": self._ordered_chart(categories),
+            "leads_by_queue": [{"name": name, "leads": count} for name, count in sorted(queues.items())],
+        }
+
+    def _rollup_aggregates(self, session: Session, today: date):
+        rows = session.exec(
+            select(LeadDailyRollup.dimension, LeadDailyRollup.key, func.sum(LeadDailyRollup.lead_count), func.sum(LeadDailyRollup.score_sum))
+            .group_by(LeadDailyRollup.dimension, LeadDailyRollup.key)
+        ).all()
+        totals, categories, queues = (0, 0), {}, {}
+        for dimension, key, count, score_sum in rows:
+            if dimension == TOTAL:
+                totals = (int(count or 0), int(score_sum or 0))
+            elif dimension == CATEGORY and count:
+                categories[key] = int(count)
+            elif dimension == QUEUE and count:
+                queues[key] = int(count)
+
+        new_today = session.exec(
+            select(LeadDailyRollup.lead_count).where(
+                LeadDailyRollup.day == today, LeadDailyRollup.dimension == TOTAL, LeadDailyRollup.key == ""
+            )
+        ).first() or 0
+        return totals, categories, queues, new_today
+
+    def _live_aggregates(self, session: Session, today: date):
+        total, score_sum = session.exec(select(func.count(Lead.id), func.coalesce(func.sum(Lead.score), 0))).one()
+        categories = dict(session.exec(select(Lead.category, func.count(Lead.id)).group_by(Lead.category)).all())
+        queues = dict(session.exec(select(Lead.queue, func.count(Lead.id)).group_by(Lead.queue)).all())
+        new_today = session.exec(
+            select(func.count(Lead.id)).where(Lead.created_at >= datetime.combine(today, datetime.min.time()))
+        ).one()
+        return (total, score_sum), categories, queues, new_today
+
+    def _ordered_chart(self, categories: Dict[str, int]) -> list:
+        names = CATEGORY_ORDER + sorted(name for name in categories if name not in CATEGORY_ORDER)
+        return [{"name": name, "leads": categories.get(name, 0)} for name in names]
+
+    # --- Maintenance ---
+
+    def rebuild_rollups(self, session: Session) -> int:
+        """
+        Recomputes the rollup table from the lead table (backfill / repair after bulk SQL updates).
+        Returns the number of rollup rows written.
+        """
+        day = func.date(Lead.created_at)
+        counters: Dict[tuple, list] = {}
+        for dimension, column in ((TOTAL, None), (CATEGORY, Lead.category), (QUEUE, Lead.queue)):
+            group = [day] if column is None else [day, column]
+            rows = session.exec(
+                select(*group, func.count(Lead.id), func.coalesce(func.sum(Lead.score), 0)).group_by(*group)
+            ).all()
+            for row in rows:
+                row_day = date.fromisoformat(row[0]) if isinstance(row[0], str) else row[0]
+                key = "" if column is None else (row[1] or "Unknown")
+                counters[(row_day, dimension, key)] = [row[-2], row[-1]]
+
+        session.execute(delete(LeadDailyRollup))
+        session.add_all(
+            LeadDailyRollup(day=row_day, dimension=dimension, key=key, lead_count=count, score_sum=score_sum)
+            for (row_day, dimension, key), (count, score_sum) in counters.items()
+        )
+        session.commit()
+        return len(counters)
+
+    def move_leads(self, session: Session, moves: Iterable[Tuple[Optional[datetime], tuple, tuple]]):
+        """
+        Keeps the rollup in step with a bulk SQL UPDATE, which bypasses the ORM listeners.
+        Each move is (created_at, (category, queue, score) before, (category, queue, score) after).
+        Runs on the session's transaction, so the rollup commits or rolls back with the UPDATE;
+        changes are summed per rollup row first, so each row is written once.
+        """
+        deltas: Dict[tuple, list] = {}
+        for created_at, before, after in moves:
+            day = _lead_day(created_at)
+            for (category, queue, score), sign in ((before, -1), (after, +1)):
+                for row in _rollup_rows(day, category, queue):
+                    delta = deltas.setdefault(row, [0, 0])
+                    delta[0] += sign
+                    delta[1] += sign * (score or 0)
+
+        connection = session.connection()
+        for (row_day, dimension, key), (count, score_sum) in deltas.items():
+            if count or score_sum:
+                _add(connection, row_day, dimension, key, count, score_sum)
+
+    def rollups_missing(self, session: Session) -> bool:
+        """
+        True when leads exist but the rollup table is empty (e.g. first start after upgrading).
+        """
+        has_rollups = session.exec(select(LeadDailyRollup.day).limit(1)).first() is not None
+        has_leads = session.exec(select(Lead.id).limit(1)).first() is not None
+        return has_leads and not has_rollups
+
+lead_stats_service = LeadStatsService()
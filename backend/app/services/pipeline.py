@@ -0,0 +1,235 @@
+from app.models.lead import LeadInput, AnalyzedLead, Lead, EnrichmentData, BANTAnalysis, LeadScore, RoutingDecision, VerificationResult, LeadVerificationStatus, AuthorityTier
+from app.models.settings import SettingsSnapshot, PipelineMode
+from app.services.enrichment import enrichment_service
+from app.services.ai_scoring import ai_scoring_service
+from app.services.routing import routing_service
+from app.services.verification import verification_service
+from app.services.cascade import scoring_cascade
+from app.services.fast_path import fast_path_service, FastPathDecision
+from app.services.dedup import dedup_service, normalize_email, DuplicateMatch
+from app.services.settings_cache import settings_cache
+from app.services.scoring_profiles import scoring_profile_service
+from app.models.scoring import ScoringWeights
+from app.utils.company_size import parse_company_size_min
+from app.utils.metrics import pipeline_stage_seconds, pipeline_seconds
+from app.utils.structured_logging import correlation_id, bind_correlation_id
+from typing import Optional
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class InvalidLeadError(ValueError):
+    """Raised when a lead cannot be analyzed (e.g. invalid email)."""
+
+class LeadPipeline:
+    """
+    The enrich -> verify -> score -> route chain, shared by the API,
+    the job worker and other batch entry points.
+    """
+
+    async def analyze(self, lead_input: LeadInput, settings_db: Optional[SettingsSnapshot] = None) -> AnalyzedLead:
+        """
+        Runs the full analysis for one lead. Does not touch the database;
+        settings come from the cached snapshot unless one is passed in.
+        Logs carry the caller's correlation id, or a new one for this lead.
+        """
+        if correlation_id.get() is None:
+            with bind_correlation_id():
+                return await self._analyze(lead_input, settings_db)
+        return await self._analyze(lead_input, settings_db)
+
+    async def _analyze(self, lead_input: LeadInput, settings_db: Optional[SettingsSnapshot]) -> AnalyzedLead:
+        analysis_started = time.perf_counter()
+        if settings_db is None:
+            settings_db = await settings_cache.get_async()
+        enrichment_enabled = settings_db.enrichment_enabled
+        pipeline_mode = settings_db.pipeline_mode
+        fast_path_enabled = settings_db.fast_path_enabled
+        dedup_enabled = settings_db.dedup_enabled
+        weights = await scoring_profile_service.get_weights_async(settings_db.scoring_profile_id)
+
+        if enrichment_enabled and not enrichment_service._validate_email(lead_input.email):
+            raise InvalidLeadError("Invalid email address provided.")
+
+        # 0. Deterministic fast path: settle obvious junk without any Gemini call
+        if fast_path_enabled:
+            with pipeline_stage_seconds.time(stage="fast_path"):
+                decision = fast_path_service.evaluate(lead_input)
+            if decision:
+                pipeline_seconds.observe(time.perf_counter() - analysis_started, outcome="fast_path")
+                return self._settle_fast_path(lead_input, decision, weights)
+
+        # 0b. Duplicate of a recent lead: reuse its analysis instead of calling Gemini again
+        if dedup_enabled:
+            with pipeline_stage_seconds.time(stage="dedup"):
+                match = await dedup_service.find_match_async(lead_input)
+            if match:
+                pipeline_seconds.observe(time.perf_counter() - analysis_started, outcome="duplicate")
+                return self._settle_duplicate(lead_input, match)
+
+        # 1. Enrich lead data
+        if enrichment_enabled:
+            with pipeline_stage_seconds.time(stage="enrichment"):
+                enrichment_data = await enrichment_service.enrich_lead_async(lead_input.company_name, lead_input.email)
+        else:
+            # Create empty enrichment data if disabled
+            enrichment_data = EnrichmentData(
+                company_info=None,
+                email_valid=True # Assume valid if we skip verification to not block the flow
+            )
+
+        if not enrichment_data.email_valid:
+            raise InvalidLeadError("Invalid email address provided.")
+
+        fast_model = settings_db.selected_model
+
+        if pipeline_mode == PipelineMode.FUSED.value:
+            # 2+3. Verify and score in a single search-grounded call
+            started = time.perf_counter()
+            verification_result, bant_analysis, lead_score = await ai_scoring_service.score_lead_fused_async(lead_input, enrichment_data, model_name=fast_model, weights=weights)
+            pipeline_stage_seconds.observe(time.perf_counter() - started, stage="verify_and_score")
+        else:
+            # 2. Verify Lead (Agentic Verification)
+            with pipeline_stage_seconds.time(stage="verification"):
+                verification_result = await verification_service.verify_lead_async(lead_input, enrichment_data)
+
+            # 3. Score the lead using AI (now aware of verification)
+            started = time.perf_counter()
+            bant_analysis, lead_score = await ai_scoring_service.score_lead_async(lead_input, enrichment_data, verification_result, model_name=fast_model, weights=weights)
+            pipeline_stage_seconds.observe(time.perf_counter() - started, stage="scoring")
+        scoring_cascade.record_call(scoring_cascade.FAST_TIER, fast_model, time.perf_counter() - started)
+
+        # 3b. Cascade: re-score borderline leads with the stronger model
+        escalation_reason = scoring_cascade.escalation_reason(lead_score, verification_result, settings_db)
+        if escalation_reason:
+            with pipeline_stage_seconds.time(stage="cascade"):
+                bant_analysis, lead_score = await scoring_cascade.escalate(lead_input, enrichment_data, verification_result, settings_db, escalation_reason, weights)
+
+        # 4. Determine routing
+        with pipeline_stage_seconds.time(stage="routing"):
+            routing_decision = routing_service.route_lead(lead_score)
+
+        pipeline_seconds.observe(time.perf_counter() - analysis_started, outcome="analyzed")
+        return AnalyzedLead(
+            lead_input=lead_input,
+            bant_analysis=bant_analysis,
+            enrichment_data=enrichment_data,
+            lead_score=lead_score,
+            routing_decision=routing_decision,
+            verification_result=verification_result
+        )
+
+    def _settle_fast_path(self, lead_input: LeadInput, decision: FastPathDecision, weights: ScoringWeights) -> AnalyzedLead:
+        lead_score = ai_scoring_service.build_lead_score(
+            decision.score_dimensions,
+            decision.risk_flags,
+            decision.verification_result,
+            decision.explanation,
+            weights=weights,
+        )
+        return AnalyzedLead(
+            lead_input=lead_input,
+            bant_analysis=decision.bant_analysis(),
+            enrichment_data=EnrichmentData(company_info=None, email_valid=decision.email_valid),
+            lead_score=lead_score,
+            routing_decision=routing_service.route_lead(lead_score),
+            verification_result=decision.verification_result,
+            fast_path_rule=decision.rule,
+        )
+
+    def _settle_duplicate(self, lead_input: LeadInput, match: DuplicateMatch) -> AnalyzedLead:
+        original = match.lead
+        logger.info("♻️ [LeadPipeline] %s duplicates lead %s (%s, similarity %s)", lead_input.email, match.original_id, match.match_type, match.similarity)
+        # Leads saved before verification existed have no status; they count as unverified
+        verification_result = VerificationResult(
+            status=original.verification_status or LeadVerificationStatus.UNVERIFIED,
+            score=original.verification_score or 0,
+            authority_tier=original.authority_tier or AuthorityTier.UNKNOWN,
+            identity_verified=bool(original.identity_verified),
+            employment_verified=bool(original.employment_verified),
+            reason=original.verification_reason or "",
+            intent_signal=original.intent_signal,
+            intent_evidence=original.intent_evidence,
+        )
+        return AnalyzedLead(
+            lead_input=lead_input,
+            bant_analysis=BANTAnalysis(
+                budget=original.budget_analysis,
+                authority=original.authority_analysis,
+                need=original.need_analysis,
+                timeline=original.timeline_analysis,
+            ),
+            enrichment_data=EnrichmentData(
+                company_id=original.company_id,
+                company_info=original.company_info,
+                email_valid=original.email_valid,
+                company_logo_url=original.company_logo_url,
+                profile_image_url=original.profile_image_url,
+            ),
+            lead_score=LeadScore(
+                score=original.score,
+                category=original.category,
+                explanation=original.explanation,
+                score_breakdown=original.score_breakdown,
+                risk_flags=original.risk_flags,
+                follow_up_questions=original.follow_up_questions,
+            ),
+            routing_decision=RoutingDecision(queue=original.queue, reason=original.routing_reason),
+            verification_result=verification_result,
+            duplicate_of_id=match.original_id,
+            duplicate_match=match.match_type,
+        )
+
+    def build_lead(self, analyzed_lead: AnalyzedLead) -> Lead:
+        """
+        Flattens an analysis into a (not yet persisted) Lead row.
+        """
+        lead_input = analyzed_lead.lead_input
+        enrichment_data = analyzed_lead.enrichment_data
+        bant_analysis = analyzed_lead.bant_analysis
+        lead_score = analyzed_lead.lead_score
+        routing_decision = analyzed_lead.routing_decision
+        verification_result = analyzed_lead.verification_result
+
+        return Lead(
+            first_name=lead_input.first_name,
+            last_name=lead_input.last_name,
+            email=lead_input.email,
+            company_name=lead_input.company_name,
+            notes=lead_input.notes,
+            email_valid=enrichment_data.email_valid,
+            # Company details live on the shared Company row when there is one
+            company_id=enrichment_data.company_id,
+            company_info=None if enrichment_data.company_id else enrichment_data.company_info,
+            company_size_min=parse_company_size_min((enrichment_data.company_info or {}).get("size")),
+            company_logo_url=None if enrichment_data.company_id else enrichment_data.company_logo_url,
+            profile_image_url=enrichment_data.profile_image_url,
+            budget_analysis=bant_analysis.budget,
+            authority_analysis=bant_analysis.authority,
+            need_analysis=bant_analysis.need,
+            timeline_analysis=bant_analysis.timeline,
+            score=lead_score.score,
+            category=lead_score.category,
+            explanation=lead_score.explanation,
+            # New Verification Fields
+            verification_status=verification_result.status.value,
+            verification_score=verification_result.score,
+            authority_tier=verification_result.authority_tier.value,
+            identity_verified=verification_result.identity_verified,
+            employment_verified=verification_result.employment_verified,
+            verification_reason=verification_result.reason,
+            intent_signal=verification_result.intent_signal,
+            intent_evidence=verification_result.intent_evidence,
+            score_breakdown=lead_score.score_breakdown,
+            risk_flags=lead_score.risk_flags,
+            follow_up_questions=lead_score.follow_up_questions,
+            queue=routing_decision.queue,
+            routing_reason=routing_decision.reason,
+            fast_path_rule=analyzed_lead.fast_path_rule,
+            email_normalized=normalize_email(lead_input.email),
+            duplicate_of_id=analyzed_lead.duplicate_of_id,
+            duplicate_match=analyzed_lead.duplicate_match
+        )
+
+lead_pipeline = LeadPipeline()
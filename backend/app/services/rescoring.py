@@ -0,0 +1,170 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.lead import Lead, LeadScore, LeadVerificationStatus
+from app.models.scoring import ScoringWeights, BREAKDOWN_KEYS
+from app.services.ai_scoring import CATEGORY_BANDS
+from app.services.lead_stats import lead_stats_service
+from app.services.routing import routing_service
+from collections import Counter
+from typing import Tuple
+from sqlalchemy import update
+from sqlmodel import Session, select
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class RescoreUnavailableError(RuntimeError):
+    """Raised when NumPy, which bulk re-scoring needs, is not installed."""
+
+class LeadRescorer:
+    """
+    Recomputes score, category and routing of every stored lead under another
+    weight profile, without calling Gemini: Lead.score_breakdown keeps the six
+    dimension scores and Lead.risk_flags the flags that were penalized.
+
+    Leads are read in id order, `chunk_size` at a time, and each chunk is scored
+    in one NumPy pass that mirrors AIScoringService._calculate_weighted_score.
+    Without `apply` nothing is written and the report is a dry-run diff of how
+    scores, categories and queues would move.
+    """
+
+    SAMPLE_SIZE = 20 # Changed leads listed in the report
+
+    def check_available(self):
+        try:
+            import numpy # noqa: F401
+        except ImportError:
+            raise RescoreUnavailableError("Bulk re-scoring needs numpy (pip install numpy).")
+
+    def rescore(self, weights: ScoringWeights, apply: bool = False, chunk_size: int = settings.rescore_chunk_size) -> dict:
+        import numpy as np
+
+        started = time.perf_counter()
+        report = {
+            "applied": apply,
+            "weights": weights.model_dump(),
+            "leads": 0,
+            "skipped": 0,
+            "changed": 0,
+            "score_changes": 0,
+            "score_delta_sum": 0,
+            "categories_before": Counter(),
+            "categories_after": Counter(),
+            "category_shifts": Counter(),
+            "queue_shifts": Counter(),
+            "samples": [],
+        }
+        last_id = 0
+        with Session(engine) as session:
+            while True:
+                rows = session.exec(
+                    select(Lead.id, Lead.score_breakdown, Lead.risk_flags, Lead.verification_status, Lead.score, Lead.category, Lead.queue, Lead.created_at)
+                    .where(Lead.id > last_id)
+                    .order_by(Lead.id)
+                    .limit(chunk_size)
+                ).all()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                changes, moves = self._rescore_chunk(np, rows, weights, report)
+                if apply and changes:
+                    session.execute(update(Lead), changes)
+                    # The bulk UPDATE bypasses the ORM listeners that maintain the stats rollup;
+                    # move the changed leads between rollup rows in the same transaction instead
+                    lead_stats_service.move_leads(session, moves)
+                    session.commit()
+                    logger.info("🔁 [LeadRescorer] Re-scored %s leads up to id %s", report["changed"], last_id)
+        return self._finish_report(report, time.perf_counter() - started)
+
+    def _rescore_chunk(self, np, rows: list, weights: ScoringWeights, report: dict) -> Tuple[list, list]:
+        """
+        Scores one chunk and tallies it into `report`. Returns the updates for the leads that
+        changed, and their stats rollup moves (see LeadStatsService.move_leads).
+        """
+        # Fallback-scored leads ("Unscored") have no breakdown to recompute from
+        scored = [row for row in rows if row[1]]
+        report["leads"] += len(rows)
+        report["skipped"] += len(rows) - len(scored)
+        if not scored:
+            return [], []
+        ids, breakdowns, risk_flags, statuses, old_scores, old_categories, old_queues, _ = zip(*scored)
+        count = len(scored)
+
+        dimensions = np.array([[breakdown.get(key) or 0 for key in BREAKDOWN_KEYS.values()] for breakdown in breakdowns], dtype=np.float64)
+        flag_counts = np.fromiter((len(flags or []) for flags in risk_flags), dtype=np.int64, count=count)
+        likely_fake = np.fromiter((status == LeadVerificationStatus.LIKELY_FAKE.value for status in statuses), dtype=bool, count=count)
+        old_scores = np.array(old_scores, dtype=np.int64)
+        old_categories = np.array(old_categories)
+        old_queues = np.array(old_queues)
+        old_penalties = np.fromiter((breakdown.get("RiskPenalty") or 0 for breakdown in breakdowns), dtype=np.int64, count=count)
+
+        # Same left-to-right sum as the scalar code, so .5 ties round the same way
+        column_weights = [getattr(weights, field) for field in BREAKDOWN_KEYS]
+        base_scores = dimensions[:, 0] * column_weights[0]
+        for column in range(1, len(column_weights)):
+            base_scores = base_scores + dimensions[:, column] * column_weights[column]
+        penalties = flag_counts * weights.risk_flag_penalty
+        scores = np.where(likely_fake, 0.0, np.maximum(base_scores - penalties, weights.baseline_score))
+        scores = np.clip(np.rint(scores), 0, 100).astype(np.int64)
+
+        categories = np.select(
+            [scores >= lowest_score for lowest_score, _ in CATEGORY_BANDS],
+            [category for _, category in CATEGORY_BANDS],
+            default=CATEGORY_BANDS[-1][1],
+        )
+        queues = routing_service.queue_for_arrays(np, scores, categories)
+
+        score_changed = scores != old_scores
+        category_changed = categories != old_categories
+        queue_changed = queues != old_queues
+        changed = score_changed | category_changed | queue_changed | (old_penalties != -penalties)
+
+        report["changed"] += int(changed.sum())
+        report["score_changes"] += int(score_changed.sum())
+        report["score_delta_sum"] += int((scores - old_scores).sum())
+        report["categories_before"].update(dict(zip(*np.unique(old_categories, return_counts=True))))
+        report["categories_after"].update(dict(zip(*np.unique(categories, return_counts=True))))
+        report["category_shifts"].update(zip(old_categories[category_changed].tolist(), categories[category_changed].tolist()))
+        report["queue_shifts"].update(zip(old_queues[queue_changed].tolist(), queues[queue_changed].tolist()))
+
+        changes, moves = [], []
+        for index in np.flatnonzero(changed).tolist():
+            score, category, queue = int(scores[index]), str(categories[index]), str(queues[index])
+            changes.append({
+                "id": ids[index],
+                "score": score,
+                "category": category,
+                "queue": queue,
+                "routing_reason": routing_service.route_lead(LeadScore.model_construct(score=score, category=category)).reason,
+                "score_breakdown": {**breakdowns[index], "RiskPenalty": -int(penalties[index])},
+            })
+            _, _, _, _, old_score, old_category, old_queue, created_at = scored[index]
+            moves.append((created_at, (old_category, old_queue, old_score), (category, queue, score)))
+            if len(report["samples"]) < self.SAMPLE_SIZE:
+                report["samples"].append({
+                    "id": ids[index],
+                    "score_before": int(old_scores[index]),
+                    "score_after": score,
+                    "category_before": str(old_categories[index]),
+                    "category_after": category,
+                    "queue_before": str(old_queues[index]),
+                    "queue_after": queue,
+                })
+        return changes, moves
+
+    def _finish_report(self, report: dict, seconds: float) -> dict:
+        rescored = report["leads"] - report["skipped"]
+        score_delta_sum = report.pop("score_delta_sum")
+        report["mean_score_delta"] = round(score_delta_sum / rescored, 2) if rescored else 0.0
+        for key in ("categories_before", "categories_after"):
+            report[key] = {str(name): int(count) for name, count in report[key].most_common()}
+        for key in ("category_shifts", "queue_shifts"):
+            shifts = {}
+            for (before, after), count in report[key].most_common():
+                shifts.setdefault(before, {})[after] = count
+            report[key] = shifts
+        report["seconds"] = round(seconds, 3)
+        return report
+
+lead_rescorer = LeadRescorer()
@@ -33,4 +33,14 @@ class RoutingService:
                 reason=f"Lead is Cold with a score of {score}. Added to nurture campaign."
             )
 
+    def queue_for_arrays(self, np, scores, categories):
+        """
+        The queue route_lead() picks, over NumPy arrays of scores and categories (bulk re-scoring).
+        """
+        return np.select(
+            [(categories == "Hot") & (scores >= self.HOT_LEAD_THRESHOLD), (categories == "Warm") & (scores >= self.WARM_LEAD_THRESHOLD)],
+            ["Sales", "Presales"],
+            default="Nurture",
+        )
+
 routing_service = RoutingService()
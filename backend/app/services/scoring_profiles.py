@@ -0,0 +1,81 @@
+from app.db.database import engine
+from app.models.scoring import ScoringProfile, ScoringProfileCreate, ScoringWeights, DEFAULT_SCORING_WEIGHTS
+from app.models.settings import Settings
+from app.services.settings_cache import settings_cache
+from typing import Dict, List, Optional
+from sqlalchemy import func
+from sqlmodel import Session, select
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class ScoringProfileService:
+    """
+    Versioned scoring weight profiles. A profile row never changes once written
+    (edits add a new version), so each one is cached by id for the life of the
+    process; which one is active travels with the cached Settings snapshot.
+    """
+
+    def __init__(self):
+        self._weights: Dict[int, ScoringWeights] = {}
+        self._lock = threading.Lock()
+
+    def get_weights(self, profile_id: Optional[int]) -> ScoringWeights:
+        if profile_id is None:
+            return DEFAULT_SCORING_WEIGHTS
+        weights = self._weights.get(profile_id)
+        if weights is not None:
+            return weights
+        with Session(engine) as session:
+            profile = session.get(ScoringProfile, profile_id)
+        if profile is None:
+            logger.warning("⚠️ [ScoringProfiles] Active profile %s does not exist, using the built-in weights", profile_id)
+            return DEFAULT_SCORING_WEIGHTS
+        with self._lock:
+            return self._weights.setdefault(profile_id, profile.weights())
+
+    async def get_weights_async(self, profile_id: Optional[int]) -> ScoringWeights:
+        """
+        Same as get_weights(), but only leaves the event loop the first time a profile is used.
+        """
+        if profile_id is None or profile_id in self._weights:
+            return self.get_weights(profile_id)
+        return await asyncio.to_thread(self.get_weights, profile_id)
+
+    def create(self, session: Session, profile: ScoringProfileCreate) -> ScoringProfile:
+        """
+        Saves `profile` as the next version of its name.
+        """
+        latest = session.exec(select(func.max(ScoringProfile.version)).where(ScoringProfile.name == profile.name)).one()
+        row = ScoringProfile(**profile.model_dump(), version=(latest or 0) + 1)
+        session.add(row)
+        session.commit()
+        session.refresh(row)
+        return row
+
+    def activate(self, session: Session, profile_id: Optional[int]) -> Settings:
+        """
+        Makes `profile_id` (None: the built-in weights) the profile new leads are scored with.
+        """
+        settings_db = session.exec(select(Settings)).first() or Settings()
+        settings_db.scoring_profile_id = profile_id
+        # Other processes compare this counter against their cached snapshot
+        settings_db.version = (settings_db.version or 0) + 1
+        session.add(settings_db)
+        session.commit()
+        session.refresh(settings_db)
+        settings_cache.store(settings_db)
+        return settings_db
+
+    def get(self, session: Session, profile_id: int) -> Optional[ScoringProfile]:
+        return session.get(ScoringProfile, profile_id)
+
+    def list(self, session: Session, name: Optional[str] = None) -> List[ScoringProfile]:
+        statement = select(ScoringProfile).order_by(ScoringProfile.name, ScoringProfile.version.desc())
+        if name:
+            statement = statement.where(ScoringProfile.name == name)
+        return list(session.exec(statement).all())
+
+scoring_profile_service = ScoringProfileService()
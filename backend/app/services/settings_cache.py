@@ -0,0 +1,98 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.settings import Settings, SettingsSnapshot
+from sqlmodel import Session, select
+from typing import Optional
+import asyncio
+import threading
+import time
+
+class SettingsCache:
+    """
+    Process-wide cache of the Settings row as an immutable SettingsSnapshot.
+
+    PUT /settings writes through with `store()`. Other processes (workers, other
+    API replicas) notice the change by comparing the row's version counter, which
+    is checked at most once every `ttl` seconds; the full row is only re-read when
+    the version moved.
+    """
+
+    def __init__(self, ttl: float = settings.settings_cache_ttl_seconds):
+        self.ttl = ttl
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.version_checks = 0
+
+    def get(self) -> SettingsSnapshot:
+        """
+        Returns the current snapshot, hitting the DB only when the version check is due.
+        """
+        if self._is_fresh():
+            return self._snapshot
+        with self._lock:
+            if self._is_fresh():
+                return self._snapshot
+            with Session(engine) as session:
+                if self._snapshot is not None:
+                    self.version_checks += 1
+                    # No row reads as version 0, the defaults snapshot
+                    version = session.exec(select(Settings.version)).first() or 0
+                    if version == self._snapshot.version:
+                        self._checked_at = time.monotonic()
+                        return self._snapshot
+                self._load(session)
+            return self._snapshot
+
+    async def get_async(self) -> SettingsSnapshot:
+        """
+        Same as get(), but only leaves the event loop when the DB has to be consulted.
+        """
+        if self._is_fresh():
+            return self._snapshot
+        return await asyncio.to_thread(self.get)
+
+    def peek(self) -> Optional[SettingsSnapshot]:
+        """
+        The snapshot as currently cached, without ever touching the DB (e.g. from inside a flush).
+        None until something in this process loaded the settings.
+        """
+        return self._snapshot
+
+    def store(self, settings_db: Settings) -> SettingsSnapshot:
+        """
+        Write-through after an update committed in this process.
+        """
+        with self._lock:
+            self._snapshot = self._to_snapshot(settings_db)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            "version": self._snapshot.version if self._snapshot else None,
+            "loads": self.loads,
+            "version_checks": self.version_checks,
+            "ttl_seconds": self.ttl,
+        }
+
+    def _is_fresh(self) -> bool:
+        return self._snapshot is not None and time.monotonic() - self._checked_at < self.ttl
+
+    def _load(self, session: Session):
+        self.loads += 1
+        settings_db = session.exec(select(Settings)).first()
+        # No row yet: behave as the defaults until someone saves settings
+        self._snapshot = self._to_snapshot(settings_db) if settings_db else SettingsSnapshot()
+        self._checked_at = time.monotonic()
+
+    def _to_snapshot(self, settings_db: Settings) -> SettingsSnapshot:
+        return SettingsSnapshot.model_validate(settings_db, from_attributes=True)
+
+settings_cache = SettingsCache()
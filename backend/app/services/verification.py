@@ -1,6 +1,10 @@
 from app.models.lead import LeadInput, EnrichmentData, VerificationResult, LeadVerificationStatus, AuthorityTier
 from app.utils.gemini_client import gemini_client
+from app.utils.structured_logging import SAMPLED
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 class VerificationService:
     """
@@ -16,40 +20,61 @@ class VerificationService:
         prompt = self._build_verification_prompt(lead_input, enrichment_data)
         
         try:
-            print(f"🕵️‍♂️ [VerificationService] Verifying: {lead_input.first_name} {lead_input.last_name} at {lead_input.company_name}")
+            logger.info("🕵️‍♂️ [VerificationService] Verifying: %s %s at %s", lead_input.first_name, lead_input.last_name, lead_input.company_name, extra=SAMPLED)
             
             # Call Gemini with processing search enabled
             # Note: We ask Gemini to do the searching and synthesis "internally" via tools if available, 
             # or we rely on its training + the search tool we specifically enable.
             verification_response = gemini_client.generate_json_response(prompt, use_search=True)
             
-            # Map response to Pydantic model
-            status_str = verification_response.get("verification_status")
-            tier_str = verification_response.get("authority_tier")
-            
-            # Safe mapping for enums
-            status = self._map_status(status_str)
-            tier = self._map_tier(tier_str)
-            
-            raw_score = verification_response.get("verification_score", 0)
-            clamped_score = max(0, min(100, raw_score))
-
-            return VerificationResult(
-                status=status,
-                score=clamped_score,
-                authority_tier=tier,
-                identity_verified=verification_response.get("identity_verified", False),
-                employment_verified=verification_response.get("employment_verified", False),
-                reason=verification_response.get("verification_reason", "No reason provided."),
-                intent_signal=verification_response.get("intent_signal", "None"),
-                intent_evidence=verification_response.get("intent_evidence", None)
-            )
+            return self._parse_verification_response(verification_response)
 
         except Exception as e:
-            print(f"❌ [VerificationService] Verification failed: {e}")
+            logger.warning("❌ [VerificationService] Verification failed: %s", e)
             return self._get_fallback_verification()
 
+    async def verify_lead_async(self, lead_input: LeadInput, enrichment_data: EnrichmentData) -> VerificationResult:
+        """
+        Async variant of verify_lead; awaits the search-grounded Gemini call.
+        """
+        prompt = self._build_verification_prompt(lead_input, enrichment_data)
+
+        try:
+            logger.info("🕵️‍♂️ [VerificationService] Verifying: %s %s at %s", lead_input.first_name, lead_input.last_name, lead_input.company_name, extra=SAMPLED)
+            verification_response = await gemini_client.generate_json_response_async(prompt, use_search=True, stage="verification")
+            return self._parse_verification_response(verification_response)
+
+        except Exception as e:
+            logger.warning("❌ [VerificationService] Verification failed: %s", e)
+            return self._get_fallback_verification()
+
+    def _parse_verification_response(self, verification_response: dict) -> VerificationResult:
+        # Map response to Pydantic model
+        status_str = verification_response.get("verification_status")
+        tier_str = verification_response.get("authority_tier")
+        
+        # Safe mapping for enums
+        status = self._map_status(status_str)
+        tier = self._map_tier(tier_str)
+        
+        raw_score = verification_response.get("verification_score", 0)
+        clamped_score = max(0, min(100, raw_score))
+
+        return VerificationResult(
+            status=status,
+            score=clamped_score,
+            authority_tier=tier,
+            identity_verified=verification_response.get("identity_verified", False),
+            employment_verified=verification_response.get("employment_verified", False),
+            reason=verification_response.get("verification_reason", "No reason provided."),
+            intent_signal=verification_response.get("intent_signal", "None"),
+            intent_evidence=verification_response.get("intent_evidence", None)
+        )
+
     def _build_verification_prompt(self, lead_input: LeadInput, enrichment_data: EnrichmentData) -> str:
+        return self._build_verification_instructions(lead_input, enrichment_data) + self._build_verification_output_format()
+
+    def _build_verification_instructions(self, lead_input: LeadInput, enrichment_data: EnrichmentData) -> str:
         enrichment_summary = f"""
         - Official Company Name: {enrichment_data.company_info.get('company_name', 'N/A') if enrichment_data.company_info else 'N/A'}
         - Size: {enrichment_data.company_info.get('size', 'N/A') if enrichment_data.company_info else 'N/A'}
@@ -114,8 +139,12 @@ class VerificationService:
         - +10 Bonus for **Strong Intent Signal**.
         - PENALTY: -100 if "Likely Fake".
 
+        """
+
+    def _build_verification_output_format(self) -> str:
+        return """
         **Return JSON:**
-        {{
+        {
             "verification_status": "Verified Decision Maker" | "Verified Employee" | "Unverified" | "Likely Fake",
             "verification_score": <int>,
             "authority_tier": "Tier 1" | "Tier 2" | "Tier 3" | "Tier 4" | "Unknown",
@@ -124,7 +153,7 @@ class VerificationService:
             "verification_reason": "<Short explanation>",
             "intent_signal": "Strong" | "Weak" | "None",
             "intent_evidence": "<Short evidence or link>"
-        }}
+        }
         """
 
     def _map_status(self, status: str) -> LeadVerificationStatus:
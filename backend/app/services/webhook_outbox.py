@@ -0,0 +1,209 @@
+from app.config import settings
+from app.db.database import engine
+from app.models.lead import AnalyzedLead
+from app.models.webhook import WebhookOutboxEntry, WebhookStatus
+from app.utils.webhook_client import webhook_client
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import and_, func, or_, update
+from sqlmodel import Session, select
+import asyncio
+import httpx
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+# Client errors that are worth retrying; any other 4xx is dead-lettered at once
+RETRYABLE_CLIENT_ERRORS = {408, 409, 425, 429}
+
+class WebhookOutbox:
+    """
+    Transactional outbox for outgoing webhooks. Entries are added to the session
+    that saves the lead, so a payload exists if and only if its lead does, and
+    survives restarts until a dispatcher delivers it.
+    """
+
+    def entry(self, target_url: str, lead_id: int, analyzed_lead: AnalyzedLead) -> WebhookOutboxEntry:
+        return WebhookOutboxEntry(
+            target_url=target_url,
+            lead_id=lead_id,
+            payload=analyzed_lead.model_dump(mode="json"),
+        )
+
+    def claim(self, limit: int) -> List[WebhookOutboxEntry]:
+        """
+        Claims due entries (and ones whose dispatcher lease ran out) for delivery.
+        """
+        now = datetime.utcnow()
+        due = or_(
+            and_(WebhookOutboxEntry.status == WebhookStatus.PENDING.value, WebhookOutboxEntry.next_attempt_at <= now),
+            and_(WebhookOutboxEntry.status == WebhookStatus.DELIVERING.value, WebhookOutboxEntry.locked_until < now),
+        )
+        with Session(engine) as session:
+            ids = session.exec(
+                select(WebhookOutboxEntry.id)
+                .where(due)
+                .order_by(WebhookOutboxEntry.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not ids:
+                return []
+            # Conditional update keeps the claim atomic on backends without row locks (e.g. SQLite)
+            session.execute(
+                update(WebhookOutboxEntry)
+                .where(WebhookOutboxEntry.id.in_(ids), due)
+                .values(
+                    status=WebhookStatus.DELIVERING.value,
+                    locked_until=now + timedelta(seconds=settings.webhook_lease_seconds),
+                    attempts=WebhookOutboxEntry.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            return list(session.exec(
+                select(WebhookOutboxEntry).where(
+                    WebhookOutboxEntry.id.in_(ids),
+                    WebhookOutboxEntry.status == WebhookStatus.DELIVERING.value,
+                    WebhookOutboxEntry.locked_until > now,
+                )
+            ).all())
+
+    def renew(self, entries: List[WebhookOutboxEntry]) -> List[WebhookOutboxEntry]:
+        """
+        Restarts the lease of claimed entries right before their POST, so entries
+        that waited behind a busy target don't run out of lease mid-queue.
+        Returns the entries still held; ones another dispatcher re-claimed in the
+        meantime (its claim bumped `attempts`) are left to it.
+        """
+        locked_until = datetime.utcnow() + timedelta(seconds=settings.webhook_lease_seconds)
+        held = []
+        with Session(engine) as session:
+            for entry in entries:
+                result = session.execute(
+                    update(WebhookOutboxEntry)
+                    .where(
+                        WebhookOutboxEntry.id == entry.id,
+                        WebhookOutboxEntry.status == WebhookStatus.DELIVERING.value,
+                        WebhookOutboxEntry.attempts == entry.attempts,
+                    )
+                    .values(locked_until=locked_until)
+                )
+                if result.rowcount == 1:
+                    held.append(entry)
+            session.commit()
+        return held
+
+    def mark_delivered(self, ids: List[int]):
+        with Session(engine) as session:
+            session.execute(
+                update(WebhookOutboxEntry)
+                .where(WebhookOutboxEntry.id.in_(ids))
+                .values(status=WebhookStatus.DELIVERED.value, delivered_at=datetime.utcnow(), locked_until=None, last_error=None)
+            )
+            session.commit()
+
+    def mark_failed(self, entries: List[WebhookOutboxEntry], error: str, permanent: bool = False):
+        """
+        Schedules the next attempt with exponential backoff and jitter,
+        or dead-letters entries that are out of attempts.
+        """
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            for entry in entries:
+                values = dict(last_error=error[:1000], locked_until=None)
+                if permanent or entry.attempts >= settings.webhook_max_attempts:
+                    values["status"] = WebhookStatus.DEAD.value
+                    logger.error("[WebhookOutbox] Entry %s for %s dead after %s attempt(s): %s", entry.id, entry.target_url, entry.attempts, error)
+                else:
+                    delay = min(settings.webhook_retry_base_seconds * 2 ** (entry.attempts - 1), settings.webhook_retry_max_seconds)
+                    values["status"] = WebhookStatus.PENDING.value
+                    values["next_attempt_at"] = now + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+                session.execute(update(WebhookOutboxEntry).where(WebhookOutboxEntry.id == entry.id).values(**values))
+            session.commit()
+
+    def retry(self, entry_id: int) -> bool:
+        """
+        Puts a dead-lettered entry back in the queue with a fresh attempt budget.
+        """
+        with Session(engine) as session:
+            result = session.execute(
+                update(WebhookOutboxEntry)
+                .where(WebhookOutboxEntry.id == entry_id, WebhookOutboxEntry.status == WebhookStatus.DEAD.value)
+                .values(status=WebhookStatus.PENDING.value, attempts=0, next_attempt_at=datetime.utcnow(), last_error=None)
+            )
+            session.commit()
+            return result.rowcount == 1
+
+    def get_stats(self) -> dict:
+        with Session(engine) as session:
+            counts = dict(session.exec(
+                select(WebhookOutboxEntry.status, func.count()).group_by(WebhookOutboxEntry.status)
+            ).all())
+            oldest_pending = session.exec(
+                select(func.min(WebhookOutboxEntry.created_at)).where(WebhookOutboxEntry.status == WebhookStatus.PENDING.value)
+            ).one()
+        return {
+            **{status.value: counts.get(status.value, 0) for status in WebhookStatus},
+            "oldest_pending_at": oldest_pending.isoformat() if oldest_pending else None,
+        }
+
+class WebhookDispatcher:
+    """
+    Delivers claimed outbox entries through the pooled webhook client.
+    Entries are grouped by target URL; each target gets at most
+    `max_concurrency_per_target` POSTs in flight and, with `batch_size` > 1,
+    receives up to that many payloads per POST as a JSON array.
+    """
+
+    def __init__(self, batch_size: int = settings.webhook_batch_size, max_concurrency_per_target: int = settings.webhook_max_concurrency_per_target):
+        self.batch_size = max(batch_size, 1)
+        self.max_concurrency_per_target = max_concurrency_per_target
+        self._target_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def run_once(self) -> int:
+        """
+        One dispatcher pass. Returns how many entries were attempted.
+        """
+        entries = await asyncio.to_thread(webhook_outbox.claim, settings.webhook_claim_batch)
+        if not entries:
+            return 0
+
+        by_target: Dict[str, List[WebhookOutboxEntry]] = defaultdict(list)
+        for entry in entries:
+            by_target[entry.target_url].append(entry)
+
+        deliveries = []
+        for target_url, target_entries in by_target.items():
+            for start in range(0, len(target_entries), self.batch_size):
+                deliveries.append(self._deliver(target_url, target_entries[start:start + self.batch_size]))
+        await asyncio.gather(*deliveries)
+        return len(entries)
+
+    async def _deliver(self, target_url: str, entries: List[WebhookOutboxEntry]):
+        limit = self._target_limits.setdefault(target_url, asyncio.Semaphore(self.max_concurrency_per_target))
+        error: Optional[str] = None
+        permanent = False
+        async with limit:
+            # The claim's lease may have been running while this batch queued for the target
+            entries = await asyncio.to_thread(webhook_outbox.renew, entries)
+            if not entries:
+                return
+            payload = entries[0].payload if self.batch_size == 1 else [entry.payload for entry in entries]
+            try:
+                response = await webhook_client.post_json(target_url, payload)
+                if response.status_code >= 400:
+                    error = f"HTTP {response.status_code}: {response.text[:200]}"
+                    permanent = response.status_code < 500 and response.status_code not in RETRYABLE_CLIENT_ERRORS
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+
+        if error is None:
+            await asyncio.to_thread(webhook_outbox.mark_delivered, [entry.id for entry in entries])
+        else:
+            logger.warning("❌ [Webhook] Delivery of %s lead(s) to %s failed: %s", len(entries), target_url, error)
+            await asyncio.to_thread(webhook_outbox.mark_failed, entries, error, permanent)
+
+webhook_outbox = WebhookOutbox()
@@ -0,0 +1,22 @@
+import re
+from typing import Optional
+
+_NUMBER = re.compile(r"(\d[\d,.]*)\s*([kKmM]?)")
+
+def parse_company_size_min(size: Optional[str]) -> Optional[int]:
+    """
+    Lower bound of a free-text employee count from enrichment,
+    e.g. "10-50" -> 10, "1000+" -> 1000, "5k-10k" -> 5000, "Unknown" -> None.
+    """
+    if not size or not isinstance(size, str):
+        return None
+    match = _NUMBER.search(size)
+    if not match:
+        return None
+    number, suffix = match.groups()
+    try:
+        value = float(number.replace(",", ""))
+    except ValueError:
+        return None
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(suffix.lower(), 1)
+    return int(value * multiplier)
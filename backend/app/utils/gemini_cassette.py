@@ -0,0 +1,106 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from enum import Enum
+from typing import Optional, Tuple
+
+class CassetteMode(str, Enum):
+    OFF = "off"
+    RECORD = "record" # Call Gemini and store every successful response
+    REPLAY = "replay" # Serve stored responses, never call Gemini
+
+class GeminiCassetteMissError(LookupError):
+    """Raised in replay mode when no response was recorded for a request."""
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+class GeminiCassette:
+    """
+    On-disk store of raw generateContent responses keyed by
+    (model, prompt hash, use_search), for deterministic perf regression runs.
+
+    A single SQLite file; each response is zlib-compressed JSON next to the
+    latency it was recorded with, so a replay can reproduce the original
+    timing or run with zero latency.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode, replay_latency: str = "recorded"):
+        self.path = path
+        self.mode = CassetteMode(mode)
+        self.replay_latency = replay_latency
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"recorded": 0, "replayed": 0, "misses": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != CassetteMode.OFF
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CassetteMode.REPLAY
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == CassetteMode.RECORD
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gemini_response (
+                    model TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    use_search INTEGER NOT NULL,
+                    response BLOB NOT NULL,
+                    latency_ms REAL NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    PRIMARY KEY (model, prompt_hash, use_search)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def lookup(self, model: str, prompt: str, use_search: bool) -> Tuple[dict, float]:
+        """
+        Returns the recorded response and the delay to replay it with (seconds).
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response, latency_ms FROM gemini_response WHERE model = ? AND prompt_hash = ? AND use_search = ?",
+                (model, prompt_hash(prompt), int(use_search)),
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                raise GeminiCassetteMissError(f"No recorded Gemini response for model {model} (use_search={use_search}) in {self.path}")
+            self._stats["replayed"] += 1
+        response, latency_ms = row
+        delay = latency_ms / 1000 if self.replay_latency == "recorded" else 0.0
+        return json.loads(zlib.decompress(response)), delay
+
+    def record(self, model: str, prompt: str, use_search: bool, result: dict, latency_seconds: float):
+        payload = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO gemini_response VALUES (?, ?, ?, ?, ?, ?)",
+                (model, prompt_hash(prompt), int(use_search), payload, latency_seconds * 1000, time.time()),
+            )
+            conn.commit()
+            self._stats["recorded"] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"mode": self.mode.value, "path": self.path, **self._stats}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
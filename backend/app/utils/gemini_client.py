@@ -1,25 +1,54 @@
 import requests
+import httpx
+import asyncio
+import hashlib
 import json
 import time
+from typing import Optional
 from app.config import settings
+from app.utils.single_flight import SingleFlight
+from app.utils.rate_limiter import GeminiRateLimiter
+from app.utils.metrics import gemini_request_seconds, gemini_rate_limited, gemini_parse_failures, record_gemini_usage
+from app.utils.gemini_cassette import GeminiCassette
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiRateLimitError(Exception):
+    """Raised when Gemini keeps answering 429 after all retries."""
 
 class GeminiClient:
     def __init__(self):
         self.api_key = settings.google_api_key
         # Using the model confirmed by user and curl check
         self.model_name = "gemini-2.5-flash"
-        self.base_url = "https://generativelanguage.googleapis.com/v1beta/models"
+        self.base_url = settings.gemini_base_url.rstrip("/")
+        # Shared keep-alive pool for the async path, created lazily inside the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Identical concurrent requests (same model, prompt and search flag) share one call
+        self._single_flight = SingleFlight()
+        # Proactive RPM/TPM budget and max-in-flight governor, shared by all pipeline stages
+        self._rate_limiter = GeminiRateLimiter(
+            rpm=settings.gemini_rpm,
+            tpm=settings.gemini_tpm,
+            max_in_flight=settings.gemini_max_in_flight,
+            model_limits=settings.gemini_model_limits,
+            enabled=settings.gemini_rate_limit_enabled,
+        )
+        # Record/replay of raw responses for deterministic perf regression runs
+        self.cassette = GeminiCassette(
+            path=settings.gemini_cassette_path,
+            mode=settings.gemini_cassette_mode,
+            replay_latency=settings.gemini_cassette_replay_latency,
+        )
 
-    def generate_json_response(self, prompt: str, model_name: str = None, use_search: bool = False) -> dict:
+    def _build_json_request(self, prompt: str, model_name: str = None, use_search: bool = False) -> (str, dict):
         """
-        Generates a JSON response from a prompt using the Gemini REST API.
+        Builds the generateContent URL and payload for a JSON response.
         """
         model = model_name or self.model_name
         url = f"{self.base_url}/{model}:generateContent"
-        params = {"key": self.api_key}
-        
-        # We verify request structures for Gemini 1.5/pro series
-        headers = {"Content-Type": "application/json"}
         
         # Construct the payload
         # Ensure we ask for JSON explicitly in the prompt as well
@@ -42,20 +71,60 @@ class GeminiClient:
                 del data["generationConfig"]
         
         # If we removed config or if it didn't exist, we rely on the prompt instructing for JSON
+        return url, data
 
-        # If we removed config or if it didn't exist, we rely on the prompt instructing for JSON
+    def _parse_json_result(self, result: dict) -> dict:
+        """
+        Extracts and decodes the JSON text from a generateContent response.
+        """
+        # Structure: candidates[0].content.parts[0].text
+        candidates = result.get("candidates", [])
+        if not candidates:
+             raise ValueError("No candidates returned from Gemini API")
+
+        text_response = candidates[0].get("content", {}).get("parts", [{}])[0].get("text", "")
+
+        # Clean up markdown code blocks if present
+        cleaned_text = text_response.strip()
+        if cleaned_text.startswith("```json"):
+            cleaned_text = cleaned_text[7:]
+        if cleaned_text.startswith("```"):
+            cleaned_text = cleaned_text[3:] # Handle ``` if just that
+        if cleaned_text.endswith("```"):
+            cleaned_text = cleaned_text[:-3]
 
-        max_retries = 3
+        return json.loads(cleaned_text)
+
+    def generate_json_response(self, prompt: str, model_name: str = None, use_search: bool = False) -> dict:
+        """
+        Generates a JSON response from a prompt using the Gemini REST API.
+        Blocking variant, kept for scripts and synchronous callers.
+        """
+        url, data = self._build_json_request(prompt, model_name, use_search)
+        params = {"key": self.api_key}
+        headers = {"Content-Type": "application/json"}
+
+        model = model_name or self.model_name
+        if self.cassette.replaying:
+            result, delay = self.cassette.lookup(model, prompt, use_search)
+            time.sleep(delay)
+            return self._finish_json_response(result, model, use_search, delay, retries=0)
+
+        max_retries = settings.gemini_max_retries
         backoff = 2
+        started = time.perf_counter()
+        attempt = 0
         
         for attempt in range(max_retries):
             try:
-                response = requests.post(url, params=params, headers=headers, json=data, timeout=30)
+                posted = time.perf_counter()
+                response = requests.post(url, params=params, headers=headers, json=data, timeout=settings.gemini_timeout)
                 
                 if response.status_code == 429:
+                    gemini_rate_limited.inc(model=model)
                     if attempt == max_retries - 1:
                         raise requests.exceptions.HTTPError(f"Gemini API Rate Limit exceeded after {max_retries} retries.")
-                    print(f"⚠️ Gemini Rate Limit. Retrying in {backoff}s...")
+                    logger.warning("⚠️ [GeminiClient] Rate limited (%s). Retrying in %ss...", model, backoff)
                     time.sleep(backoff)
                     backoff *= 2
                     continue
@@ -63,55 +132,148 @@ class GeminiClient:
                 response.raise_for_status()
                 
                 result = response.json()
+                if self.cassette.recording:
+                    self.cassette.record(model, prompt, use_search, result, time.perf_counter() - posted)
                 # If we get here successfully, break loop
                 break
             except requests.exceptions.RequestException as e:
                 # Catch 429 if raised as exception, or verify status
                 if getattr(e.response, 'status_code', None) == 429:
-                     print(f"⚠️ Gemini Rate Limit (Exception). Retrying in {backoff}s...")
+                     logger.warning("⚠️ [GeminiClient] Rate limited (%s). Retrying in %ss...", model, backoff)
                      time.sleep(backoff)
                      backoff *= 2
                      continue
 
                 if attempt == max_retries - 1:
-                    print(f"❌ Error communicating with Gemini API after {max_retries} attempts: {e}")
+                    logger.error("❌ [GeminiClient] Error communicating with Gemini API after %s attempts: %s", max_retries, e)
+                    gemini_request_seconds.observe(time.perf_counter() - started, model=model, use_search=use_search, retries=attempt)
                     raise e
-                print(f"⚠️ Gemini API Error (Attempt {attempt+1}): {e}. Retrying...")
+                logger.warning("⚠️ [GeminiClient] API error (attempt %s): %s. Retrying...", attempt + 1, e)
                 time.sleep(backoff)
                 backoff *= 2
                 
         # Move parsing logic outside loop, assumes result is set if no exception raised
-        try:
-            # indent validation logic to match existing code structure if I am keeping it inside try/except block of original
-            # actually I am REPLACING the original try block.
-            
-            # Extract text from response
-            # Structure: candidates[0].content.parts[0].text
-            candidates = result.get("candidates", [])
-            if not candidates:
-                 raise ValueError("No candidates returned from Gemini API")
-            
-            text_response = candidates[0].get("content", {}).get("parts", [{}])[0].get("text", "")
-            
-            # Clean up markdown code blocks if present
-            cleaned_text = text_response.strip()
-            if cleaned_text.startswith("```json"):
-                cleaned_text = cleaned_text[7:]
-            if cleaned_text.startswith("```"):
-                cleaned_text = cleaned_text[3:] # Handle ``` if just that
-            if cleaned_text.endswith("```"):
-                cleaned_text = cleaned_text[:-3]
-                
-            return json.loads(cleaned_text)
+        return self._finish_json_response(result, model, use_search, time.perf_counter() - started, retries=attempt)
 
-        except requests.exceptions.HTTPError as http_err:
-            print(f"HTTP error occurred: {http_err}")
-            print(f"Response body: {response.text}")
-            raise
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared pooled AsyncClient, creating it on first use.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                http2=settings.gemini_http2,
+                timeout=settings.gemini_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.gemini_max_connections,
+                    max_keepalive_connections=settings.gemini_max_keepalive_connections,
+                    keepalive_expiry=settings.gemini_keepalive_expiry,
+                ),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._async_client
+
+    async def aclose(self):
+        """
+        Closes the pooled connections. Called on application shutdown.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.cassette.close()
+
+    async def generate_json_response_async(self, prompt: str, model_name: str = None, use_search: bool = False, stage: str = "default") -> dict:
+        """
+        Non-blocking variant of generate_json_response.
+        Reuses pooled keep-alive connections and backs off with asyncio.sleep,
+        so other requests on the same worker keep running while we wait.
+        Concurrent identical requests are coalesced into a single Gemini call,
+        and every call waits for its turn in the rate limiter under `stage`.
+        """
+        model = model_name or self.model_name
+        if not settings.gemini_coalescing_enabled:
+            return await self._request_json_async(prompt, model, use_search, stage)
+
+        key = (model, hashlib.sha256(prompt.encode("utf-8")).hexdigest(), use_search)
+        return await self._single_flight.do(key, lambda: self._request_json_async(prompt, model, use_search, stage))
+
+    async def _request_json_async(self, prompt: str, model_name: str, use_search: bool, stage: str) -> dict:
+        url, data = self._build_json_request(prompt, model_name, use_search)
+        client = self._get_async_client()
+        # Rough estimate (~4 chars per token); reconciled with usageMetadata after the call
+        estimated_tokens = len(data["contents"][0]["parts"][0]["text"]) // 4 + settings.gemini_expected_output_tokens
+
+        if self.cassette.replaying:
+            # The recorded answer: no network, no quota, optionally the recorded latency
+            result, delay = self.cassette.lookup(model_name, prompt, use_search)
+            await asyncio.sleep(delay)
+            return self._finish_json_response(result, model_name, use_search, delay, retries=0)
+
+        max_retries = settings.gemini_max_retries
+        backoff = 2
+        started = time.perf_counter()
+        attempt = 0
+
+        for attempt in range(max_retries):
+            try:
+                async with self._rate_limiter.limit(model_name, stage, estimated_tokens) as permit:
+                    posted = time.perf_counter()
+                    response = await client.post(url, params={"key": self.api_key}, json=data)
+                    latency = time.perf_counter() - posted
+                    if response.status_code == 429:
+                        permit.rate_limited()
+
+                if response.status_code == 429:
+                    gemini_rate_limited.inc(model=model_name)
+                    if attempt == max_retries - 1:
+                        gemini_request_seconds.observe(time.perf_counter() - started, model=model_name, use_search=use_search, retries=attempt)
+                        raise GeminiRateLimitError(f"Gemini API Rate Limit exceeded after {max_retries} retries.")
+                    logger.warning("⚠️ [GeminiClient] Rate limited (%s). Retrying in %ss...", model_name, backoff)
+                    await asyncio.sleep(backoff)
+                    backoff *= 2
+                    continue
+
+                response.raise_for_status()
+                result = response.json()
+                permit.record_usage(result.get("usageMetadata", {}).get("totalTokenCount"))
+                if self.cassette.recording:
+                    self.cassette.record(model_name, prompt, use_search, result, latency)
+                break
+            except httpx.HTTPError as e:
+                if attempt == max_retries - 1:
+                    logger.error("❌ [GeminiClient] Error communicating with Gemini API after %s attempts: %s", max_retries, e)
+                    gemini_request_seconds.observe(time.perf_counter() - started, model=model_name, use_search=use_search, retries=attempt)
+                    raise
+                logger.warning("⚠️ [GeminiClient] API error (attempt %s): %s. Retrying...", attempt + 1, e)
+                await asyncio.sleep(backoff)
+                backoff *= 2
+
+        return self._finish_json_response(result, model_name, use_search, time.perf_counter() - started, retries=attempt)
+
+    def _finish_json_response(self, result: dict, model_name: str, use_search: bool, elapsed: float, retries: int) -> dict:
+        """
+        Records metrics for a completed call and decodes its JSON answer.
+        """
+        gemini_request_seconds.observe(elapsed, model=model_name, use_search=use_search, retries=retries)
+        record_gemini_usage(model_name, result)
+
+        try:
+            return self._parse_json_result(result)
         except Exception as e:
-            print(f"Error generating response from Gemini: {e}")
+            if isinstance(e, ValueError):
+                gemini_parse_failures.inc(model=model_name)
+            logger.error("[GeminiClient] Error generating response from Gemini: %s", e)
             raise
 
+    def get_stats(self) -> dict:
+        """
+        Counters for the async request path.
+        """
+        return {
+            "coalescing": self._single_flight.get_stats(),
+            "rate_limiter": self._rate_limiter.get_stats(),
+            "cassette": self.cassette.get_stats(),
+        }
+
     def generate_content(self, prompt: str, model_name: str = None) -> str:
         """
         Generates a plain text response.
@@ -136,7 +298,7 @@ class GeminiClient:
                  return ""
             return candidates[0].get("content", {}).get("parts", [{}])[0].get("text", "")
         except Exception as e:
-            print(f"Error generating content: {e}")
+            logger.error("[GeminiClient] Error generating content: %s", e)
             return ""
 
 gemini_client = GeminiClient()
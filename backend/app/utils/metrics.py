@@ -0,0 +1,185 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Sequence, Tuple
+
+# Seconds; covers fast-path microseconds up to slow search-grounded Gemini calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _label_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def exposed_name(self) -> str:
+        return f"{self.name}_total"
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(_label_value(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.exposed_name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+class Histogram:
+    """
+    Cumulative-bucket histogram. An observation increments a single bucket;
+    buckets are only accumulated when the metrics are scraped.
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def exposed_name(self) -> str:
+        return self.name
+
+    def observe(self, value: float, **labels):
+        key = tuple(_label_value(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        lines = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """
+    In-process metrics of this process, rendered in the Prometheus text format.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.exposed_name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.exposed_name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+# --- Lead pipeline ---
+
+pipeline_stage_seconds = metrics.histogram(
+    "lead_pipeline_stage_seconds",
+    "Time spent in each stage of lead analysis.",
+    ["stage"],
+)
+pipeline_seconds = metrics.histogram(
+    "lead_pipeline_seconds",
+    "End-to-end analysis time of one lead, by how it was settled.",
+    ["outcome"],
+)
+
+# --- Gemini ---
+
+gemini_request_seconds = metrics.histogram(
+    "gemini_request_seconds",
+    "Gemini generateContent calls, including retries and rate-limiter waits.",
+    ["model", "use_search", "retries"],
+)
+gemini_rate_limited = metrics.counter(
+    "gemini_rate_limited",
+    "429 responses received from Gemini.",
+    ["model"],
+)
+gemini_parse_failures = metrics.counter(
+    "gemini_parse_failures",
+    "Gemini responses that could not be decoded as JSON.",
+    ["model"],
+)
+gemini_tokens = metrics.counter(
+    "gemini_tokens",
+    "Tokens reported by Gemini usageMetadata.",
+    ["model", "kind"],
+)
+
+USAGE_TOKEN_FIELDS = {
+    "promptTokenCount": "prompt",
+    "candidatesTokenCount": "candidates",
+    "thoughtsTokenCount": "thoughts",
+    "totalTokenCount": "total",
+}
+
+def record_gemini_usage(model: str, result: dict):
+    usage = result.get("usageMetadata") or {}
+    for field, kind in USAGE_TOKEN_FIELDS.items():
+        if usage.get(field):
+            gemini_tokens.inc(usage[field], model=model, kind=kind)
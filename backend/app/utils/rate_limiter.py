@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+class TokenBucket:
+    """
+    Classic token bucket. `capacity` tokens refill continuously over one minute.
+    The balance may go negative when actual usage is reconciled after a call.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = float(per_minute) / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """
+        Seconds until `amount` tokens are available (0 if they already are).
+        Requests larger than the bucket only wait for a full bucket.
+        """
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self.rate
+
+    def consume(self, amount: float):
+        self._refill()
+        self._tokens -= amount
+
+    def drain(self):
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+class FairSemaphore:
+    """
+    Semaphore whose waiters are queued per stage and woken round-robin,
+    so a burst in one pipeline stage cannot starve the others.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+        self._order: Deque[str] = deque()
+
+    def queued(self) -> Dict[str, int]:
+        return {stage: len(queue) for stage, queue in self._waiters.items() if queue}
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiters.values())
+
+    async def acquire(self, stage: str):
+        if self._value > 0 and not self._has_waiters():
+            self._value -= 1
+            return
+
+        if stage not in self._waiters:
+            self._waiters[stage] = deque()
+            self._order.append(stage)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[stage].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before we were cancelled; pass it on
+                self.release()
+            else:
+                try:
+                    self._waiters[stage].remove(future)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self):
+        while True:
+            future = self._next_waiter()
+            if future is None:
+                self._value += 1
+                return
+            if not future.done():
+                # Hand the slot directly to the next waiter
+                future.set_result(None)
+                return
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        for _ in range(len(self._order)):
+            stage = self._order[0]
+            self._order.rotate(-1)
+            queue = self._waiters[stage]
+            if queue:
+                return queue.popleft()
+        return None
+
+class RatePermit:
+    """
+    Handed out by GeminiRateLimiter.limit(); lets the caller reconcile usage.
+    """
+
+    def __init__(self, limiter: "GeminiRateLimiter", model: str, estimated_tokens: int):
+        self._limiter = limiter
+        self._model = model
+        self._estimated_tokens = estimated_tokens
+
+    def record_usage(self, total_tokens: Optional[int]):
+        """
+        Corrects the TPM bucket with the real token count from usageMetadata.
+        """
+        if total_tokens is None:
+            return
+        _, tpm = self._limiter._get_buckets(self._model)
+        tpm.consume(total_tokens - self._estimated_tokens)
+
+    def rate_limited(self):
+        """
+        Gemini answered 429: pause everyone on this model until the RPM bucket refills.
+        """
+        rpm, _ = self._limiter._get_buckets(self._model)
+        rpm.drain()
+        self._limiter._stats["rate_limited"] += 1
+
+class GeminiRateLimiter:
+    """
+    Proactive limiter for Gemini calls: per-model requests-per-minute and
+    tokens-per-minute buckets behind a max-in-flight semaphore that is
+    shared fairly between pipeline stages (enrichment, verification, scoring).
+    """
+
+    def __init__(self, rpm: int, tpm: int, max_in_flight: int, model_limits: Optional[Dict[str, Dict[str, int]]] = None, enabled: bool = True):
+        self.enabled = enabled
+        self.rpm = rpm
+        self.tpm = tpm
+        self.model_limits = model_limits or {}
+        self.max_in_flight = max_in_flight
+        self._slots = FairSemaphore(max_in_flight)
+        self._buckets: Dict[str, tuple] = {}
+        self._in_flight = 0
+        self._stats = {"acquired": 0, "throttled": 0, "wait_seconds": 0.0, "rate_limited": 0}
+        self._stage_stats: Dict[str, Dict[str, float]] = {}
+
+    def _get_buckets(self, model: str) -> tuple:
+        if model not in self._buckets:
+            limits = self.model_limits.get(model, {})
+            self._buckets[model] = (
+                TokenBucket(limits.get("rpm", self.rpm)),
+                TokenBucket(limits.get("tpm", self.tpm)),
+            )
+        return self._buckets[model]
+
+    @asynccontextmanager
+    async def limit(self, model: str, stage: str = "default", estimated_tokens: int = 0):
+        """
+        Waits for a concurrency slot (fair across stages) and for RPM/TPM budget,
+        then holds the slot for the duration of the block.
+        """
+        if not self.enabled:
+            yield RatePermit(self, model, estimated_tokens)
+            return
+
+        started = time.monotonic()
+        await self._slots.acquire(stage)
+        try:
+            rpm, tpm = self._get_buckets(model)
+            throttled = False
+            while True:
+                wait = max(rpm.time_until(1), tpm.time_until(estimated_tokens))
+                if wait <= 0:
+                    break
+                throttled = True
+                await asyncio.sleep(wait)
+            rpm.consume(1)
+            tpm.consume(estimated_tokens)
+
+            waited = time.monotonic() - started
+            self._stats["acquired"] += 1
+            self._stats["throttled"] += int(throttled)
+            self._stats["wait_seconds"] += waited
+            stage_stats = self._stage_stats.setdefault(stage, {"acquired": 0, "wait_seconds": 0.0})
+            stage_stats["acquired"] += 1
+            stage_stats["wait_seconds"] += waited
+
+            self._in_flight += 1
+            try:
+                yield RatePermit(self, model, estimated_tokens)
+            finally:
+                self._in_flight -= 1
+        finally:
+            self._slots.release()
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        stats["enabled"] = self.enabled
+        stats["wait_seconds"] = round(stats["wait_seconds"], 3)
+        stats["in_flight"] = self._in_flight
+        stats["max_in_flight"] = self.max_in_flight
+        stats["queued"] = self._slots.queued()
+        stats["stages"] = {
+            stage: {"acquired": s["acquired"], "wait_seconds": round(s["wait_seconds"], 3)}
+            for stage, s in self._stage_stats.items()
+        }
+        return stats
@@ -0,0 +1,45 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """
+    Collapses identical concurrent async calls into one.
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for the same result (or exception) instead of repeating it.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"calls": 0, "executed": 0, "collapsed": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self._stats["calls"] += 1
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["collapsed"] += 1
+        else:
+            # The shared call runs in its own task, so cancelling whichever caller
+            # started it (client disconnect, timeout) does not fail the others
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self._in_flight[key] = task
+            self._stats["executed"] += 1
+
+        # Shield so a cancelled caller only stops waiting, never cancels the shared call
+        result = await asyncio.shield(task)
+        # Each caller gets its own copy; callers mutate the dicts they receive
+        return copy.deepcopy(result)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark exceptions as retrieved when every caller had already given up
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        stats["in_flight"] = len(self._in_flight)
+        return stats
@@ -0,0 +1,148 @@
+import atexit
+import contextvars
+import json
+import logging
+import queue
+import random
+import sys
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, Optional
+from app.config import settings
+
+# Id of the request / job / lead being processed, attached to every record logged while it is set.
+# Context variables follow asyncio tasks and asyncio.to_thread, so concurrent leads never mix ids.
+correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("correlation_id", default=None)
+
+# Pass as `extra=` on high-volume messages; only LOG_SAMPLE_RATE of them are emitted
+SAMPLED = {"sampled": True}
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is logged as a field
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "correlation_id", "sampled"}
+
+_listener: Optional[QueueListener] = None
+
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+def child_correlation_id(suffix) -> str:
+    """
+    Id for one item of a batch, e.g. row 12 of an import request: "<request id>.12".
+    """
+    return f"{correlation_id.get() or new_correlation_id()}.{suffix}"
+
+@contextmanager
+def bind_correlation_id(value: Optional[str] = None) -> Iterator[str]:
+    """
+    Sets the correlation id for the enclosed code (a new one if none is given).
+    """
+    value = value or new_correlation_id()
+    token = correlation_id.set(value)
+    try:
+        yield value
+    finally:
+        correlation_id.reset(token)
+
+class ContextFilter(logging.Filter):
+    """
+    Stamps the correlation id on the record in the calling thread, before it
+    is queued, and drops the records of sampled messages that lose the draw.
+    """
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return False
+        record.correlation_id = correlation_id.get()
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: timestamp, level, logger, message, correlation id,
+    plus any fields passed through `extra=`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "correlation_id", None):
+            entry["correlation_id"] = record.correlation_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text or record.exc_info:
+            entry["exc_info"] = record.exc_text or self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s [%(correlation_id)s] %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not getattr(record, "correlation_id", None):
+            record.correlation_id = "-"
+        return super().format(record)
+
+class _PreformattedQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Keep `extra=` fields on the queued record (the default prepare() only keeps the message)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def configure_logging(level: str = None, fmt: str = None, sample_rate: float = None):
+    """
+    Routes the root logger through a queue: the calling thread (often the event
+    loop) only enqueues, while a background listener thread formats and writes.
+    Safe to call more than once; later calls replace the earlier configuration.
+    """
+    global _listener
+    level = (level or settings.log_level).upper()
+    fmt = fmt or settings.log_format
+    sample_rate = settings.log_sample_rate if sample_rate is None else sample_rate
+
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _PreformattedQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter(sample_rate))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    # One line per HTTP request (with the Gemini API key in the URL) is only wanted when debugging
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(level if level == "DEBUG" else "WARNING")
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+def shutdown_logging():
+    """
+    Flushes queued records. Registered at exit.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(shutdown_logging)
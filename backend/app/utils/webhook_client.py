@@ -1,36 +1,45 @@
-import requests
-import json
+import httpx
 import logging
+from typing import Any
+from app.config import settings
+from app.utils.structured_logging import SAMPLED
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def send_webhook(url: str, data: dict):
+class WebhookClient:
     """
-    Sends a JSON payload to the specified webhook URL.
-    Intended to be run as a background task.
+    Pooled async HTTP client for outgoing webhooks (e.g. n8n).
+    One keep-alive pool is shared by every delivery of the process.
     """
-    if not url:
-        return
 
-    try:
-        logger.info(f"🚀 [Webhook] Sending lead data to {url}...")
-        
-        # Determine if data is Pydantic model or dict
-        payload = data
-        if hasattr(data, "model_dump"):
-            payload = data.model_dump(mode="json")
-        elif hasattr(data, "dict"):
-            payload = data.dict()
-            
-        response = requests.post(
-            url, 
-            json=payload, 
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
-        response.raise_for_status()
-        logger.info(f"✅ [Webhook] Successfully delivered to {url} (Status: {response.status_code})")
-        
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ [Webhook] Failed to send data to {url}: {e}")
+    def __init__(self):
+        self._client: httpx.AsyncClient = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.webhook_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.webhook_max_connections,
+                    max_keepalive_connections=settings.webhook_max_connections,
+                ),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._client
+
+    async def post_json(self, url: str, payload: Any) -> httpx.Response:
+        """
+        POSTs a JSON payload. Returns the response; transport errors propagate.
+        """
+        logger.debug("🚀 [Webhook] Sending lead data to %s...", url)
+        response = await self._get_client().post(url, json=payload)
+        logger.info("[Webhook] %s answered %s", url, response.status_code, extra=SAMPLED)
+        return response
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+webhook_client = WebhookClient()
@@ -0,0 +1,185 @@
+"""
+Analysis job worker.
+
+Claims queued jobs created by POST /api/v1/analyze/jobs and runs the
+enrich -> verify -> score -> route pipeline on them. Also delivers the
+webhook outbox and re-enriches stale companies. Scale throughput by
+starting more processes; they coordinate through SELECT ... FOR UPDATE SKIP LOCKED.
+
+    python -m app.worker --concurrency 8
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import timedelta
+from app.config import settings
+from app.db.init_db import init_db
+from app.models.lead import LeadInput
+from app.services.company import company_service
+from app.services.enrichment import enrichment_service
+from app.services.jobs import job_queue
+from app.services.pipeline import lead_pipeline, InvalidLeadError
+from app.services.settings_cache import settings_cache
+from app.utils.gemini_client import gemini_client
+from app.utils.metrics import metrics
+from app.utils.structured_logging import bind_correlation_id, configure_logging
+from app.services.webhook_outbox import WebhookDispatcher
+from app.utils.webhook_client import webhook_client
+
+logger = logging.getLogger(__name__)
+
+class JobWorker:
+    def __init__(self, concurrency: int, poll_interval: float, refresh_companies: bool = True, deliver_webhooks: bool = True):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.refresh_companies = refresh_companies
+        self.deliver_webhooks = deliver_webhooks
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        logger.info("[Worker] %s stopping after current jobs...", self.worker_id)
+        self._stopping.set()
+
+    async def run(self):
+        logger.info("[Worker] %s started with concurrency %s", self.worker_id, self.concurrency)
+        loops = [self._claim_loop(i) for i in range(self.concurrency)]
+        if self.refresh_companies:
+            loops.append(self._company_refresh_loop())
+        if self.deliver_webhooks:
+            loops.append(self._webhook_loop())
+        await asyncio.gather(self._reaper_loop(), *loops)
+        await gemini_client.aclose()
+        await webhook_client.aclose()
+
+    async def _claim_loop(self, slot: int):
+        while not self._stopping.is_set():
+            claimed = await asyncio.to_thread(job_queue.claim, self.worker_id)
+            if claimed is None:
+                await self._sleep(self.poll_interval)
+                continue
+            await self._process(*claimed)
+
+    async def _reaper_loop(self):
+        visibility_timeout = timedelta(seconds=settings.job_visibility_timeout_seconds)
+        while not self._stopping.is_set():
+            requeued, failed = await asyncio.to_thread(job_queue.requeue_stale, visibility_timeout)
+            if requeued:
+                logger.warning("[Worker] Re-queued %s orphaned job(s)", requeued)
+            if failed:
+                logger.error("[Worker] Failed %s orphaned job(s) out of attempts", failed)
+            await self._sleep(visibility_timeout.total_seconds() / 4)
+
+    async def _company_refresh_loop(self):
+        # Re-enrich stale companies in batches; keeps going while full batches come back
+        while not self._stopping.is_set():
+            try:
+                refreshed = await company_service.refresh_stale(enrichment_service.refresh_company_info_async, settings.company_refresh_batch_size)
+            except Exception:
+                logger.exception("[Worker] Company refresh failed")
+                refreshed = 0
+            if refreshed:
+                logger.info("[Worker] Refreshed %s stale compan%s", refreshed, "y" if refreshed == 1 else "ies")
+            if refreshed < settings.company_refresh_batch_size:
+                await self._sleep(settings.company_refresh_interval_seconds)
+
+    async def _webhook_loop(self):
+        # Drain the outbox; only sleeps once a pass comes back empty
+        dispatcher = WebhookDispatcher()
+        while not self._stopping.is_set():
+            try:
+                attempted = await dispatcher.run_once()
+            except Exception:
+                logger.exception("[Worker] Webhook dispatch failed")
+                attempted = 0
+            if not attempted:
+                await self._sleep(settings.webhook_poll_interval)
+
+    async def _process(self, job_id: str, lead_input: LeadInput, attempts: int):
+        with bind_correlation_id(job_id):
+            await self._process_job(job_id, lead_input, attempts)
+
+    async def _process_job(self, job_id: str, lead_input: LeadInput, attempts: int):
+        logger.info("[Worker] Job %s (attempt %s): %s", job_id, attempts, lead_input.email)
+        settings_db = await settings_cache.get_async()
+
+        try:
+            analyzed_lead = await lead_pipeline.analyze(lead_input, settings_db)
+            webhook_url = settings_db.webhook_url if settings_db else None
+            lead_id = await asyncio.to_thread(job_queue.complete, job_id, self.worker_id, attempts, analyzed_lead, webhook_url)
+        except InvalidLeadError as e:
+            await asyncio.to_thread(job_queue.fail, job_id, self.worker_id, attempts, str(e), 400)
+            return
+        except Exception as e:
+            error_msg = str(e)
+            if "Rate Limit" in error_msg and attempts < settings.job_max_attempts:
+                logger.warning("[Worker] Job %s rate limited, re-queueing", job_id)
+                await asyncio.to_thread(job_queue.requeue, job_id, self.worker_id, attempts, error_msg)
+            else:
+                logger.exception("[Worker] Job %s failed", job_id)
+                await asyncio.to_thread(job_queue.fail, job_id, self.worker_id, attempts, error_msg, 429 if "Rate Limit" in error_msg else 500)
+            return
+
+        if lead_id is None:
+            logger.warning("[Worker] Job %s was re-claimed by another worker, discarding this result", job_id)
+            return
+        logger.info("[Worker] Job %s done -> lead %s", job_id, lead_id)
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves this worker's metrics (GET /metrics) for Prometheus to scrape."""
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", metrics.CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve_metrics(port: int):
+    server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    logger.info("[Worker] Metrics on :%s/metrics", port)
+
+def main():
+    parser = argparse.ArgumentParser(description="Process queued lead analysis jobs.")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency, help="Jobs processed concurrently by this process.")
+    parser.add_argument("--poll-interval", type=float, default=settings.job_poll_interval, help="Seconds to wait when the queue is empty.")
+    parser.add_argument("--no-company-refresh", action="store_true", help="Don't re-enrich stale companies in this process.")
+    parser.add_argument("--no-webhooks", action="store_true", help="Don't deliver the webhook outbox from this process.")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus metrics of this process on this port.")
+    args = parser.parse_args()
+
+    configure_logging()
+    init_db()
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+
+    async def runner():
+        worker = JobWorker(concurrency=args.concurrency, poll_interval=args.poll_interval, refresh_companies=not args.no_company_refresh, deliver_webhooks=not args.no_webhooks)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(runner())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from app.services.ai_scoring import ai_scoring_service
+from app.services.verification import verification_service
+from app.utils.gemini_client import gemini_client
+
+def bench_build_json_request(benchmark, lead_input, enrichment_data):
+    prompt = ai_scoring_service._build_fused_prompt(lead_input, enrichment_data)
+    url, data = benchmark(gemini_client._build_json_request, prompt, None, True)
+    assert "tools" in data
+
+def bench_parse_json_result(benchmark, gemini_response):
+    result = benchmark(gemini_client._parse_json_result, gemini_response)
+    assert result["score_dimensions"]["authority"] == 95
+
+def bench_parse_fenced_json_result(benchmark, fenced_gemini_response):
+    result = benchmark(gemini_client._parse_json_result, fenced_gemini_response)
+    assert result["score_dimensions"]["authority"] == 95
+
+def bench_finish_json_response(benchmark, fenced_gemini_response):
+    # Metrics, token accounting and parsing, i.e. all the client does after the HTTP call returns
+    result = benchmark(gemini_client._finish_json_response, fenced_gemini_response, "gemini-2.5-flash", True, 1.2, 0)
+    assert result["risk_flags"] == ["Aggressive timeline"]
+
+def bench_parse_fused_answer(benchmark, fused_answer):
+    def parse():
+        verification_result = verification_service._parse_verification_response(fused_answer)
+        return ai_scoring_service._parse_scoring_response(fused_answer, verification_result)
+
+    bant_analysis, lead_score = benchmark(parse)
+    assert lead_score.score > 0
@@ -0,0 +1,28 @@
+import json
+from app.models.lead import AnalyzedLead
+from app.services.pipeline import lead_pipeline
+from app.services.webhook_outbox import webhook_outbox
+
+def bench_analyzed_lead_validate(benchmark, analyzed_lead):
+    # What the API and the job queue do with a stored or posted analysis
+    data = analyzed_lead.model_dump()
+    result = benchmark(AnalyzedLead.model_validate, data)
+    assert result.lead_score.score == analyzed_lead.lead_score.score
+
+def bench_build_lead(benchmark, analyzed_lead):
+    lead = benchmark(lead_pipeline.build_lead, analyzed_lead)
+    assert lead.email_normalized
+
+def bench_webhook_payload(benchmark, analyzed_lead):
+    payload = benchmark(analyzed_lead.model_dump, mode="json")
+    assert payload["lead_input"]["email"] == analyzed_lead.lead_input.email
+
+def bench_webhook_outbox_entry(benchmark, analyzed_lead):
+    entry = benchmark(webhook_outbox.entry, "https://hooks.example.com/leads", 1, analyzed_lead)
+    assert entry.payload["routing_decision"]["queue"] == analyzed_lead.routing_decision.queue
+
+def bench_webhook_batch_body(benchmark, analyzed_lead):
+    # Dispatcher side with WEBHOOK_BATCH_SIZE=20: one JSON array of stored payloads per POST
+    payloads = [analyzed_lead.model_dump(mode="json") for _ in range(20)]
+    body = benchmark(json.dumps, payloads)
+    assert body.startswith("[")
@@ -0,0 +1,19 @@
+from app.services.ai_scoring import ai_scoring_service
+from app.services.enrichment import enrichment_service
+from app.services.verification import verification_service
+
+def bench_scoring_prompt(benchmark, lead_input, enrichment_data, verification_result):
+    prompt = benchmark(ai_scoring_service._build_prompt, lead_input, enrichment_data, verification_result)
+    assert lead_input.notes in prompt
+
+def bench_fused_prompt(benchmark, lead_input, enrichment_data):
+    prompt = benchmark(ai_scoring_service._build_fused_prompt, lead_input, enrichment_data)
+    assert lead_input.notes in prompt
+
+def bench_verification_prompt(benchmark, lead_input, enrichment_data):
+    prompt = benchmark(verification_service._build_verification_prompt, lead_input, enrichment_data)
+    assert lead_input.company_name in prompt
+
+def bench_company_prompt(benchmark, lead_input):
+    prompt = benchmark(enrichment_service._build_company_prompt, lead_input.company_name, "northwind-logistics.com")
+    assert "northwind-logistics.com" in prompt
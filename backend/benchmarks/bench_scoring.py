@@ -0,0 +1,28 @@
+from app.models.lead import LeadVerificationStatus
+from app.services.ai_scoring import ai_scoring_service
+from app.services.routing import routing_service
+
+def bench_weighted_score(benchmark, fused_answer, verification_result):
+    score, breakdown = benchmark(
+        ai_scoring_service._calculate_weighted_score, fused_answer["score_dimensions"], fused_answer["risk_flags"], verification_result
+    )
+    assert breakdown["RiskPenalty"] == -10
+
+def bench_weighted_score_likely_fake(benchmark, fused_answer, verification_result):
+    verification_result = verification_result.model_copy(update={"status": LeadVerificationStatus.LIKELY_FAKE})
+    score, breakdown = benchmark(
+        ai_scoring_service._calculate_weighted_score, fused_answer["score_dimensions"], fused_answer["risk_flags"], verification_result
+    )
+    assert score == 0
+
+def bench_build_lead_score(benchmark, fused_answer, verification_result):
+    lead_score = benchmark(
+        ai_scoring_service.build_lead_score,
+        fused_answer["score_dimensions"], fused_answer["risk_flags"], verification_result,
+        fused_answer["explanation"], fused_answer["follow_up_questions"],
+    )
+    assert lead_score.category
+
+def bench_route_lead(benchmark, lead_score):
+    routing_decision = benchmark(routing_service.route_lead, lead_score)
+    assert routing_decision.queue
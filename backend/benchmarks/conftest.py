@@ -0,0 +1,156 @@
+"""
+Fixtures for the micro-benchmarks: one realistic lead as it looks at every
+stage of the pipeline, from the form submission to the raw Gemini answer and
+the final AnalyzedLead.
+"""
+import json
+import os
+import pathlib
+
+# The app reads its settings at import time; the benchmarks never touch the database or the network
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import pytest
+from pytest_benchmark.utils import get_machine_id
+from app.models.lead import (
+    AnalyzedLead, AuthorityTier, BANTAnalysis, EnrichmentData, LeadInput, LeadScore,
+    LeadVerificationStatus, VerificationResult,
+)
+from app.services.ai_scoring import ai_scoring_service
+from app.services.routing import routing_service
+
+BASELINE_DIR = pathlib.Path(__file__).parent / "baselines"
+
+def pytest_configure(config):
+    # Keep saved runs next to the suite, wherever pytest is started from
+    if config.getoption("benchmark_storage", None) != "file://./.benchmarks":
+        return
+    config.option.benchmark_storage = f"file://{BASELINE_DIR}"
+    # Baselines are per machine id (OS, interpreter, Python version). Without one there is
+    # nothing to compare against, so the first run on a machine records it instead of failing.
+    if config.option.benchmark_compare and not any((BASELINE_DIR / get_machine_id()).glob("[0-9][0-9][0-9][0-9]_*.json")):
+        config.option.benchmark_compare = None
+        config.option.benchmark_save = config.option.benchmark_save or "baseline"
+    # A run that is saved becomes the new baseline, so it is shown against the old one but never fails
+    if config.option.benchmark_save:
+        config.option.benchmark_compare_fail = None
+
+FUSED_ANSWER = {
+    "verification_status": "Verified Decision Maker",
+    "verification_score": 88,
+    "authority_tier": "Tier 1",
+    "identity_verified": True,
+    "employment_verified": True,
+    "verification_reason": "LinkedIn lists Priya Patel as CTO of Northwind Logistics since 2021; the company website's leadership page confirms it.",
+    "intent_signal": "Strong",
+    "intent_evidence": "Northwind announced a warehouse automation programme in March and is hiring three data engineers.",
+    "bant_analysis": {
+        "budget": "A budget of roughly $250k is stated and is realistic for a 1,200-seat rollout.",
+        "authority": "As CTO she is the economic buyer for infrastructure purchases.",
+        "need": "They are replacing a legacy on-premise TMS that cannot integrate with their new WMS.",
+        "timeline": "Vendor selection this quarter, go-live targeted before peak season in Q4.",
+    },
+    "score_dimensions": {
+        "authenticity": 92,
+        "authority": 95,
+        "budget_realism": 78,
+        "requirement_clarity": 85,
+        "organizational_footprint": 80,
+        "intent_signals": 88,
+    },
+    "risk_flags": ["Aggressive timeline"],
+    "follow_up_questions": [
+        "Which WMS are you integrating with, and is it cloud-hosted?",
+        "How many carriers and EDI partners need to be connected at launch?",
+        "Is the $250k budget inclusive of implementation services?",
+        "Who else is involved in the vendor selection?",
+        "What would make the Q4 go-live date slip?",
+    ],
+    "explanation": (
+        "Verified C-level buyer at a mid-size logistics company with a concrete, funded project and a clear timeline. "
+        "The only concern is the tight go-live window before peak season."
+    ),
+}
+
+@pytest.fixture
+def lead_input() -> LeadInput:
+    return LeadInput(
+        first_name="Priya",
+        last_name="Patel",
+        email="priya.patel@northwind-logistics.com",
+        company_name="Northwind Logistics",
+        notes=(
+            "Hi, I'm the CTO at Northwind. We're replacing our on-prem TMS this year and need something that integrates "
+            "with our new WMS and about 40 carriers over EDI. Roughly 1,200 users across 14 warehouses. Budget is around "
+            "$250k for year one and we'd like to pick a vendor this quarter so we can go live before peak season. "
+            "Can you send pricing and a couple of reference customers in logistics?"
+        ),
+    )
+
+@pytest.fixture
+def enrichment_data() -> EnrichmentData:
+    return EnrichmentData(
+        company_info={
+            "company_name": "Northwind Logistics",
+            "industry": "Transportation & Logistics",
+            "size": "1000-5000",
+            "website": "https://northwind-logistics.com",
+            "company_logo_url": "https://logo.clearbit.com/northwind-logistics.com",
+            "profile_image_url": None,
+        },
+        email_valid=True,
+        company_logo_url="https://logo.clearbit.com/northwind-logistics.com",
+    )
+
+@pytest.fixture
+def verification_result() -> VerificationResult:
+    return VerificationResult(
+        status=LeadVerificationStatus.VERIFIED_DECISION_MAKER,
+        score=FUSED_ANSWER["verification_score"],
+        authority_tier=AuthorityTier.TIER_1,
+        identity_verified=True,
+        employment_verified=True,
+        reason=FUSED_ANSWER["verification_reason"],
+        intent_signal=FUSED_ANSWER["intent_signal"],
+        intent_evidence=FUSED_ANSWER["intent_evidence"],
+    )
+
+@pytest.fixture
+def fused_answer() -> dict:
+    return json.loads(json.dumps(FUSED_ANSWER))
+
+def _gemini_response(text: str) -> dict:
+    return {
+        "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP"}],
+        "usageMetadata": {"promptTokenCount": 1480, "candidatesTokenCount": 412, "totalTokenCount": 1892},
+        "modelVersion": "gemini-2.5-flash",
+    }
+
+@pytest.fixture
+def gemini_response() -> dict:
+    return _gemini_response(json.dumps(FUSED_ANSWER, indent=2))
+
+@pytest.fixture
+def fenced_gemini_response() -> dict:
+    # Search-grounded calls cannot force JSON mode and often come back wrapped in a code fence
+    return _gemini_response(f"```json\n{json.dumps(FUSED_ANSWER, indent=2)}\n```\n")
+
+@pytest.fixture
+def lead_score(verification_result) -> LeadScore:
+    return ai_scoring_service.build_lead_score(
+        FUSED_ANSWER["score_dimensions"], FUSED_ANSWER["risk_flags"], verification_result,
+        FUSED_ANSWER["explanation"], FUSED_ANSWER["follow_up_questions"],
+    )
+
+@pytest.fixture
+def analyzed_lead(lead_input, enrichment_data, verification_result, lead_score) -> AnalyzedLead:
+    return AnalyzedLead(
+        lead_input=lead_input,
+        bant_analysis=BANTAnalysis(**FUSED_ANSWER["bant_analysis"]),
+        enrichment_data=enrichment_data,
+        lead_score=lead_score,
+        routing_decision=routing_service.route_lead(lead_score),
+        verification_result=verification_result,
+    )
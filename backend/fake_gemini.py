@@ -0,0 +1,197 @@
+"""
+Local stand-in for the Gemini generateContent endpoint, for load tests that
+must not burn real quota.
+
+    python fake_gemini.py --port 8100 --latency-ms 800 --rate-limit-rate 0.02
+    GEMINI_BASE_URL=http://127.0.0.1:8100/v1beta/models uvicorn app.main:app
+
+Answers are shaped like real ones (candidates[0].content.parts[0].text plus
+usageMetadata) and picked by prompt: enrichment, verification, scoring and the
+fused verify+score prompt each get the JSON fields their service parses.
+Scores are derived from a hash of the prompt, so the same lead always gets the
+same answer. Latency, 429s and malformed JSON are injected at configurable rates;
+GET/PUT /config reads or changes them while a test runs.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+from typing import Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+import uvicorn
+
+class FakeGeminiConfig(BaseModel):
+    latency_distribution: str = "lognormal" # "fixed", "uniform" or "lognormal"
+    latency_ms: float = 800 # Fixed value, uniform upper bound, or lognormal median
+    latency_sigma: float = 0.5 # Lognormal spread
+    search_latency_factor: float = 2.0 # Search-grounded calls are this much slower
+    rate_limit_rate: float = 0.0 # Share of calls answered with 429
+    malformed_rate: float = 0.0 # Share of calls whose text is not valid JSON
+    fenced_rate: float = 0.1 # Share of calls wrapped in ```json fences, like the real model sometimes does
+
+config = FakeGeminiConfig()
+stats = {"requests": 0, "rate_limited": 0, "malformed": 0, "by_kind": {}}
+_stats_lock = threading.Lock()
+
+app = FastAPI(title="Fake Gemini")
+
+VERIFICATION_STATUSES = ["Verified Decision Maker", "Verified Employee", "Unverified", "Likely Fake"]
+AUTHORITY_TIERS = ["Tier 1", "Tier 2", "Tier 3", "Tier 4"]
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Manufacturing", "Retail", "Education"]
+SIZES = ["1-10", "10-50", "50-200", "200-1000", "1000+"]
+RISK_FLAGS = ["Vague requirements", "No budget mentioned", "Free email domain", "Unrealistic timeline"]
+
+def prompt_kind(prompt: str) -> str:
+    if "data enrichment bot" in prompt:
+        return "enrichment"
+    if "Lead Verification and Qualification Agent" in prompt:
+        return "fused"
+    if "Lead Verification Agent" in prompt:
+        return "verification"
+    if "Lead Qualification Agent" in prompt:
+        return "scoring"
+    return "text"
+
+def verification_fields(rng: random.Random) -> dict:
+    status = rng.choices(VERIFICATION_STATUSES, weights=[3, 4, 2, 1])[0]
+    verified = status.startswith("Verified")
+    return {
+        "verification_status": status,
+        "verification_score": rng.randint(60, 95) if verified else rng.randint(5, 50),
+        "authority_tier": rng.choice(AUTHORITY_TIERS[:2] if status == "Verified Decision Maker" else AUTHORITY_TIERS),
+        "identity_verified": verified,
+        "employment_verified": verified,
+        "verification_reason": "Profile matches the company website." if verified else "No public footprint found.",
+        "intent_signal": rng.choice(["Strong", "Weak", "None"]),
+        "intent_evidence": "Recent hiring for related roles.",
+    }
+
+def scoring_fields(rng: random.Random) -> dict:
+    # A typical lead lands mid-range; a few are very strong or very weak
+    base = rng.gauss(60, 20)
+    dimension = lambda: max(0, min(100, int(rng.gauss(base, 12))))
+    return {
+        "bant_analysis": {
+            "budget": "Budget mentioned in the inquiry.",
+            "authority": "Sender appears to hold a senior role.",
+            "need": "Clear description of the problem.",
+            "timeline": "Within the next quarter.",
+        },
+        "score_dimensions": {
+            "authenticity": dimension(),
+            "authority": dimension(),
+            "budget_realism": dimension(),
+            "requirement_clarity": dimension(),
+            "organizational_footprint": dimension(),
+            "intent_signals": dimension(),
+        },
+        "risk_flags": rng.sample(RISK_FLAGS, k=rng.choice([0, 0, 1, 2])),
+        "follow_up_questions": [f"Question {i}" for i in range(1, 6)],
+        "explanation": "Synthetic score from the fake Gemini server.",
+    }
+
+def answer(kind: str, prompt: str) -> object:
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+    if kind == "enrichment":
+        match = re.search(r'company "([^"]*)" \(Domain: ([^)]*)\)', prompt)
+        company_name, domain = match.groups() if match else ("Unknown", "unknown.com")
+        return {
+            "company_name": company_name,
+            "industry": rng.choice(INDUSTRIES),
+            "size": rng.choice(SIZES),
+            "website": f"https://{domain}",
+            "company_logo_url": None,
+            "profile_image_url": None,
+        }
+    if kind == "verification":
+        return verification_fields(rng)
+    if kind == "scoring":
+        return scoring_fields(rng)
+    if kind == "fused":
+        return {**verification_fields(rng), **scoring_fields(rng)}
+    return "This is a plain text answer from the fake Gemini server."
+
+def sample_latency(use_search: bool) -> float:
+    if config.latency_distribution == "fixed":
+        latency_ms = config.latency_ms
+    elif config.latency_distribution == "uniform":
+        latency_ms = random.uniform(0, config.latency_ms)
+    else:
+        latency_ms = random.lognormvariate(0, config.latency_sigma) * config.latency_ms
+    return latency_ms * (config.search_latency_factor if use_search else 1) / 1000
+
+def record(kind: Optional[str] = None, **counters):
+    with _stats_lock:
+        stats["requests"] += 1
+        if kind:
+            stats["by_kind"][kind] = stats["by_kind"].get(kind, 0) + 1
+        for name, value in counters.items():
+            stats[name] += value
+
+@app.post("/v1beta/models/{model_action}")
+async def generate_content(model_action: str, request: Request):
+    body = await request.json()
+    prompt = body["contents"][0]["parts"][0]["text"]
+    use_search = bool(body.get("tools"))
+    await asyncio.sleep(sample_latency(use_search))
+
+    if random.random() < config.rate_limit_rate:
+        record(rate_limited=1)
+        return JSONResponse(status_code=429, content={"error": {"code": 429, "message": "Resource has been exhausted (e.g. check quota).", "status": "RESOURCE_EXHAUSTED"}})
+
+    kind = prompt_kind(prompt)
+    result = answer(kind, prompt)
+    text = result if isinstance(result, str) else json.dumps(result)
+    if kind != "text" and random.random() < config.malformed_rate:
+        record(kind, malformed=1)
+        text = text[:len(text) // 2]
+    else:
+        record(kind)
+        if kind != "text" and random.random() < config.fenced_rate:
+            text = f"```json\n{text}\n```"
+
+    prompt_tokens = len(prompt) // 4
+    candidates_tokens = len(text) // 4
+    return {
+        "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP"}],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": candidates_tokens,
+            "totalTokenCount": prompt_tokens + candidates_tokens,
+        },
+        "modelVersion": model_action.split(":", 1)[0],
+    }
+
+@app.get("/config")
+async def get_config():
+    return config
+
+@app.put("/config")
+async def update_config(update: dict):
+    global config
+    config = config.model_copy(update={key: value for key, value in update.items() if key in FakeGeminiConfig.model_fields})
+    return config
+
+@app.get("/stats")
+async def get_stats():
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Gemini generateContent server for load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    for name, field in FakeGeminiConfig.model_fields.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=field.annotation, default=field.default)
+    args = parser.parse_args()
+
+    global config
+    config = FakeGeminiConfig(**{name: getattr(args, name) for name in FakeGeminiConfig.model_fields})
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
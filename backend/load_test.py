@@ -0,0 +1,173 @@
+"""
+End-to-end load generator for the API.
+
+Keeps `--concurrency` requests in flight against a running server and reports
+throughput and p50/p95/p99 latency per endpoint. Point the server at
+fake_gemini.py first so /analyze does not spend real quota:
+
+    python fake_gemini.py --port 8100 &
+    GEMINI_BASE_URL=http://127.0.0.1:8100/v1beta/models uvicorn app.main:app --port 8000 &
+    python load_test.py --concurrency 32 --duration 60 --mix analyze=8,stats=1,list=1
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from typing import Dict, List
+import httpx
+
+FIRST_NAMES = ["Sarah", "John", "Priya", "Wei", "Carlos", "Amara", "Lena", "Omar", "Yuki", "Mateo"]
+LAST_NAMES = ["Connor", "Smith", "Patel", "Zhang", "Garcia", "Okafor", "Fischer", "Haddad", "Sato", "Rossi"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Tyrell", "Soylent", "Cyberdyne"]
+NOTES = [
+    "We need a secure data platform for {n} users. Budget is around {budget}k and we want to start next quarter.",
+    "Looking for a CRM integration. I'm the {role} and need a proposal by end of month.",
+    "Can you send pricing? We are evaluating vendors for {n} seats.",
+    "Our team of {n} is migrating off a legacy system; timeline is {months} months, budget approved.",
+]
+ROLES = ["CTO", "VP Engineering", "Head of Sales", "IT Manager", "Founder"]
+
+ENDPOINTS = {
+    "analyze": ("POST", "/api/v1/analyze"),
+    "stats": ("GET", "/api/v1/stats"),
+    "list": ("GET", "/api/v1/"),
+}
+
+class LeadGenerator:
+    """
+    Random but plausible leads; `duplicate_rate` of them resubmit an earlier one.
+    """
+
+    def __init__(self, seed: int, duplicate_rate: float):
+        self.rng = random.Random(seed)
+        self.duplicate_rate = duplicate_rate
+        self.sent: List[dict] = []
+
+    def next(self) -> dict:
+        if self.sent and self.rng.random() < self.duplicate_rate:
+            return self.rng.choice(self.sent)
+        company = self.rng.choice(COMPANIES)
+        first_name, last_name = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+        domain = f"{company.lower().replace(' ', '')}-{self.rng.randint(1, 500)}.com"
+        lead = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": f"{first_name.lower()}.{last_name.lower()}.{uuid.UUID(int=self.rng.getrandbits(128)).hex[:6]}@{domain}",
+            "company_name": company,
+            "notes": self.rng.choice(NOTES).format(
+                n=self.rng.randint(5, 5000), budget=self.rng.randint(10, 500), role=self.rng.choice(ROLES), months=self.rng.randint(1, 12)
+            ),
+        }
+        self.sent.append(lead)
+        return lead
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank
+    rank = math.ceil(p / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint '{name}' (choose from {', '.join(ENDPOINTS)})")
+        weights[name.strip()] = int(weight or 1)
+    return weights
+
+async def run(args) -> dict:
+    weights = parse_mix(args.mix)
+    names, name_weights = list(weights), list(weights.values())
+    leads = LeadGenerator(args.seed, args.duplicate_rate)
+    rng = random.Random(args.seed + 1)
+    results = {name: {"latencies": [], "statuses": {}, "errors": 0} for name in names}
+
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    remaining = args.requests
+
+    def take() -> bool:
+        nonlocal remaining
+        if deadline is not None:
+            return time.perf_counter() < deadline
+        if remaining <= 0:
+            return False
+        remaining -= 1
+        return True
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        async def user():
+            while take():
+                name = rng.choices(names, weights=name_weights)[0]
+                method, path = ENDPOINTS[name]
+                started = time.perf_counter()
+                try:
+                    if method == "POST":
+                        response = await client.post(path, json=leads.next())
+                    else:
+                        response = await client.get(path, params={"limit": args.page_size} if name == "list" else None)
+                    status = str(response.status_code)
+                except httpx.HTTPError as e:
+                    status = type(e).__name__
+                elapsed = time.perf_counter() - started
+                result = results[name]
+                result["latencies"].append(elapsed)
+                result["statuses"][status] = result["statuses"].get(status, 0) + 1
+                if not status.startswith("2"):
+                    result["errors"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(args.concurrency)))
+        wall = time.perf_counter() - started
+
+    report = {"concurrency": args.concurrency, "wall_seconds": round(wall, 2), "endpoints": {}}
+    for name, result in results.items():
+        latencies = sorted(result["latencies"])
+        report["endpoints"][name] = {
+            "requests": len(latencies),
+            "errors": result["errors"],
+            "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "max_ms": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+            "statuses": result["statuses"],
+        }
+    return report
+
+def print_report(report: dict):
+    print(f"concurrency={report['concurrency']} wall={report['wall_seconds']}s")
+    print(f"{'endpoint':<10}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}  statuses")
+    for name, row in report["endpoints"].items():
+        print(
+            f"{name:<10}{row['requests']:>10}{row['errors']:>8}{row['throughput_rps']:>10}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}  {row['statuses']}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test /analyze, /stats and GET / of a running API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests kept in flight.")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run (overrides --requests).")
+    parser.add_argument("--requests", type=int, default=500, help="Total requests when no --duration is given.")
+    parser.add_argument("--mix", default="analyze=1,stats=1,list=1", help="Endpoint weights, e.g. analyze=8,stats=1,list=1.")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="Share of /analyze calls that resubmit an earlier lead.")
+    parser.add_argument("--page-size", type=int, default=100, help="limit= for GET /.")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from app.db.database import engine
+from app.db.init_db import init_db
+from app.models.lead import Lead
+from app.services.company import company_service, root_domain
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+BATCH_SIZE = 1000
+
+def migrate_companies():
+    """
+    Moves per-lead company_info onto shared Company rows: the newest lead of each
+    root domain seeds the Company, then every lead of that domain is linked to it
+    and its own copy of company_info / company_logo_url is cleared.
+    A seeded Company keeps the age of its lead's enrichment, so the refresher
+    picks up old data first instead of treating it as fresh for a full TTL.
+    """
+    companies = {}
+    linked = 0
+    last_id = None
+    with Session(engine) as session:
+        while True:
+            # Newest first, so the first lead seen for a domain holds its latest enrichment
+            statement = (
+                select(Lead.id, Lead.email, Lead.company_name, Lead.company_info, Lead.created_at)
+                .where(Lead.company_id.is_(None), Lead.company_info.is_not(None))
+                .order_by(Lead.id.desc())
+                .limit(BATCH_SIZE)
+            )
+            if last_id is not None:
+                statement = statement.where(Lead.id < last_id)
+            rows = session.exec(statement).all()
+            if not rows:
+                break
+            for lead_id, email, company_name, company_info, created_at in rows:
+                domain = root_domain(email.split("@")[-1])
+                if not company_service.is_company_domain(domain):
+                    continue
+                if domain not in companies:
+                    existing = company_service.get(domain)
+                    companies[domain] = existing.id if existing else company_service.upsert(domain, company_name, company_info, enriched_at=created_at).id
+                session.execute(
+                    update(Lead)
+                    .where(Lead.id == lead_id)
+                    .values(company_id=companies[domain], company_info=None, company_logo_url=None)
+                )
+                linked += 1
+            session.commit()
+            last_id = rows[-1][0]
+    return len(companies), linked
+
+if __name__ == "__main__":
+    init_db()
+    company_count, lead_count = migrate_companies()
+    print(f"Linked {lead_count} leads to {company_count} companies.")
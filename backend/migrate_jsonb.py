@@ -0,0 +1,42 @@
+from app.db.database import engine
+from app.db.init_db import add_missing_columns, convert_json_to_jsonb, add_missing_indexes
+from app.models.lead import Lead
+from app.utils.company_size import parse_company_size_min
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+BATCH_SIZE = 1000
+
+def backfill_company_size():
+    """
+    Fills Lead.company_size_min for leads saved before the column existed.
+    """
+    updated = 0
+    last_id = 0
+    with Session(engine) as session:
+        while True:
+            rows = session.exec(
+                select(Lead.id, Lead.company_info)
+                .where(Lead.id > last_id, Lead.company_size_min.is_(None), Lead.company_info.is_not(None))
+                .order_by(Lead.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            for lead_id, company_info in rows:
+                size_min = parse_company_size_min((company_info or {}).get("size"))
+                if size_min is not None:
+                    session.execute(update(Lead).where(Lead.id == lead_id).values(company_size_min=size_min))
+                    updated += 1
+            session.commit()
+            last_id = rows[-1][0]
+    return updated
+
+def migrate():
+    add_missing_columns()
+    convert_json_to_jsonb()
+    add_missing_indexes()
+    print(f"Backfilled company_size_min on {backfill_company_size()} leads.")
+
+if __name__ == "__main__":
+    migrate()
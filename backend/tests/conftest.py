@@ -0,0 +1,232 @@
+"""
+Fixtures for the backend test suite.
+
+Every test runs against a fresh SQLite database and an in-process fake of the
+Gemini generateContent endpoint, so no API key, Postgres or network is needed:
+
+    pip install pytest
+    pytest
+"""
+import asyncio
+import copy
+import json
+import os
+import tempfile
+
+# The app reads its settings at import time. Tests drop and recreate every table,
+# so DATABASE_URL is forced to a throw-away file rather than taken from .env.
+_DB_DIR = tempfile.mkdtemp(prefix="lms-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_FORMAT", "text")
+os.environ["GEMINI_CASSETTE_MODE"] = "off"
+# The shared limiter would pace the fake like the real API; its own tests build their own
+os.environ["GEMINI_RATE_LIMIT_ENABLED"] = "false"
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session
+from fake_gemini import prompt_kind
+from app.db.database import engine, async_engine
+from app.db.init_db import init_db
+from app.models.lead import Lead, LeadInput
+from app.models.settings import Settings
+from app.services.enrichment_cache import enrichment_cache
+from app.services.scoring_profiles import scoring_profile_service
+from app.services.settings_cache import settings_cache
+from app.utils.gemini_client import gemini_client
+
+VERIFICATION_ANSWER = {
+    "verification_status": "Verified Decision Maker",
+    "verification_score": 85,
+    "authority_tier": "Tier 1",
+    "identity_verified": True,
+    "employment_verified": True,
+    "verification_reason": "Listed as CTO on the company website.",
+    "intent_signal": "Strong",
+    "intent_evidence": "Hiring for a platform team.",
+}
+
+SCORING_ANSWER = {
+    "bant_analysis": {
+        "budget": "A budget of 200k is stated.",
+        "authority": "CTO, the economic buyer.",
+        "need": "Replacing a legacy system.",
+        "timeline": "This quarter.",
+    },
+    "score_dimensions": {
+        "authenticity": 90,
+        "authority": 90,
+        "budget_realism": 80,
+        "requirement_clarity": 80,
+        "organizational_footprint": 70,
+        "intent_signals": 60,
+    },
+    "risk_flags": [],
+    "follow_up_questions": ["Who else is involved in the decision?"],
+    "explanation": "Senior buyer with a clear need and budget.",
+}
+
+ENRICHMENT_ANSWER = {
+    "company_name": "Acme",
+    "industry": "Technology",
+    "size": "1000+",
+    "website": "https://acme.com",
+    "company_logo_url": "https://acme.com/logo.png",
+    "profile_image_url": None,
+}
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _enforce_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores foreign keys unless asked to; Postgres always enforces them
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+class FakeGemini:
+    """
+    Answers generateContent calls by prompt kind (enrichment, verification,
+    scoring, fused). Tests change `answers` or queue HTTP statuses in `fail`.
+    """
+
+    def __init__(self):
+        self.answers = {
+            "enrichment": copy.deepcopy(ENRICHMENT_ANSWER),
+            "verification": copy.deepcopy(VERIFICATION_ANSWER),
+            "scoring": copy.deepcopy(SCORING_ANSWER),
+            "fused": {**copy.deepcopy(VERIFICATION_ANSWER), **copy.deepcopy(SCORING_ANSWER)},
+        }
+        self.fail = [] # HTTP statuses returned, in order, before answering normally
+        self.latency = 0.0
+        self.requests = [] # (kind, model, body) per call
+
+    def calls(self, kind: str = None) -> int:
+        return sum(1 for call_kind, _, _ in self.requests if kind is None or call_kind == kind)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        prompt = body["contents"][0]["parts"][0]["text"]
+        kind = prompt_kind(prompt)
+        model = request.url.path.rsplit("/", 1)[-1].split(":", 1)[0]
+        self.requests.append((kind, model, body))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail:
+            return httpx.Response(self.fail.pop(0), json={"error": {"message": "injected"}})
+        text = json.dumps(self.answers.get(kind, {}))
+        return httpx.Response(200, json={
+            "candidates": [{"content": {"parts": [{"text": text}]}}],
+            "usageMetadata": {"promptTokenCount": 100, "candidatesTokenCount": 50, "totalTokenCount": 150},
+        })
+
+@pytest.fixture(autouse=True)
+def db():
+    """
+    Empty tables and cold in-process caches for every test.
+    """
+    SQLModel.metadata.drop_all(engine)
+    init_db()
+    settings_cache.invalidate()
+    enrichment_cache.invalidate()
+    scoring_profile_service._weights.clear()
+    yield engine
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """
+    Retries without waiting out the backoff.
+    """
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: real_sleep(0))
+
+@pytest.fixture
+def session(db):
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture
+def gemini(monkeypatch):
+    """
+    Routes the async Gemini client to a FakeGemini.
+    """
+    fake = FakeGemini()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    monkeypatch.setattr(gemini_client, "_get_async_client", lambda: client)
+    yield fake
+
+@pytest.fixture
+def client(gemini):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def app_settings(session):
+    """
+    Saves Settings overrides, e.g. app_settings(fast_path_enabled=True).
+    """
+    def save(**values) -> Settings:
+        settings_db = session.get(Settings, 1) or Settings(id=1)
+        for field, value in values.items():
+            setattr(settings_db, field, value)
+        settings_db.version = (settings_db.version or 0) + 1
+        session.add(settings_db)
+        session.commit()
+        session.refresh(settings_db)
+        settings_cache.store(settings_db)
+        return settings_db
+    return save
+
+LEAD = {
+    "first_name": "Sarah",
+    "last_name": "Connor",
+    "email": "sarah@acme.com",
+    "company_name": "Acme",
+    "notes": "We need a secure logistics platform for 1,200 seats. Budget is 200k and I sign off as CTO.",
+}
+
+@pytest.fixture
+def make_lead():
+    """
+    LeadInput factory: make_lead(email="bob@gmail.com").
+    """
+    return lambda **overrides: LeadInput(**{**LEAD, **overrides})
+
+@pytest.fixture
+def lead_input(make_lead):
+    return make_lead()
+
+@pytest.fixture
+def add_lead(session):
+    """
+    Saves a Lead row directly, without the pipeline: add_lead(score=40, category="Moderate").
+    """
+    def add(**overrides) -> Lead:
+        values = dict(
+            LEAD,
+            email_valid=True,
+            budget_analysis="A budget of 200k is stated.",
+            authority_analysis="CTO.",
+            need_analysis="Replacing a legacy system.",
+            timeline_analysis="This quarter.",
+            score=80,
+            category="High Confidence",
+            explanation="Senior buyer with a clear need and budget.",
+            score_breakdown={"Authenticity": 90, "Authority": 90, "Budget": 80, "Clarity": 80, "Footprint": 70, "Intent": 60, "RiskPenalty": 0},
+            risk_flags=[],
+            verification_status="Verified Decision Maker",
+            queue="Nurture",
+            routing_reason="Lead is Cold with a score of 80. Added to nurture campaign.",
+        )
+        values.update(overrides)
+        lead = Lead(**values)
+        session.add(lead)
+        session.commit()
+        session.refresh(lead)
+        return lead
+    return add
@@ -0,0 +1,20 @@
+import pathlib
+import subprocess
+import sys
+import pytest
+
+BENCHMARKS = pathlib.Path(__file__).parent.parent / "benchmarks"
+
+def test_benchmark_suite_runs_once_without_timing():
+    pytest.importorskip("pytest_benchmark")
+
+    # --benchmark-disable runs every benchmark body once as a plain test: nothing is timed, saved or compared
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "--benchmark-disable", str(BENCHMARKS)],
+        cwd=BENCHMARKS,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
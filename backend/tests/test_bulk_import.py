@@ -0,0 +1,62 @@
+import io
+import json
+from sqlmodel import select
+from app.models.lead import Lead
+from app.services.bulk_import import ImportFormat, iter_rows
+
+CSV = (
+    "first_name,last_name,email,company_name,notes\n"
+    "Sarah,Connor,sarah@acme.com,Acme,Need a secure logistics platform. Budget 200k.\n"
+    "Kyle,Reese,kyle@globex.com,Globex,Looking for payroll software for 200 people.\n"
+    "Bad,Row,not-an-email,Initech,Hello\n"
+)
+
+def import_file(client, name: str, content: str, **params) -> list:
+    response = client.post("/api/v1/leads/import", params=params, files={"file": (name, content.encode("utf-8"))})
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def test_csv_rows_are_analyzed_and_saved_in_batches(client, gemini, session):
+    events = import_file(client, "leads.csv", CSV, batch_size=1, concurrency=2)
+
+    rows = {event["row"]: event for event in events if event["type"] == "row"}
+    assert rows[1]["status"] == rows[2]["status"] == "ok"
+    assert rows[3]["status"] == "error"
+    assert "email" in rows[3]["error"]
+    assert sum(event["saved"] for event in events if event["type"] == "batch") == 2
+    assert events[-1]["type"] == "summary"
+    assert {key: events[-1][key] for key in ("processed", "succeeded", "failed", "saved")} == {"processed": 3, "succeeded": 2, "failed": 1, "saved": 2}
+    assert sorted(session.exec(select(Lead.email)).all()) == ["kyle@globex.com", "sarah@acme.com"]
+
+def test_ndjson_reports_malformed_lines(client, gemini):
+    lead = {"first_name": "Sarah", "last_name": "Connor", "email": "sarah@acme.com", "company_name": "Acme", "notes": "Budget 200k."}
+    content = json.dumps(lead) + "\n\n{not json\n[1, 2]\n"
+
+    events = import_file(client, "leads.ndjson", content)
+
+    rows = [event for event in events if event["type"] == "row"]
+    assert [row["status"] for row in rows if row["row"] == 1] == ["ok"]
+    errors = {row["row"]: row["error"] for row in rows if row["status"] == "error"}
+    assert errors[2].startswith("Invalid JSON")
+    assert errors[3] == "Each line must be a JSON object."
+    assert events[-1]["saved"] == 1
+
+def test_pipeline_errors_are_reported_per_row(client, gemini):
+    content = "first_name,last_name,email,company_name,notes\nSam,Smith,invalid@acme.com,Acme,Hi\n"
+
+    events = import_file(client, "leads.csv", content)
+
+    row = next(event for event in events if event["type"] == "row")
+    assert row["status"] == "error"
+    assert row["error"] == "Invalid email address provided."
+    assert events[-1]["saved"] == 0
+
+def test_format_defaults_from_the_extension():
+    assert ImportFormat.from_filename("leads.jsonl") == ImportFormat.NDJSON
+    assert ImportFormat.from_filename("LEADS.CSV") == ImportFormat.CSV
+    assert ImportFormat.from_filename(None) == ImportFormat.CSV
+
+def test_csv_values_are_trimmed():
+    stream = io.BytesIO("﻿first_name , notes\n Sarah , hi \n".encode("utf-8"))
+
+    assert list(iter_rows(stream, ImportFormat.CSV)) == [(1, {"first_name": "Sarah", "notes": "hi"}, None)]
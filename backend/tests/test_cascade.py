@@ -0,0 +1,51 @@
+import asyncio
+from app.models.settings import SettingsSnapshot
+from app.services.cascade import scoring_cascade
+from app.services.pipeline import lead_pipeline
+
+CASCADE = dict(cascade_enabled=True, selected_model="gemini-2.5-flash", escalation_model="gemini-1.5-pro")
+
+def scoring_models(gemini) -> list:
+    return [model for kind, model, _ in gemini.requests if kind == "scoring"]
+
+def test_borderline_score_is_rescored_by_the_escalation_model(gemini, lead_input):
+    settings_db = SettingsSnapshot(**CASCADE, cascade_band_low=70, cascade_band_high=85)
+    escalations = scoring_cascade.get_stats()["escalations"]["uncertainty_band"]
+
+    analyzed = asyncio.run(lead_pipeline.analyze(lead_input, settings_db))
+
+    assert scoring_models(gemini) == ["gemini-2.5-flash", "gemini-1.5-pro"]
+    assert gemini.calls("verification") == 1
+    assert analyzed.lead_score.score == 80
+    assert scoring_cascade.get_stats()["escalations"]["uncertainty_band"] == escalations + 1
+
+def test_confident_score_stays_with_the_fast_model(gemini, lead_input):
+    settings_db = SettingsSnapshot(**CASCADE, cascade_band_low=40, cascade_band_high=60)
+
+    asyncio.run(lead_pipeline.analyze(lead_input, settings_db))
+
+    assert scoring_models(gemini) == ["gemini-2.5-flash"]
+
+def test_unverified_lead_is_escalated(gemini, lead_input):
+    gemini.answers["verification"]["verification_status"] = "Unverified"
+    settings_db = SettingsSnapshot(**CASCADE, cascade_band_low=0, cascade_band_high=0)
+
+    asyncio.run(lead_pipeline.analyze(lead_input, settings_db))
+
+    assert scoring_models(gemini) == ["gemini-2.5-flash", "gemini-1.5-pro"]
+
+def test_disabled_cascade_never_escalates(gemini, lead_input):
+    settings_db = SettingsSnapshot(**dict(CASCADE, cascade_enabled=False), cascade_band_low=0, cascade_band_high=100)
+
+    asyncio.run(lead_pipeline.analyze(lead_input, settings_db))
+
+    assert scoring_models(gemini) == ["gemini-2.5-flash"]
+
+def test_inverted_band_is_rejected(client):
+    response = client.put("/api/v1/settings", json={"cascade_band_low": 80, "cascade_band_high": 40})
+
+    assert response.status_code == 422
+
+def test_band_outside_the_score_range_is_rejected(client):
+    assert client.put("/api/v1/settings", json={"cascade_band_low": -50}).status_code == 422
+    assert client.put("/api/v1/settings", json={"cascade_band_high": 500}).status_code == 422
@@ -0,0 +1,61 @@
+import asyncio
+from datetime import datetime, timedelta
+from sqlmodel import select
+from app.models.company import Company
+from app.services.company import company_service, root_domain
+from app.services.enrichment import enrichment_service
+from migrate_companies import migrate_companies
+
+def test_freemail_repeat_is_served_from_the_enrichment_cache(gemini):
+    first = asyncio.run(enrichment_service.enrich_lead_async("Bobs", "bob@gmail.com"))
+    second = asyncio.run(enrichment_service.enrich_lead_async("Bobs", "bob2@gmail.com"))
+
+    assert gemini.calls("enrichment") == 1
+    assert second.company_info == first.company_info
+    assert first.company_id is second.company_id is None
+
+def test_freemail_repeat_through_the_api(client, gemini, make_lead):
+    for email in ("bob@gmail.com", "bob2@gmail.com"):
+        response = client.post("/api/v1/analyze", json=make_lead(email=email, company_name="Bobs").model_dump())
+        assert response.status_code == 200
+
+    assert gemini.calls("enrichment") == 1
+
+def test_company_domain_leads_share_one_row(client, gemini, make_lead, session):
+    for email in ("sarah@acme.com", "kyle@eu.acme.com"):
+        assert client.post("/api/v1/analyze", json=make_lead(email=email).model_dump()).status_code == 200
+
+    companies = session.exec(select(Company)).all()
+    assert [company.domain for company in companies] == ["acme.com"]
+    assert gemini.calls("enrichment") == 1
+    leads = client.get("/api/v1/").json()
+    assert {lead["company_id"] for lead in leads} == {companies[0].id}
+    assert {lead["company_info"]["industry"] for lead in leads} == {"Technology"}
+
+def test_refresh_keeps_the_row_when_gemini_fails(session):
+    session.add(Company(domain="acme.com", name="Acme", company_info={"industry": "Technology"}, refresh_after=datetime.utcnow() - timedelta(hours=1)))
+    session.commit()
+
+    async def failing(company_name, domain):
+        raise RuntimeError("quota")
+
+    assert asyncio.run(company_service.refresh_stale(failing, batch_size=10)) == 0
+    # Claimed for one lease, so another refresher does not pick it up straight away
+    assert company_service.claim_stale(10) == []
+    assert company_service.get("acme.com").company_info == {"industry": "Technology"}
+
+def test_migrated_company_keeps_the_age_of_its_data(add_lead):
+    enriched_at = datetime.utcnow() - timedelta(days=365)
+    add_lead(company_info={"industry": "Technology"}, created_at=enriched_at)
+
+    assert migrate_companies() == (1, 1)
+
+    company = company_service.get("acme.com")
+    assert company.enriched_at == enriched_at
+    # Due for a refresh straight away
+    assert [stale.domain for stale in company_service.claim_stale(10)] == ["acme.com"]
+
+def test_root_domain():
+    assert root_domain("mail.eu.acme.com") == "acme.com"
+    assert root_domain("sales.acme.co.uk") == "acme.co.uk"
+    assert root_domain("Acme.COM.") == "acme.com"
@@ -0,0 +1,25 @@
+import asyncio
+from sqlmodel import select
+from app.db.database import _async_url, _pool_options, async_session_factory
+from app.models.lead import Lead
+
+def test_sync_urls_map_to_async_drivers():
+    assert _async_url("postgresql://user:secret@db/leads") == "postgresql+asyncpg://user:secret@db/leads"
+    assert _async_url("postgresql+psycopg2://user@db/leads") == "postgresql+asyncpg://user@db/leads"
+    assert _async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    # Already async (or unknown) drivers are left alone
+    assert _async_url("postgresql+asyncpg://db/leads") == "postgresql+asyncpg://db/leads"
+
+def test_pool_sizing_is_skipped_for_sqlite():
+    assert "pool_size" not in _pool_options("sqlite:///./test.db")
+    postgres = _pool_options("postgresql://db/leads")
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_pre_ping", "pool_recycle"} <= set(postgres)
+
+def test_async_session_sees_committed_rows(add_lead):
+    lead_id = add_lead().id
+
+    async def read():
+        async with async_session_factory() as session:
+            return (await session.exec(select(Lead.email).where(Lead.id == lead_id))).one()
+
+    assert asyncio.run(read()) == "sarah@acme.com"
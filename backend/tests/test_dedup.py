@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlmodel import select, update
+from app.db.init_db import init_db
+from app.models.dedup import LeadLshBucket
+from app.models.lead import Lead, LeadVerificationStatus, AuthorityTier
+from app.services.dedup import dedup_service, normalize_email
+
+def analyze(client, lead) -> dict:
+    response = client.post("/api/v1/analyze", json=lead.model_dump())
+    assert response.status_code == 200
+    return response.json()
+
+def test_repeat_email_reuses_the_first_analysis(client, gemini, app_settings, make_lead, session):
+    app_settings(dedup_enabled=True)
+    first = analyze(client, make_lead())
+    calls = gemini.calls()
+
+    second = analyze(client, make_lead(email="Sarah+demo@Acme.com"))
+
+    assert gemini.calls() == calls
+    assert second["duplicate_match"] == "email"
+    assert second["lead_score"] == first["lead_score"]
+    original_id = session.exec(select(Lead.id).where(Lead.email == "sarah@acme.com")).one()
+    assert second["duplicate_of_id"] == original_id
+
+def test_near_identical_inquiry_from_another_address(client, gemini, app_settings, make_lead):
+    app_settings(dedup_enabled=True)
+    analyze(client, make_lead())
+    calls = gemini.calls()
+
+    second = analyze(client, make_lead(email="s.connor@acme.com"))
+
+    assert second["duplicate_match"] == "near_duplicate"
+    assert gemini.calls() == calls
+
+def test_original_without_verification_is_copied_as_unverified(client, gemini, app_settings, add_lead, make_lead, session):
+    app_settings(dedup_enabled=True)
+    original = add_lead(email_normalized="sarah@acme.com")
+    # Saved before verification existed: the columns were added later, empty
+    session.exec(update(Lead).where(Lead.id == original.id).values(verification_status=None, authority_tier=None))
+    session.commit()
+
+    duplicate = analyze(client, make_lead())
+
+    assert duplicate["duplicate_match"] == "email"
+    assert duplicate["verification_result"]["status"] == LeadVerificationStatus.UNVERIFIED.value
+    assert duplicate["verification_result"]["authority_tier"] == AuthorityTier.UNKNOWN.value
+    assert gemini.calls() == 0
+
+def test_dedup_is_off_by_default(client, gemini, make_lead, session):
+    analyze(client, make_lead())
+
+    second = analyze(client, make_lead())
+
+    assert second["duplicate_of_id"] is None
+    assert gemini.calls("scoring") == 2
+    # No LSH buckets are written while the feature is off
+    assert session.exec(select(LeadLshBucket)).all() == []
+
+def test_enabling_dedup_indexes_leads_saved_while_it_was_off(client, gemini, make_lead):
+    analyze(client, make_lead())
+
+    assert client.put("/api/v1/settings", json={"dedup_enabled": True}).status_code == 200
+    calls = gemini.calls()
+    second = analyze(client, make_lead(email="s.connor@acme.com"))
+
+    assert second["duplicate_match"] == "near_duplicate"
+    assert gemini.calls() == calls
+
+def test_historical_leads_are_backfilled(app_settings, add_lead, make_lead, session):
+    # Saved before duplicate detection existed
+    old = add_lead(email="Sarah+demo@Acme.com", email_normalized=None)
+    stale = add_lead(created_at=datetime.utcnow() - timedelta(days=30))
+    app_settings(dedup_enabled=True)
+
+    init_db()
+
+    session.refresh(old)
+    assert old.email_normalized == "sarah@acme.com"
+    indexed = set(session.exec(select(LeadLshBucket.lead_id)).all())
+    assert indexed == {old.id}
+    assert stale.id not in indexed
+    assert dedup_service.find_match(make_lead(email="kyle@acme.com")).lead.id == old.id
+
+@pytest.mark.parametrize("email, normalized", [
+    ("Sarah@Acme.com", "sarah@acme.com"),
+    ("sarah+news@acme.com", "sarah@acme.com"),
+    ("s.a.rah@gmail.com", "sarah@gmail.com"),
+    ("s.connor@acme.com", "s.connor@acme.com"),
+])
+def test_normalize_email(email, normalized):
+    assert normalize_email(email) == normalized
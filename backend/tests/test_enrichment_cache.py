@@ -0,0 +1,65 @@
+from datetime import timedelta
+from app.services.enrichment_cache import EnrichmentCache, enrichment_cache
+
+INFO = {"company_name": "Acme", "industry": "Technology"}
+
+def test_hit_ignores_www_and_legal_suffix():
+    cache = EnrichmentCache(max_entries=10, ttl=timedelta(hours=1))
+    cache.set("www.Acme.com", "Acme, Inc.", INFO)
+
+    assert cache.get("acme.com", "ACME") == INFO
+    assert cache.get_stats()["memory_hits"] == 1
+
+def test_persistent_tier_survives_a_cold_process():
+    EnrichmentCache(max_entries=10, ttl=timedelta(hours=1)).set("acme.com", "Acme", INFO)
+    cache = EnrichmentCache(max_entries=10, ttl=timedelta(hours=1))
+
+    assert cache.get("acme.com", "Acme") == INFO
+    assert cache.get("acme.com", "Acme") == INFO
+    assert cache.get_stats()["db_hits"] == 1
+    assert cache.get_stats()["memory_hits"] == 1
+
+def test_returned_info_is_a_copy():
+    cache = EnrichmentCache(max_entries=10, ttl=timedelta(hours=1))
+    cache.set("acme.com", "Acme", INFO)
+
+    cache.get("acme.com", "Acme")["industry"] = "Changed"
+
+    assert cache.get("acme.com", "Acme")["industry"] == "Technology"
+
+def test_expired_entries_miss():
+    cache = EnrichmentCache(max_entries=10, ttl=timedelta(seconds=-1))
+    cache.set("acme.com", "Acme", INFO)
+
+    assert cache.get("acme.com", "Acme") is None
+    assert cache.purge_expired() == 1
+
+def test_least_recently_used_entry_is_evicted():
+    cache = EnrichmentCache(max_entries=2, ttl=timedelta(hours=1))
+    cache.set("a.com", "A", INFO)
+    cache.set("b.com", "B", INFO)
+    cache.get("a.com", "A")
+    cache.set("c.com", "C", INFO)
+
+    assert list(cache._lru) == [cache.make_key("a.com", "A"), cache.make_key("c.com", "C")]
+    assert cache.get_stats()["evictions"] == 1
+
+def test_invalidate_by_domain_clears_both_tiers():
+    cache = EnrichmentCache(max_entries=10, ttl=timedelta(hours=1))
+    cache.set("acme.com", "Acme", INFO)
+    cache.set("acme.com", "Acme Labs", INFO)
+    cache.set("other.com", "Other", INFO)
+
+    assert cache.invalidate(domain="acme.com") == 2
+    assert cache.get("acme.com", "Acme") is None
+    assert cache.get("other.com", "Other") == INFO
+
+def test_invalidate_endpoint(client):
+    enrichment_cache.set("acme.com", "Acme", INFO)
+    enrichment_cache.set("globex.com", "Globex", INFO)
+
+    response = client.delete("/api/v1/system/enrichment-cache", params={"domain": "acme.com"})
+
+    assert response.json() == {"invalidated": 1}
+    assert enrichment_cache.get("acme.com", "Acme") is None
+    assert enrichment_cache.get("globex.com", "Globex") == INFO
@@ -0,0 +1,59 @@
+import asyncio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import fake_gemini
+from fake_gemini import FakeGeminiConfig
+from load_test import percentile, parse_mix
+from app.services.pipeline import lead_pipeline
+from app.utils.gemini_client import gemini_client
+
+ENRICHMENT_PROMPT = 'You are a data enrichment bot. Find details for the company "Acme" (Domain: acme.com).'
+
+def generate(server, prompt: str, tools=None):
+    body = {"contents": [{"parts": [{"text": prompt}]}], **({"tools": tools} if tools else {})}
+    return server.post("/v1beta/models/gemini-2.5-flash:generateContent", json=body)
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(fake_gemini, "config", FakeGeminiConfig(latency_ms=0, fenced_rate=0))
+    monkeypatch.setattr(fake_gemini, "stats", {"requests": 0, "rate_limited": 0, "malformed": 0, "by_kind": {}})
+    return TestClient(fake_gemini.app)
+
+def test_same_prompt_gets_the_same_answer(server):
+    first = generate(server, ENRICHMENT_PROMPT).json()
+    second = generate(server, ENRICHMENT_PROMPT).json()
+
+    assert first["candidates"] == second["candidates"]
+    assert '"website": "https://acme.com"' in first["candidates"][0]["content"]["parts"][0]["text"]
+    assert first["usageMetadata"]["totalTokenCount"] > 0
+    assert server.get("/stats").json()["by_kind"] == {"enrichment": 2}
+
+def test_injected_rate_limits_and_malformed_answers(server):
+    server.put("/config", json={"rate_limit_rate": 1.0, "unknown": 1})
+    assert generate(server, ENRICHMENT_PROMPT).status_code == 429
+    assert "unknown" not in server.get("/config").json()
+
+    server.put("/config", json={"rate_limit_rate": 0.0, "malformed_rate": 1.0})
+    text = generate(server, ENRICHMENT_PROMPT).json()["candidates"][0]["content"]["parts"][0]["text"]
+    assert not text.rstrip().endswith("}")
+    assert server.get("/stats").json()["malformed"] == 1
+
+def test_pipeline_runs_against_the_fake_server(server, monkeypatch, lead_input):
+    fake_gemini.config.fenced_rate = 1.0
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_gemini.app))
+    monkeypatch.setattr(gemini_client, "_get_async_client", lambda: client)
+
+    analyzed = asyncio.run(lead_pipeline.analyze(lead_input))
+
+    assert analyzed.lead_score.category != "Unscored"
+    assert analyzed.enrichment_data.company_info["website"] == "https://acme.com"
+    assert fake_gemini.stats["by_kind"] == {"enrichment": 1, "verification": 1, "scoring": 1}
+
+def test_load_test_helpers():
+    assert percentile([], 95) == 0.0
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+    assert parse_mix("analyze=8, stats") == {"analyze": 8, "stats": 1}
+    with pytest.raises(SystemExit):
+        parse_mix("delete=1")
@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from app.models.lead import LeadVerificationStatus
+from app.models.settings import SettingsSnapshot
+from app.services.fast_path import fast_path_service
+from app.services.pipeline import lead_pipeline
+
+FAST_PATH = SettingsSnapshot(fast_path_enabled=True)
+
+@pytest.mark.parametrize("overrides, rule", [
+    ({"email": "bob@mailinator.com"}, "disposable_email"),
+    ({"email": "bob@example.com"}, "invalid_email"),
+    ({"email": "test@acme.com"}, "invalid_email"),
+    ({"email": "ceo.walmart@gmail.com", "company_name": "Walmart Inc.", "notes": "I am the CEO and want a demo."}, "freemail_executive_impersonation"),
+    ({"notes": "hi"}, "empty_notes"),
+])
+def test_rules(make_lead, overrides, rule):
+    assert fast_path_service.evaluate(make_lead(**overrides)).rule == rule
+
+def test_ordinary_lead_is_left_to_the_model(lead_input, make_lead):
+    assert fast_path_service.evaluate(lead_input) is None
+    # A CXO title from a personal mailbox is fine for a company outside the list
+    assert fast_path_service.evaluate(make_lead(email="sarah@gmail.com", notes="I am the CTO of a small startup.")) is None
+    # Terse but real inquiries still deserve a proper score
+    assert fast_path_service.evaluate(make_lead(notes="Need pricing")) is None
+    assert fast_path_service.evaluate(make_lead(notes="Demo please")) is None
+
+def test_junk_lead_is_settled_without_gemini(gemini, client, make_lead, app_settings):
+    app_settings(fast_path_enabled=True)
+    lead = make_lead(email="bob@mailinator.com").model_dump()
+
+    response = client.post("/api/v1/analyze", json=lead)
+
+    assert response.status_code == 200
+    analyzed = response.json()
+    assert analyzed["fast_path_rule"] == "disposable_email"
+    assert analyzed["lead_score"]["score"] == 0
+    assert analyzed["verification_result"]["status"] == LeadVerificationStatus.LIKELY_FAKE.value
+    assert analyzed["enrichment_data"]["email_valid"] is False
+    assert gemini.calls() == 0
+    assert client.get("/api/v1/").json()[0]["fast_path_rule"] == "disposable_email"
+
+def test_empty_notes_get_the_baseline_score(gemini, make_lead):
+    analyzed = asyncio.run(lead_pipeline.analyze(make_lead(notes="test"), FAST_PATH))
+
+    assert analyzed.lead_score.score == 20
+    assert analyzed.verification_result.status == LeadVerificationStatus.UNVERIFIED
+    assert analyzed.enrichment_data.email_valid is True
+    assert gemini.calls() == 0
+
+def test_fast_path_is_off_by_default(gemini, make_lead):
+    analyzed = asyncio.run(lead_pipeline.analyze(make_lead(email="bob@mailinator.com"), SettingsSnapshot()))
+
+    assert analyzed.fast_path_rule is None
+    assert gemini.calls("scoring") == 1
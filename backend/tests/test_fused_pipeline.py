@@ -0,0 +1,38 @@
+import asyncio
+from app.models.lead import LeadVerificationStatus
+from app.models.settings import SettingsSnapshot, PipelineMode
+from app.services.pipeline import lead_pipeline
+
+FUSED = SettingsSnapshot(pipeline_mode=PipelineMode.FUSED.value)
+
+def test_fused_mode_verifies_and_scores_in_one_call(gemini, lead_input):
+    analyzed = asyncio.run(lead_pipeline.analyze(lead_input, FUSED))
+
+    assert gemini.calls("fused") == 1
+    assert gemini.calls("verification") == gemini.calls("scoring") == 0
+    _, _, body = next(request for request in gemini.requests if request[0] == "fused")
+    assert body["tools"] == [{"google_search": {}}]
+    assert analyzed.verification_result.status == LeadVerificationStatus.VERIFIED_DECISION_MAKER
+    assert analyzed.lead_score.score == 80
+    assert analyzed.lead_score.category == "High Confidence"
+
+def test_fused_mode_keeps_the_fraud_override(gemini, lead_input):
+    gemini.answers["fused"]["verification_status"] = "Likely Fake"
+
+    analyzed = asyncio.run(lead_pipeline.analyze(lead_input, FUSED))
+
+    assert analyzed.lead_score.score == 0
+    assert analyzed.lead_score.score_breakdown["Authenticity"] == 0
+
+def test_malformed_fused_answer_falls_back(gemini, lead_input):
+    gemini.answers["fused"] = {"verification_status": "Verified Decision Maker"}
+
+    analyzed = asyncio.run(lead_pipeline.analyze(lead_input, FUSED))
+
+    assert analyzed.lead_score.category == "Unscored"
+    assert analyzed.verification_result.status == LeadVerificationStatus.UNVERIFIED
+
+def test_unknown_pipeline_mode_is_rejected(client):
+    response = client.put("/api/v1/settings", json={"pipeline_mode": "turbo"})
+
+    assert response.status_code == 422
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from app.utils.gemini_cassette import CassetteMode, GeminiCassette, GeminiCassetteMissError
+from app.utils.gemini_client import gemini_client
+
+PROMPT = "You are a data enrichment bot."
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return str(tmp_path / "cassette.sqlite3")
+
+def use_cassette(monkeypatch, path: str, mode: CassetteMode, replay_latency: str = "zero") -> GeminiCassette:
+    cassette = GeminiCassette(path, mode, replay_latency=replay_latency)
+    monkeypatch.setattr(gemini_client, "cassette", cassette)
+    return cassette
+
+def test_recorded_answers_replay_without_calling_gemini(gemini, monkeypatch, cassette_path):
+    recorder = use_cassette(monkeypatch, cassette_path, CassetteMode.RECORD)
+    recorded = asyncio.run(gemini_client.generate_json_response_async(PROMPT, use_search=True))
+    recorder.close()
+    assert recorder.get_stats()["recorded"] == 1
+
+    player = use_cassette(monkeypatch, cassette_path, CassetteMode.REPLAY)
+    replayed = asyncio.run(gemini_client.generate_json_response_async(PROMPT, use_search=True))
+
+    assert replayed == recorded
+    assert gemini.calls() == 1
+    assert player.get_stats()["replayed"] == 1
+
+def test_replay_miss_raises(gemini, monkeypatch, cassette_path):
+    GeminiCassette(cassette_path, CassetteMode.RECORD).record(gemini_client.model_name, PROMPT, False, {"ok": True}, 0.1)
+    use_cassette(monkeypatch, cassette_path, CassetteMode.REPLAY)
+
+    # Keyed on use_search too: a search-less answer does not stand in for a grounded one
+    with pytest.raises(GeminiCassetteMissError):
+        asyncio.run(gemini_client.generate_json_response_async(PROMPT, use_search=True))
+    assert gemini.calls() == 0
+
+def test_recorded_latency_is_kept(cassette_path):
+    cassette = GeminiCassette(cassette_path, CassetteMode.RECORD)
+    cassette.record("gemini-2.5-flash", PROMPT, False, {"ok": True}, latency_seconds=0.25)
+
+    recorded = GeminiCassette(cassette_path, CassetteMode.REPLAY)
+    zero = GeminiCassette(cassette_path, CassetteMode.REPLAY, replay_latency="zero")
+
+    assert recorded.lookup("gemini-2.5-flash", PROMPT, False) == ({"ok": True}, 0.25)
+    assert zero.lookup("gemini-2.5-flash", PROMPT, False) == ({"ok": True}, 0.0)
+
+def test_unknown_mode_is_rejected(cassette_path):
+    with pytest.raises(ValueError):
+        GeminiCassette(cassette_path, "rewind")
@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from app.config import settings
+from app.utils.gemini_client import gemini_client, GeminiRateLimitError
+
+def test_async_response_is_decoded(gemini):
+    gemini.answers["scoring"] = {"explanation": "ok"}
+
+    result = asyncio.run(gemini_client.generate_json_response_async("You are a Lead Qualification Agent."))
+
+    assert result == {"explanation": "ok"}
+    assert gemini.calls("scoring") == 1
+
+def test_search_requests_carry_the_search_tool(gemini):
+    asyncio.run(gemini_client.generate_json_response_async("You are a data enrichment bot.", use_search=True))
+
+    _, model, body = gemini.requests[0]
+    assert model == gemini_client.model_name
+    assert body["tools"] == [{"google_search": {}}]
+    assert "generationConfig" not in body
+
+def test_server_errors_are_retried(gemini, no_backoff):
+    gemini.fail = [503]
+
+    result = asyncio.run(gemini_client.generate_json_response_async("You are a data enrichment bot."))
+
+    assert result["company_name"] == "Acme"
+    assert gemini.calls() == 2
+
+def test_rate_limit_raises_after_all_retries(gemini, no_backoff):
+    gemini.fail = [429] * settings.gemini_max_retries
+
+    with pytest.raises(GeminiRateLimitError):
+        asyncio.run(gemini_client.generate_json_response_async("You are a data enrichment bot."))
+    assert gemini.calls() == settings.gemini_max_retries
+
+def test_analyze_runs_on_the_async_client(client, gemini):
+    response = client.post("/api/v1/analyze", json={
+        "first_name": "Sarah",
+        "last_name": "Connor",
+        "email": "sarah@acme.com",
+        "company_name": "Acme",
+        "notes": "We need a secure logistics platform. Budget is 200k.",
+    })
+
+    assert response.status_code == 200
+    assert response.json()["lead_score"]["score"] > 0
+    assert {"enrichment", "verification", "scoring"} <= {kind for kind, _, _ in gemini.requests}
+
+def test_analyze_maps_gemini_rate_limit_to_429(client, gemini, no_backoff):
+    gemini.fail = [429] * 100
+
+    response = client.post("/api/v1/analyze", json={
+        "first_name": "Sarah",
+        "last_name": "Connor",
+        "email": "sarah@acme.com",
+        "company_name": "Acme",
+        "notes": "We need a secure logistics platform. Budget is 200k.",
+    })
+
+    assert response.status_code == 429
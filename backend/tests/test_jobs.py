@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime, timedelta
+from sqlmodel import Session
+from app.db.database import engine
+from app.models.job import AnalysisJob, JobStatus
+from app.services.jobs import job_queue
+from app.worker import JobWorker
+
+LEAD = {
+    "first_name": "Sarah",
+    "last_name": "Connor",
+    "email": "sarah@acme.com",
+    "company_name": "Acme",
+    "notes": "We need a secure logistics platform. Budget is 200k.",
+}
+
+def run_next_job(worker_id: str = "test-worker"):
+    worker = JobWorker(concurrency=1, poll_interval=0)
+    worker.worker_id = worker_id
+    claimed = job_queue.claim(worker_id)
+    assert claimed is not None
+    asyncio.run(worker._process(*claimed))
+
+def get_job(job_id: str) -> AnalysisJob:
+    with Session(engine) as session:
+        return session.get(AnalysisJob, job_id)
+
+def test_job_is_queued_and_processed(client, gemini):
+    response = client.post("/api/v1/analyze/jobs", json=LEAD)
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    assert response.headers["Location"] == f"/api/v1/analyze/jobs/{job_id}"
+    assert response.json()["status"] == JobStatus.QUEUED.value
+
+    run_next_job()
+
+    job = client.get(f"/api/v1/analyze/jobs/{job_id}").json()
+    assert job["status"] == JobStatus.SUCCEEDED.value
+    assert job["attempts"] == 1
+    assert job["lead_id"] is not None
+    assert job["result"]["lead_input"]["email"] == LEAD["email"]
+
+def test_long_poll_gives_up_after_wait(client, monkeypatch):
+    monkeypatch.setattr("app.api.jobs.settings.job_poll_interval", 0.01)
+    job_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+
+    job = client.get(f"/api/v1/analyze/jobs/{job_id}", params={"wait": 0.05}).json()
+
+    assert job["status"] == JobStatus.QUEUED.value
+
+def test_unknown_job_is_404(client):
+    assert client.get("/api/v1/analyze/jobs/nope").status_code == 404
+
+def test_invalid_lead_fails_the_job(client, gemini):
+    job_id = client.post("/api/v1/analyze/jobs", json=dict(LEAD, email="invalid@acme.com")).json()["id"]
+
+    run_next_job()
+
+    job = client.get(f"/api/v1/analyze/jobs/{job_id}").json()
+    assert job["status"] == JobStatus.FAILED.value
+    assert job["error_code"] == 400
+    assert gemini.calls() == 0
+
+def test_a_job_is_claimed_once(client):
+    client.post("/api/v1/analyze/jobs", json=LEAD)
+
+    assert job_queue.claim("worker-a") is not None
+    assert job_queue.claim("worker-b") is None
+
+def test_orphaned_jobs_are_requeued_until_out_of_attempts(client):
+    retry_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+    exhausted_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+    with Session(engine) as session:
+        for job_id, attempts in ((retry_id, 1), (exhausted_id, 3)):
+            job = session.get(AnalysisJob, job_id)
+            job.status = JobStatus.RUNNING.value
+            job.started_at = datetime.utcnow() - timedelta(hours=1)
+            job.attempts = attempts
+            job.worker_id = "dead-worker"
+            session.add(job)
+        session.commit()
+
+    assert job_queue.requeue_stale(timedelta(minutes=10), max_attempts=3) == (1, 1)
+
+    assert get_job(retry_id).status == JobStatus.QUEUED.value
+    exhausted = get_job(exhausted_id)
+    assert exhausted.status == JobStatus.FAILED.value
+    assert exhausted.error_code == 500
+    assert exhausted.worker_id is None
+
+def test_running_jobs_inside_the_timeout_are_left_alone(client):
+    job_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+    job_queue.claim("live-worker")
+
+    assert job_queue.requeue_stale(timedelta(minutes=10)) == (0, 0)
+    assert get_job(job_id).status == JobStatus.RUNNING.value
+
+def test_deleting_the_lead_keeps_the_job(client, gemini):
+    job_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+    run_next_job()
+    lead_id = get_job(job_id).lead_id
+
+    assert client.delete(f"/api/v1/{lead_id}").status_code == 204
+
+    job = get_job(job_id)
+    assert job.status == JobStatus.SUCCEEDED.value
+    assert job.lead_id is None
+
+def test_a_reclaimed_job_is_completed_once(client, gemini):
+    job_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+    slow_worker = JobWorker(concurrency=1, poll_interval=0)
+    slow = job_queue.claim(slow_worker.worker_id)
+    with Session(engine) as db:
+        job = db.get(AnalysisJob, job_id)
+        job.started_at = datetime.utcnow() - timedelta(hours=1)
+        db.add(job)
+        db.commit()
+    assert job_queue.requeue_stale(timedelta(minutes=10)) == (1, 0)
+    run_next_job()
+    lead_id = get_job(job_id).lead_id
+
+    # The first worker finally finishes: its result is discarded
+    asyncio.run(slow_worker._process(*slow))
+
+    job = get_job(job_id)
+    assert job.status == JobStatus.SUCCEEDED.value
+    assert job.lead_id == lead_id
+    assert len(client.get("/api/v1/").json()) == 1
+
+def test_rate_limited_job_waits_before_it_is_claimed_again(client, gemini, monkeypatch):
+    monkeypatch.setattr("app.worker.lead_pipeline.analyze", _rate_limited)
+    job_id = client.post("/api/v1/analyze/jobs", json=LEAD).json()["id"]
+
+    run_next_job()
+
+    job = get_job(job_id)
+    assert job.status == JobStatus.QUEUED.value
+    assert job.not_before > datetime.utcnow()
+    assert job_queue.claim("test-worker") is None
+
+    with Session(engine) as db:
+        job.not_before = datetime.utcnow() - timedelta(seconds=1)
+        db.add(job)
+        db.commit()
+    assert job_queue.claim("test-worker")[2] == 2
+
+async def _rate_limited(lead_input, settings_db):
+    raise Exception("Gemini Rate Limit exceeded")
+
+def test_backoff_doubles_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr("app.services.jobs.random.uniform", lambda low, high: 1.0)
+    monkeypatch.setattr("app.services.jobs.settings.job_retry_base_seconds", 10)
+    monkeypatch.setattr("app.services.jobs.settings.job_retry_max_seconds", 30)
+
+    assert [job_queue.retry_delay(attempts) for attempts in (1, 2, 3)] == [10, 20, 30]
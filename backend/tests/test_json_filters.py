@@ -0,0 +1,44 @@
+import pytest
+from datetime import datetime, timedelta
+from app.models.company import Company
+from app.utils.company_size import parse_company_size_min
+
+def emails(client, **params) -> list:
+    response = client.get("/api/v1/", params=params)
+    assert response.status_code == 200
+    return sorted(lead["email"] for lead in response.json())
+
+@pytest.fixture
+def leads(session, add_lead):
+    company = Company(domain="globex.com", name="Globex", company_info={"industry": "Logistics", "size": "50-200"}, refresh_after=datetime.utcnow() + timedelta(days=30))
+    session.add(company)
+    session.commit()
+    add_lead(email="a@acme.com", risk_flags=["Industry Mismatch", "Vague Notes"], company_info={"industry": "Technology"}, company_size_min=1000)
+    add_lead(email="b@acme.com", risk_flags=["Vague Notes"], company_info={"industry": "Technology"}, company_size_min=10)
+    # Company details shared through the Company row rather than copied onto the lead
+    add_lead(email="c@globex.com", company_id=company.id, company_size_min=50)
+
+def test_risk_flags_must_all_be_present(client, leads):
+    assert emails(client, risk_flag="Vague Notes") == ["a@acme.com", "b@acme.com"]
+    assert emails(client, risk_flag=["Vague Notes", "Industry Mismatch"]) == ["a@acme.com"]
+    assert emails(client, risk_flag="Free Email Domain") == []
+
+def test_industry_matches_the_lead_or_its_company(client, leads):
+    assert emails(client, industry="Technology") == ["a@acme.com", "b@acme.com"]
+    assert emails(client, industry="Logistics") == ["c@globex.com"]
+
+def test_min_company_size(client, leads):
+    assert emails(client, min_company_size=50) == ["a@acme.com", "c@globex.com"]
+    assert client.get("/api/v1/", params={"min_company_size": -1}).status_code == 422
+
+@pytest.mark.parametrize("size, expected", [
+    ("10-50", 10),
+    ("1000+", 1000),
+    ("5k-10k", 5000),
+    ("1,000-5,000", 1000),
+    ("Unknown", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_company_size_min(size, expected):
+    assert parse_company_size_min(size) == expected
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+def test_pages_walk_every_lead_once_newest_first(client, add_lead):
+    same_moment = datetime(2024, 5, 1, 12, 0, 0)
+    ids = [add_lead(created_at=same_moment).id for _ in range(3)] + [add_lead().id for _ in range(2)]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/api/v1/", params={"limit": 2, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen += [lead["id"] for lead in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            assert "Link" not in response.headers
+            break
+        assert f"cursor={cursor}" in response.headers["Link"]
+
+    assert pages == 3
+    # Newest first; leads sharing a created_at come in descending id order
+    assert seen == [ids[4], ids[3], ids[2], ids[1], ids[0]]
+
+def test_invalid_cursor_is_a_bad_request(client):
+    response = client.get("/api/v1/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor."
+
+def test_filters_are_applied_before_paging(client, add_lead):
+    add_lead(score=95, category="Exceptional", queue="Hot")
+    add_lead(score=45, category="Moderate")
+    add_lead(score=62, category="Strong")
+
+    assert [lead["score"] for lead in client.get("/api/v1/", params={"min_score": 50}).json()] == [62, 95]
+    assert [lead["queue"] for lead in client.get("/api/v1/", params={"category": "Exceptional"}).json()] == ["Hot"]
+    assert client.get("/api/v1/", params={"min_score": 101}).status_code == 422
+
+def test_summary_view_leaves_out_the_heavy_columns(client, add_lead):
+    add_lead()
+
+    lead = client.get("/api/v1/", params={"view": "summary"}).json()[0]
+
+    assert lead["email"] == "sarah@acme.com"
+    assert lead["score"] == 80
+    assert "notes" not in lead
+    assert "score_breakdown" not in lead
@@ -0,0 +1,36 @@
+def search(client, **params) -> dict:
+    response = client.get("/api/v1/leads/search", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+def test_matches_are_ranked_by_field_and_highlighted(client, add_lead):
+    in_notes = add_lead(email="a@acme.com", notes="We need a warehouse robotics pilot this year.")
+    in_explanation = add_lead(email="b@acme.com", notes="Looking at options.", explanation="Mentions robotics in passing.")
+    add_lead(email="c@acme.com", notes="Payroll for 200 people.")
+
+    results = search(client, q="Robotics")["results"]
+
+    assert [hit["id"] for hit in results] == [in_notes.id, in_explanation.id]
+    assert results[0]["rank"] > results[1]["rank"]
+    assert "<mark>robotics</mark>" in results[0]["highlights"]["notes"]
+    assert list(results[1]["highlights"]) == ["explanation"]
+
+def test_every_term_must_match(client, add_lead):
+    add_lead(notes="Warehouse robotics pilot.")
+
+    assert search(client, q="robotics payroll")["results"] == []
+
+def test_offset_paging_and_filters(client, add_lead):
+    for category in ("Strong", "Strong", "Moderate"):
+        add_lead(notes="Budget approved for robotics.", category=category)
+
+    first = search(client, q="robotics", limit=2)
+    assert len(first["results"]) == 2
+    assert first["next_offset"] == 2
+    last = search(client, q="robotics", limit=2, offset=2)
+    assert len(last["results"]) == 1
+    assert last["next_offset"] is None
+    assert len(search(client, q="robotics", category="Moderate")["results"]) == 1
+
+def test_empty_query_is_rejected(client):
+    assert client.get("/api/v1/leads/search", params={"q": ""}).status_code == 422
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from sqlmodel import select
+from app.db.init_db import init_db
+from app.models.rollup import LeadDailyRollup
+from app.services.lead_stats import lead_stats_service
+
+def stats(client, live=False) -> dict:
+    response = client.get("/api/v1/stats", params={"live": live})
+    assert response.status_code == 200
+    return response.json()
+
+def by_name(chart: list) -> dict:
+    return {row["name"]: row["leads"] for row in chart if row["leads"]}
+
+def test_rollup_follows_inserts_updates_and_deletes(client, session, add_lead):
+    add_lead(score=95, category="Exceptional", queue="Hot")
+    moderate = add_lead(score=45, category="Moderate")
+    add_lead(score=30, category="Low Confidence", created_at=datetime.utcnow() - timedelta(days=3))
+
+    first = stats(client)
+    assert first == stats(client, live=True)
+    assert first["total_leads"] == 3
+    assert first["qualified_leads"] == 1
+    assert first["avg_score"] == round((95 + 45 + 30) / 3, 1)
+    assert first["new_leads_today"] == 2
+
+    moderate.score, moderate.category = 85, "High Confidence"
+    session.add(moderate)
+    session.commit()
+    assert by_name(stats(client)["leads_by_category"]) == {"Exceptional": 1, "High Confidence": 1, "Low Confidence": 1}
+
+    session.delete(moderate)
+    session.commit()
+    after_delete = stats(client)
+    assert after_delete == stats(client, live=True)
+    assert after_delete["total_leads"] == 2
+    assert by_name(after_delete["leads_by_queue"]) == {"Hot": 1, "Nurture": 1}
+
+def test_empty_table_reports_zeros(client):
+    empty = stats(client)
+
+    assert empty["total_leads"] == empty["avg_score"] == 0
+    assert len(empty["leads_by_category"]) == 5
+
+def test_rebuild_repairs_a_drifted_rollup(client, session, add_lead):
+    add_lead(score=60, category="Strong")
+    add_lead(score=20, category="Low Confidence")
+    for row in session.exec(select(LeadDailyRollup)).all():
+        row.lead_count += 10
+        session.add(row)
+    session.commit()
+    assert stats(client)["total_leads"] == 12
+
+    response = client.post("/api/v1/system/stats-rollup/rebuild")
+
+    assert response.status_code == 200
+    assert response.json()["rows"] == 4
+    assert stats(client) == stats(client, live=True)
+
+def test_startup_backfills_a_missing_rollup(client, session, add_lead):
+    add_lead()
+    session.exec(LeadDailyRollup.__table__.delete())
+    session.commit()
+    assert lead_stats_service.rollups_missing(session)
+
+    init_db()
+
+    assert not lead_stats_service.rollups_missing(session)
+    assert stats(client)["total_leads"] == 1
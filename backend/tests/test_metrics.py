@@ -0,0 +1,55 @@
+import re
+from app.utils.metrics import MetricsRegistry
+
+def sample(text: str, name: str, **labels) -> float:
+    """
+    Value of one exposed sample (0 if absent); labels not given may have any value.
+    """
+    total = 0.0
+    for line in text.splitlines():
+        match = re.match(r"^(\w+)(?:\{(.*)\})? (\S+)$", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2) or ""))
+        if all(found.get(key) == value for key, value in labels.items()):
+            total += float(match.group(3))
+    return total
+
+def test_counter_and_histogram_exposition():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs done.", ["queue"])
+    histogram = registry.histogram("latency_seconds", "Latency.", ["stage"], buckets=(0.1, 1))
+    counter.inc(queue='say "hi"')
+    counter.inc(2, queue='say "hi"')
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, stage="scoring")
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{queue="say \\"hi\\""} 3' in text
+    assert 'latency_seconds_bucket{stage="scoring",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{stage="scoring",le="1"} 2' in text
+    assert 'latency_seconds_bucket{stage="scoring",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{stage="scoring"} 3' in text
+    assert 'latency_seconds_sum{stage="scoring"} 5.55' in text
+
+def test_analysis_is_measured_per_stage_and_call(client, gemini, make_lead, no_backoff):
+    before = client.get("/metrics").text
+    gemini.fail = [429]
+
+    assert client.post("/api/v1/analyze", json=make_lead().model_dump()).status_code == 200
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = response.text
+    def delta(name, **labels):
+        return sample(after, name, **labels) - sample(before, name, **labels)
+
+    for stage in ("enrichment", "verification", "scoring", "routing", "db_commit"):
+        assert delta("lead_pipeline_stage_seconds_count", stage=stage) == 1
+    assert delta("lead_pipeline_seconds_count", outcome="analyzed") == 1
+    assert delta("gemini_request_seconds_count") == 3
+    assert delta("gemini_request_seconds_count", retries="1") == 1
+    assert delta("gemini_rate_limited_total") == 1
+    assert delta("gemini_tokens_total", kind="total") == 3 * 150
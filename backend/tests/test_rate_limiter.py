@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from app.utils.rate_limiter import FairSemaphore, GeminiRateLimiter, TokenBucket
+
+def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=60)
+    assert bucket.time_until(60) == 0
+
+    bucket.consume(60)
+
+    assert bucket.time_until(1) == pytest.approx(1.0, abs=0.05)
+    # More than the bucket holds only waits for a full bucket
+    assert bucket.time_until(1000) == pytest.approx(60.0, abs=0.1)
+
+def test_in_flight_calls_are_capped():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=1_000_000, max_in_flight=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.limit("gemini-2.5-flash", "scoring"):
+            peak = max(peak, limiter.get_stats()["in_flight"])
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+    assert limiter.get_stats()["acquired"] == 6
+    assert limiter.get_stats()["in_flight"] == 0
+
+def test_waiting_stages_are_served_round_robin():
+    slots = FairSemaphore(1)
+    order = []
+
+    async def worker(stage):
+        await slots.acquire(stage)
+        order.append(stage)
+        await asyncio.sleep(0)
+        slots.release()
+
+    async def main():
+        await slots.acquire("holder")
+        tasks = [asyncio.create_task(worker(stage)) for stage in ["enrichment"] * 3 + ["scoring"]]
+        await asyncio.sleep(0)
+        slots.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    # A burst of enrichment calls does not keep scoring waiting until it is over
+    assert order[:2] == ["enrichment", "scoring"]
+
+def test_rate_limited_answer_drains_the_model_budget():
+    limiter = GeminiRateLimiter(rpm=60, tpm=1_000_000, max_in_flight=4)
+
+    async def main():
+        async with limiter.limit("gemini-2.5-flash") as permit:
+            permit.rate_limited()
+
+    asyncio.run(main())
+
+    rpm, _ = limiter._get_buckets("gemini-2.5-flash")
+    assert rpm.time_until(1) > 0.9
+    assert limiter.get_stats()["rate_limited"] == 1
+    # Other models keep their own budget
+    other_rpm, _ = limiter._get_buckets("gemini-1.5-pro")
+    assert other_rpm.time_until(1) == 0
+
+def test_per_model_limits_override_the_defaults():
+    limiter = GeminiRateLimiter(rpm=60, tpm=1000, max_in_flight=4, model_limits={"gemini-1.5-pro": {"rpm": 5}})
+
+    rpm, tpm = limiter._get_buckets("gemini-1.5-pro")
+
+    assert (rpm.capacity, tpm.capacity) == (5, 1000)
+
+def test_disabled_limiter_does_not_count():
+    limiter = GeminiRateLimiter(rpm=1, tpm=1, max_in_flight=1, enabled=False)
+
+    async def main():
+        for _ in range(3):
+            async with limiter.limit("gemini-2.5-flash", estimated_tokens=100):
+                pass
+
+    asyncio.run(main())
+
+    assert limiter.get_stats()["acquired"] == 0
@@ -0,0 +1,98 @@
+import pytest
+from app.models.scoring import ScoringWeights
+from app.services.rescoring import lead_rescorer
+from app.services.lead_stats import lead_stats_service
+
+# All weight on intent: the default fake answer (intent 60) then scores 60, "Strong"
+INTENT_ONLY = dict(authenticity=0, authority=0, budget=0, clarity=0, footprint=0, intent=1)
+
+def create_profile(client, **values):
+    return client.post("/api/v1/scoring-profiles", json={"name": "intent", **INTENT_ONLY, **values})
+
+def test_saving_a_name_again_adds_a_version(client):
+    first, second = create_profile(client).json(), create_profile(client, risk_flag_penalty=5).json()
+
+    assert (first["version"], second["version"]) == (1, 2)
+    assert [profile["version"] for profile in client.get("/api/v1/scoring-profiles", params={"name": "intent"}).json()] == [2, 1]
+    assert client.get(f"/api/v1/scoring-profiles/{first['id']}").json()["risk_flag_penalty"] == 10
+
+def test_invalid_profiles_are_rejected(client):
+    assert create_profile(client, intent=0.5).status_code == 422
+    assert client.get("/api/v1/scoring-profiles/999").status_code == 404
+    assert client.put("/api/v1/settings", json={"scoring_profile_id": 999}).status_code == 422
+
+def test_active_profile_scores_new_leads(client, gemini, make_lead):
+    profile_id = create_profile(client).json()["id"]
+    assert client.put("/api/v1/settings", json={"scoring_profile_id": profile_id}).status_code == 200
+
+    analyzed = client.post("/api/v1/analyze", json=make_lead().model_dump()).json()
+
+    assert analyzed["lead_score"]["score"] == 60
+    assert analyzed["lead_score"]["category"] == "Strong"
+    # The prompt describes the weights that are actually applied
+    _, _, body = next(request for request in gemini.requests if request[0] == "scoring")
+    prompt = body["contents"][0]["parts"][0]["text"]
+    assert "Intent Signals (Weight: 100%)" in prompt
+    assert "Authenticity (Weight: 0%)" in prompt
+
+def test_preview_is_a_dry_run(client, add_lead):
+    ids = [add_lead().id for _ in range(3)]
+    add_lead(score=0, category="Unscored", score_breakdown=None)
+    profile_id = create_profile(client).json()["id"]
+
+    report = client.get(f"/api/v1/scoring-profiles/{profile_id}/rescore-preview").json()
+
+    assert (report["leads"], report["skipped"], report["changed"]) == (4, 1, 3)
+    assert report["category_shifts"] == {"High Confidence": {"Strong": 3}}
+    assert report["mean_score_delta"] == -20
+    assert {lead["score"] for lead in client.get("/api/v1/").json() if lead["id"] in ids} == {80}
+
+def test_builtin_weights_reproduce_the_pipeline_scores(client, gemini, make_lead):
+    for email in ("sarah@acme.com", "kyle@globex.com"):
+        client.post("/api/v1/analyze", json=make_lead(email=email).model_dump())
+
+    assert lead_rescorer.rescore(ScoringWeights())["changed"] == 0
+
+def test_apply_keeps_the_stats_rollup_and_concurrent_inserts(client, session, add_lead, monkeypatch):
+    for _ in range(3):
+        add_lead()
+    rescore_chunk = lead_rescorer._rescore_chunk
+    inserted = []
+
+    def insert_meanwhile(*args):
+        # Another process saves a lead while the first chunk is being re-scored
+        if not inserted:
+            inserted.append(add_lead(email="new@acme.com", score=95, category="Exceptional", queue="Hot"))
+        return rescore_chunk(*args)
+
+    monkeypatch.setattr(lead_rescorer, "_rescore_chunk", insert_meanwhile)
+    # Rebuilding would race with inserts from other processes
+    monkeypatch.setattr(lead_stats_service, "rebuild_rollups", None)
+    report = lead_rescorer.rescore(ScoringWeights(**INTENT_ONLY), apply=True, chunk_size=2)
+
+    # The new lead was scored under the old weights by its own process and is re-scored too
+    assert report["changed"] == 4
+    stats = lead_stats_service.get_stats(session)
+    assert stats == lead_stats_service.get_stats(session, live=True)
+    assert stats["total_leads"] == 4
+    assert {row["name"]: row["leads"] for row in stats["leads_by_category"] if row["leads"]} == {"Strong": 4}
+
+def test_failed_chunk_rolls_back_with_its_rollup_moves(session, add_lead, monkeypatch):
+    for _ in range(3):
+        add_lead()
+    move_leads = lead_stats_service.move_leads
+    calls = []
+
+    def fail_second_chunk(*args):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return move_leads(*args)
+
+    monkeypatch.setattr(lead_stats_service, "move_leads", fail_second_chunk)
+    with pytest.raises(RuntimeError):
+        lead_rescorer.rescore(ScoringWeights(**INTENT_ONLY), apply=True, chunk_size=2)
+
+    stats = lead_stats_service.get_stats(session)
+    assert stats == lead_stats_service.get_stats(session, live=True)
+    assert {row["name"]: row["leads"] for row in stats["leads_by_category"] if row["leads"]} == {"Strong": 2, "High Confidence": 1}
@@ -0,0 +1,56 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import update
+from app.models.settings import Settings
+from app.services.settings_cache import SettingsCache, settings_cache
+
+def test_put_writes_through_without_reloading(client):
+    settings_cache.get()
+    loads = settings_cache.loads
+
+    response = client.put("/api/v1/settings", json={"selected_model": "gemini-1.5-pro", "auto_routing_enabled": True, "enrichment_enabled": False})
+
+    assert response.status_code == 200
+    snapshot = settings_cache.get()
+    assert snapshot.selected_model == "gemini-1.5-pro"
+    assert snapshot.enrichment_enabled is False
+    assert snapshot.version == response.json()["version"]
+    assert settings_cache.loads == loads
+
+def test_other_process_change_is_seen_through_the_version(session):
+    cache = SettingsCache(ttl=0)
+    assert cache.get().selected_model == "gemini-2.5-flash"
+    assert cache.loads == 1
+
+    cache.get()
+    assert (cache.loads, cache.version_checks) == (1, 1)
+
+    session.add(Settings(id=1, selected_model="gemini-1.5-pro", version=1))
+    session.commit()
+
+    assert cache.get().selected_model == "gemini-1.5-pro"
+    assert cache.loads == 2
+
+def test_version_is_not_checked_within_the_ttl(session):
+    cache = SettingsCache(ttl=3600)
+    cache.get()
+    session.add(Settings(id=1, selected_model="gemini-1.5-pro", version=1))
+    session.commit()
+
+    assert cache.get().selected_model == "gemini-2.5-flash"
+    assert cache.version_checks == 0
+
+def test_snapshot_is_immutable():
+    with pytest.raises(ValidationError):
+        settings_cache.get().selected_model = "gemini-1.5-pro"
+
+def test_put_increments_the_stored_version(client, session):
+    client.get("/api/v1/settings")
+    # Another process updated the row in the meantime
+    session.exec(update(Settings).values(version=7))
+    session.commit()
+
+    response = client.put("/api/v1/settings", json={"selected_model": "gemini-1.5-pro", "auto_routing_enabled": True, "enrichment_enabled": True})
+
+    assert response.json()["version"] == 8
+    assert settings_cache.get().version == 8
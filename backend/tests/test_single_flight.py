@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from app.utils.gemini_client import gemini_client
+from app.utils.single_flight import SingleFlight
+
+def test_concurrent_identical_calls_run_once():
+    flight = SingleFlight()
+    runs = []
+
+    async def call():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return {"score": 80}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", call) for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert len(runs) == 1
+    assert results == [{"score": 80}] * 5
+    assert len({id(result) for result in results}) == 5
+    assert flight.get_stats() == {"calls": 5, "executed": 1, "collapsed": 4, "in_flight": 0}
+
+def test_failure_is_shared_and_not_cached():
+    flight = SingleFlight()
+    runs = []
+
+    async def call():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", call) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert len(runs) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("key", call))
+    assert len(runs) == 2
+
+def test_gemini_client_coalesces_identical_prompts(gemini):
+    gemini.latency = 0.05
+
+    async def main():
+        return await asyncio.gather(
+            gemini_client.generate_json_response_async("You are a data enrichment bot. Acme"),
+            gemini_client.generate_json_response_async("You are a data enrichment bot. Acme"),
+            gemini_client.generate_json_response_async("You are a data enrichment bot. Globex"),
+        )
+
+    first, second, other = asyncio.run(main())
+
+    assert first == second == other
+    assert gemini.calls() == 2
+
+def test_cancelled_leader_does_not_fail_the_followers():
+    flight = SingleFlight()
+    runs = []
+
+    async def call():
+        runs.append(1)
+        await asyncio.sleep(0.02)
+        return {"score": 80}
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0.005)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == {"score": 80}
+    assert len(runs) == 1
+    assert flight.get_stats()["in_flight"] == 0
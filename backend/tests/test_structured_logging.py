@@ -0,0 +1,59 @@
+import asyncio
+import json
+import logging
+from app.utils.structured_logging import (
+    SAMPLED,
+    ContextFilter,
+    JsonFormatter,
+    bind_correlation_id,
+    child_correlation_id,
+    correlation_id,
+)
+
+def record(message: str = "Scored %s", *args, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, message, args or ("sarah@acme.com",), None)
+    record.__dict__.update(extra)
+    return record
+
+def test_correlation_id_follows_tasks_and_threads():
+    seen = {}
+
+    async def lead(name: str):
+        with bind_correlation_id(f"req.{name}"):
+            await asyncio.sleep(0)
+            seen[name] = await asyncio.to_thread(correlation_id.get)
+
+    async def run():
+        await asyncio.gather(lead("a"), lead("b"))
+
+    asyncio.run(run())
+
+    assert seen == {"a": "req.a", "b": "req.b"}
+    assert correlation_id.get() is None
+
+def test_child_ids_extend_the_current_id():
+    with bind_correlation_id("req1"):
+        assert child_correlation_id(12) == "req1.12"
+
+def test_sampling_only_drops_sampled_messages():
+    drop_all = ContextFilter(sample_rate=0)
+
+    assert drop_all.filter(record(**SAMPLED)) is False
+    assert drop_all.filter(record()) is True
+    assert ContextFilter(sample_rate=1).filter(record(**SAMPLED)) is True
+
+def test_json_lines_carry_the_id_and_extra_fields():
+    entry = record(lead_id=7)
+    with bind_correlation_id("req1"):
+        ContextFilter(sample_rate=1).filter(entry)
+
+    line = json.loads(JsonFormatter().format(entry))
+
+    assert line["message"] == "Scored sarah@acme.com"
+    assert line["correlation_id"] == "req1"
+    assert line["lead_id"] == 7
+    assert line["level"] == "INFO"
+
+def test_request_id_is_echoed(client):
+    assert client.get("/", headers={"X-Request-ID": "abc123"}).headers["X-Request-ID"] == "abc123"
+    assert len(client.get("/").headers["X-Request-ID"]) == 16
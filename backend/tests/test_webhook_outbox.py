@@ -0,0 +1,113 @@
+import asyncio
+import httpx
+import pytest
+from datetime import datetime, timedelta
+from sqlmodel import select, update
+from app.models.webhook import WebhookOutboxEntry, WebhookStatus
+from app.services.webhook_outbox import WebhookDispatcher, webhook_outbox
+from app.utils.webhook_client import webhook_client
+
+HOOK = "https://hooks.example.com/leads"
+
+class Receiver:
+    def __init__(self):
+        self.status = 200
+        self.bodies = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(request.read())
+        return httpx.Response(self.status, text="ok" if self.status < 400 else "nope")
+
+@pytest.fixture
+def receiver(monkeypatch):
+    receiver = Receiver()
+    monkeypatch.setattr(webhook_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(receiver.handler)))
+    return receiver
+
+def entries(session) -> list:
+    session.expire_all()
+    return session.exec(select(WebhookOutboxEntry).order_by(WebhookOutboxEntry.id)).all()
+
+def webhook_outbox_entry(lead_id: int) -> WebhookOutboxEntry:
+    return WebhookOutboxEntry(target_url=HOOK, lead_id=lead_id, payload={"lead_id": lead_id})
+
+def test_analyzed_lead_is_queued_and_delivered(client, gemini, app_settings, make_lead, receiver, session):
+    app_settings(webhook_url=HOOK)
+    assert client.post("/api/v1/analyze", json=make_lead().model_dump()).status_code == 200
+    assert [entry.status for entry in entries(session)] == [WebhookStatus.PENDING.value]
+
+    assert asyncio.run(WebhookDispatcher().run_once()) == 1
+
+    assert len(receiver.bodies) == 1
+    [entry] = entries(session)
+    assert entry.status == WebhookStatus.DELIVERED.value
+    assert entry.attempts == 1
+
+def test_bulk_import_queues_one_webhook_per_saved_lead(client, gemini, app_settings, session):
+    app_settings(webhook_url=HOOK)
+    content = (
+        "first_name,last_name,email,company_name,notes\n"
+        "Sarah,Connor,sarah@acme.com,Acme,Budget 200k.\n"
+        "Kyle,Reese,kyle@globex.com,Globex,Payroll for 200 people.\n"
+    )
+
+    response = client.post("/api/v1/leads/import", params={"batch_size": 1}, files={"file": ("leads.csv", content.encode("utf-8"))})
+
+    assert response.status_code == 200
+    queued = entries(session)
+    assert len(queued) == 2
+    assert all(entry.lead_id for entry in queued)
+    assert {entry.payload["lead_input"]["email"] for entry in queued} == {"sarah@acme.com", "kyle@globex.com"}
+
+def test_server_error_is_retried_later(session, receiver, add_lead):
+    receiver.status = 503
+    session.add(webhook_outbox_entry(add_lead().id))
+    session.commit()
+
+    asyncio.run(WebhookDispatcher().run_once())
+
+    [entry] = entries(session)
+    assert entry.status == WebhookStatus.PENDING.value
+    assert entry.next_attempt_at > datetime.utcnow()
+    assert entry.last_error.startswith("HTTP 503")
+    assert asyncio.run(WebhookDispatcher().run_once()) == 0
+
+def test_client_error_is_dead_lettered_and_can_be_retried(client, session, receiver, add_lead):
+    receiver.status = 400
+    session.add(webhook_outbox_entry(add_lead().id))
+    session.commit()
+
+    asyncio.run(WebhookDispatcher().run_once())
+
+    [entry] = entries(session)
+    assert entry.status == WebhookStatus.DEAD.value
+    assert client.get("/api/v1/system/webhooks").json()["dead"] == 1
+    assert client.post(f"/api/v1/system/webhooks/{entry.id}/retry").status_code == 200
+    assert client.post(f"/api/v1/system/webhooks/{entry.id}/retry").status_code == 404
+    assert entries(session)[0].attempts == 0
+
+def test_entry_reclaimed_by_another_dispatcher_is_not_sent_twice(session, receiver, add_lead):
+    session.add(webhook_outbox_entry(add_lead().id))
+    session.commit()
+    [stale] = webhook_outbox.claim(10)
+    # Its lease runs out while it waits behind other deliveries, and another dispatcher takes over
+    session.exec(update(WebhookOutboxEntry).values(locked_until=datetime.utcnow() - timedelta(seconds=1)))
+    session.commit()
+    [fresh] = webhook_outbox.claim(10)
+
+    asyncio.run(WebhookDispatcher()._deliver(HOOK, [stale]))
+    assert receiver.bodies == []
+
+    asyncio.run(WebhookDispatcher()._deliver(HOOK, [fresh]))
+    assert len(receiver.bodies) == 1
+    assert entries(session)[0].status == WebhookStatus.DELIVERED.value
+
+def test_delivery_renews_the_lease(session, add_lead):
+    session.add(webhook_outbox_entry(add_lead().id))
+    session.commit()
+    claimed = webhook_outbox.claim(10)
+    session.exec(update(WebhookOutboxEntry).values(locked_until=datetime.utcnow() + timedelta(seconds=1)))
+    session.commit()
+
+    assert webhook_outbox.renew(claimed) == claimed
+    assert entries(session)[0].locked_until > datetime.utcnow() + timedelta(seconds=60)
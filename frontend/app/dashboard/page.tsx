@@ -37,11 +37,11 @@ export default function DashboardPage() {
       try {
         const [statsData, leadsData] = await Promise.all([
           api.getStats(),
-          api.getLeads(),
+          api.getLeadsPage({ limit: 5 }),
         ]);
         setStats(statsData);
-        // Sort by ID descending (newest first) and take top 5
-        setRecentLeads(leadsData.sort((a, b) => b.id - a.id).slice(0, 5));
+        // The API returns leads newest first, so the first page is the most recent five
+        setRecentLeads(leadsData.leads);
       } catch (error) {
         console.error("Failed to fetch dashboard data:", error);
       } finally {
@@ -21,10 +21,16 @@ import {
 import { Badge } from "@/components/ui/badge";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
-import { api, Lead } from "@/lib/api";
+import { api, Lead, LeadQuery } from "@/lib/api";
 
 const LEADS_PER_PAGE = 10;
 
+const SCORE_FILTERS: Record<string, LeadQuery> = {
+  low: { max_score: 59 },
+  medium: { min_score: 60, max_score: 79 },
+  high: { min_score: 80 },
+};
+
 import { LeadDetailsDialog } from "@/components/lead-details-dialog";
 import { Trash2 } from "lucide-react";
 
@@ -57,7 +63,8 @@ export default function LeadsPage() {
   useEffect(() => {
     const fetchLeads = async () => {
       try {
-        const data = await api.getLeads();
+        // The score filter runs on the server; every page is fetched so search covers all leads
+        const data = await api.getLeads(SCORE_FILTERS[scoreFilter] ?? {});
         setLeads(data);
       } catch (error) {
         console.error("Failed to fetch leads:", error);
@@ -66,7 +73,7 @@ export default function LeadsPage() {
       }
     };
     fetchLeads();
-  }, []);
+  }, [scoreFilter]);
 
   const filteredLeads = leads
     .filter(
@@ -80,14 +87,6 @@ export default function LeadsPage() {
       // Status isn't explicitly in DB model yet aside from Queue, mapping Queue -> Status approximately
       if (statusFilter === "all") return true;
       return true; // Placeholder until status is unified
-    })
-    .filter((lead) => {
-      if (scoreFilter === "all") return true;
-      const score = lead.score;
-      if (scoreFilter === "low") return score < 60;
-      if (scoreFilter === "medium") return score >= 60 && score < 80;
-      if (scoreFilter === "high") return score >= 80;
-      return true;
     });
 
   const totalPages = Math.ceil(filteredLeads.length / LEADS_PER_PAGE);
@@ -14,9 +14,11 @@ interface LeadPieChartProps {
 }
 
 const COLORS = {
-  Hot: "var(--chart-1)",
-  Warm: "var(--chart-2)",
-  Cold: "var(--chart-3)",
+  Exceptional: "var(--chart-1)",
+  "High Confidence": "var(--chart-2)",
+  Strong: "var(--chart-3)",
+  Moderate: "var(--chart-4)",
+  "Low Confidence": "var(--chart-5)",
   default: "var(--muted)",
 };
 
@@ -90,11 +90,43 @@ export interface DashboardStats {
   leads_by_category: { name: string; leads: number }[];
 }
 
+// Server-side filters accepted by GET /api/v1/
+export interface LeadQuery {
+  category?: string;
+  queue?: string;
+  min_score?: number;
+  max_score?: number;
+  limit?: number;
+}
+
+export interface LeadPage {
+  leads: Lead[];
+  // Cursor for the following page, null on the last one
+  nextCursor: string | null;
+}
+
 export const api = {
-  // Fetch all leads
-  getLeads: async (): Promise<Lead[]> => {
-    const response = await axios.get(`${API_BASE_URL}/`);
-    return response.data;
+  // Fetch one page of leads, newest first
+  getLeadsPage: async (query: LeadQuery = {}, cursor?: string): Promise<LeadPage> => {
+    const response = await axios.get(`${API_BASE_URL}/`, {
+      params: { ...query, cursor },
+    });
+    return {
+      leads: response.data,
+      nextCursor: response.headers["x-next-cursor"] ?? null,
+    };
+  },
+
+  // Fetch every lead matching the filters, following the pagination cursor
+  getLeads: async (query: LeadQuery = {}): Promise<Lead[]> => {
+    const leads: Lead[] = [];
+    let cursor: string | undefined;
+    do {
+      const page = await api.getLeadsPage(query, cursor);
+      leads.push(...page.leads);
+      cursor = page.nextCursor ?? undefined;
+    } while (cursor);
+    return leads;
   },
 
   // Get dashboard stats